@@ -6,16 +6,29 @@ from uuid import UUID
 
 from fastapi import Depends, Header, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session, raiseload, selectinload
 
+from app.core.config import settings
 from app.core.exceptions import AuthenticationError, AuthorizationError
 from app.core.security import decode_token
 from app.db.base import get_db
-from app.models.user import AppRole, User
+from app.models.user import User
 
 security = HTTPBearer()
 
 
+def current_user_query(db: Session, user_id: UUID) -> Query:
+    """
+    Query for the request's user with roles eager-loaded.
+    In debug, any other relationship access raises instead of lazy loading;
+    callers that need more should add their own loader options.
+    """
+    options = [selectinload(User.roles)]
+    if settings.DEBUG:
+        options.append(raiseload("*"))
+    return db.query(User).options(*options).filter(User.id == user_id)
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
@@ -28,7 +41,7 @@ async def get_current_user(
         raise AuthenticationError("Invalid access token")
     
     user_id = payload.get("sub")
-    user = db.query(User).filter(User.id == UUID(user_id)).first()
+    user = current_user_query(db, UUID(user_id)).first()
     
     if not user:
         raise AuthenticationError("User not found")
@@ -52,7 +65,7 @@ async def require_admin(
     user: User = Depends(get_current_verified_user)
 ) -> User:
     """Require admin role."""
-    if not user.has_role(AppRole.ADMIN):
+    if not user.is_admin:
         raise AuthorizationError("Admin access required")
     return user
 
@@ -3,7 +3,9 @@ API routes for advanced features.
 """
 from typing import Optional, List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user
@@ -24,7 +26,8 @@ from app.schemas.advanced import (
     WhiteLabelSettingsUpdate, WhiteLabelSettingsResponse, VerifyDomainRequest, VerifyDomainResponse,
     PredictionDashboardResponse,
     AISettingsUpdate, AISettingsResponse, AIGenerateResponseRequest, AIGenerateResponseResponse,
-    AITranslateRequest, AITranslateResponse
+    AITranslateRequest, AITranslateResponse,
+    CannedResponseListAdapter, CustomerProfileListAdapter, BlockchainAuditLogListAdapter
 )
 from app.services.advanced_service import advanced_service
 from app.services.ai_service import ai_service
@@ -34,6 +37,13 @@ from app.services.blockchain_service import blockchain_service
 
 router = APIRouter()
 
+
+def _list_response(adapter: TypeAdapter, rows) -> Response:
+    """Validate and serialize ORM rows in one pass with a prebuilt adapter."""
+    items = adapter.validate_python(rows, from_attributes=True)
+    return Response(content=adapter.dump_json(items), media_type="application/json")
+
+
 # ==========================================
 # CANNED RESPONSES
 # ==========================================
@@ -45,7 +55,8 @@ def get_canned_responses(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    return advanced_service.get_canned_responses(db, current_user.id, category, search)
+    rows = advanced_service.get_canned_responses(db, current_user.id, category, search)
+    return _list_response(CannedResponseListAdapter, rows)
 
 @router.post("/canned-responses", response_model=CannedResponseResponse)
 def create_canned_response(
@@ -55,6 +66,15 @@ def create_canned_response(
 ):
     return advanced_service.create_canned_response(db, current_user.id, data.model_dump())
 
+@router.post("/canned-responses/bulk", response_model=List[CannedResponseResponse])
+def create_canned_responses_bulk(
+    data: List[CannedResponseCreate],
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    rows = advanced_service.create_canned_responses_bulk(db, current_user.id, [d.model_dump() for d in data])
+    return _list_response(CannedResponseListAdapter, rows)
+
 @router.patch("/canned-responses/{response_id}", response_model=CannedResponseResponse)
 def update_canned_response(
     response_id: UUID,
@@ -100,6 +120,10 @@ def get_tags(db: Session = Depends(get_db), current_user: User = Depends(get_cur
 def create_tag(data: CustomerTagCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     return advanced_service.create_tag(db, current_user.id, data.model_dump())
 
+@router.post("/tags/bulk", response_model=List[CustomerTagResponse])
+def create_tags_bulk(data: List[CustomerTagCreate], db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    return advanced_service.create_tags_bulk(db, current_user.id, [d.model_dump() for d in data])
+
 @router.patch("/tags/{tag_id}", response_model=CustomerTagResponse)
 def update_tag(tag_id: UUID, data: CustomerTagUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     tag = advanced_service.update_tag(db, tag_id, current_user.id, data.model_dump(exclude_unset=True))
@@ -125,6 +149,10 @@ def get_segments(db: Session = Depends(get_db), current_user: User = Depends(get
 def create_segment(data: CustomerSegmentCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     return advanced_service.create_segment(db, current_user.id, data.model_dump())
 
+@router.post("/segments/bulk", response_model=List[CustomerSegmentResponse])
+def create_segments_bulk(data: List[CustomerSegmentCreate], db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    return advanced_service.create_segments_bulk(db, current_user.id, [d.model_dump() for d in data])
+
 @router.patch("/segments/{segment_id}", response_model=CustomerSegmentResponse)
 def update_segment(segment_id: UUID, data: CustomerSegmentUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     segment = advanced_service.update_segment(db, segment_id, current_user.id, data.model_dump(exclude_unset=True))
@@ -159,7 +187,8 @@ def get_customer_profiles(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    return advanced_service.get_customer_profiles(db, current_user.id, tag_id, segment_id, search, limit, offset)
+    rows = advanced_service.get_customer_profiles(db, current_user.id, tag_id, segment_id, search, limit, offset)
+    return _list_response(CustomerProfileListAdapter, rows)
 
 @router.get("/customers/{profile_id}", response_model=CustomerProfileResponse)
 def get_customer_profile(profile_id: UUID, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
@@ -201,11 +230,15 @@ async def generate_summary(data: GenerateSummaryRequest, db: Session = Depends(g
 
 @router.post("/ai/transcribe", response_model=VoiceTranscriptionResponse)
 async def transcribe_audio(data: TranscribeAudioRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return await ai_service.transcribe_audio(db, data.audio_url, data.conversation_id, data.message_id)
+    return await ai_service.transcribe_audio(
+        db, data.audio_url, data.conversation_id, data.message_id,
+        language=data.language, prompt=data.prompt
+    )
 
 @router.get("/ai/sentiment-dashboard", response_model=SentimentDashboardResponse)
-def get_sentiment_dashboard(days: int = 30, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return advanced_service.get_sentiment_dashboard(db, current_user.id, days)
+async def get_sentiment_dashboard(days: int = 30, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    dashboard = await advanced_service.get_sentiment_dashboard_cached(db, current_user.id, days)
+    return Response(content=dashboard, media_type="application/json")
 
 @router.get("/ai/settings", response_model=AISettingsResponse)
 def get_ai_settings(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
@@ -223,6 +256,12 @@ async def generate_ai_response(data: AIGenerateResponseRequest, db: Session = De
     context = []  # Would fetch from conversation
     return await ai_service.generate_response(db, current_user.id, context, data.context or "")
 
+@router.post("/ai/generate-response/stream")
+async def stream_ai_response(data: AIGenerateResponseRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    context = []  # Would fetch from conversation
+    chunks = await ai_service.generate_response_stream(db, current_user.id, context, data.context or "")
+    return StreamingResponse(chunks, media_type="text/plain; charset=utf-8")
+
 @router.post("/ai/translate", response_model=AITranslateResponse)
 async def translate_text(data: AITranslateRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     return await ai_service.translate_text(data.text, data.target_language, data.source_language)
@@ -301,7 +340,8 @@ def get_audit_logs(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    return blockchain_service.get_audit_logs(db, current_user.id, entity_type, entity_id, limit)
+    rows = blockchain_service.get_audit_logs(db, current_user.id, entity_type, entity_id, limit)
+    return _list_response(BlockchainAuditLogListAdapter, rows)
 
 @router.post("/audit-logs/verify", response_model=VerifyAuditLogResponse)
 async def verify_audit_log(data: VerifyAuditLogRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
@@ -313,7 +353,7 @@ async def verify_audit_log(data: VerifyAuditLogRequest, db: Session = Depends(ge
 
 @router.get("/white-label", response_model=WhiteLabelSettingsResponse)
 def get_white_label_settings(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    settings = advanced_service.get_white_label_settings(db, current_user.id)
+    settings = advanced_service.get_white_label_settings_cached(db, current_user.id)
     if not settings:
         raise HTTPException(status_code=404, detail="White label settings not found")
     return settings
@@ -332,4 +372,5 @@ def verify_domain(data: VerifyDomainRequest, db: Session = Depends(get_db), curr
 
 @router.get("/predictions", response_model=PredictionDashboardResponse)
 def get_prediction_dashboard(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return advanced_service.get_prediction_dashboard(db, current_user.id)
+    dashboard = advanced_service.get_prediction_dashboard(db, current_user.id)
+    return Response(content=dashboard, media_type="application/json")
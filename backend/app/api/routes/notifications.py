@@ -1,59 +1,56 @@
 """
 Notification and webhook API routes.
 """
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Union
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user, get_db
 from app.models.user import User
 from app.schemas.notification import (
-    EmailPreferencesUpdate, EmailPreferencesResponse,
+    EmailPreferencesUpdate, EmailPreferencesResponse, EmailPreferencesLegacyView,
+    expand_email_preferences,
     WebhookCreate, WebhookUpdate, WebhookResponse,
     WebhookDeliveryResponse, WebhookTestRequest, WebhookTestResponse,
-    AVAILABLE_WEBHOOK_EVENTS
+    AVAILABLE_WEBHOOK_EVENTS_JSON
 )
 from app.services.notification_service import notification_service
 import json
+import orjson
 
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
 
 # Email Preferences
-@router.get("/email-preferences", response_model=EmailPreferencesResponse)
-async def get_email_preferences(
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """Get current user's email notification preferences."""
-    prefs = notification_service.get_email_preferences(db, user.id)
+def _email_preferences_response(prefs) -> EmailPreferencesResponse:
     return EmailPreferencesResponse(
         id=str(prefs.id),
         user_id=str(prefs.user_id),
-        security_alerts=prefs.security_alerts,
-        new_login_alerts=prefs.new_login_alerts,
-        password_changes=prefs.password_changes,
-        payment_receipts=prefs.payment_receipts,
-        payment_failures=prefs.payment_failures,
-        subscription_changes=prefs.subscription_changes,
-        usage_alerts=prefs.usage_alerts,
-        team_invites=prefs.team_invites,
-        team_member_joined=prefs.team_member_joined,
-        role_changes=prefs.role_changes,
-        new_messages=prefs.new_messages,
-        message_digest=prefs.message_digest,
+        flags=prefs.flags,
         digest_frequency=prefs.digest_frequency,
-        integration_errors=prefs.integration_errors,
-        integration_connected=prefs.integration_connected,
-        product_updates=prefs.product_updates,
-        tips_and_tutorials=prefs.tips_and_tutorials,
-        promotional_emails=prefs.promotional_emails,
         created_at=prefs.created_at,
         updated_at=prefs.updated_at
     )
 
 
+@router.get("/email-preferences", response_model=None)
+async def get_email_preferences(
+    verbose: bool = False,
+    user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> Union[EmailPreferencesResponse, EmailPreferencesLegacyView]:
+    """
+    Get current user's email notification preferences.
+    Toggles are returned as an EmailPref bitmask; pass verbose=true for named booleans.
+    """
+    prefs = notification_service.get_email_preferences(db, user.id)
+    response = _email_preferences_response(prefs)
+    if verbose:
+        return expand_email_preferences(response)
+    return response
+
+
 @router.put("/email-preferences", response_model=EmailPreferencesResponse)
 async def update_email_preferences(
     request: EmailPreferencesUpdate,
@@ -64,37 +61,14 @@ async def update_email_preferences(
     prefs = notification_service.update_email_preferences(
         db, user.id, request.model_dump(exclude_unset=True)
     )
-    return EmailPreferencesResponse(
-        id=str(prefs.id),
-        user_id=str(prefs.user_id),
-        security_alerts=prefs.security_alerts,
-        new_login_alerts=prefs.new_login_alerts,
-        password_changes=prefs.password_changes,
-        payment_receipts=prefs.payment_receipts,
-        payment_failures=prefs.payment_failures,
-        subscription_changes=prefs.subscription_changes,
-        usage_alerts=prefs.usage_alerts,
-        team_invites=prefs.team_invites,
-        team_member_joined=prefs.team_member_joined,
-        role_changes=prefs.role_changes,
-        new_messages=prefs.new_messages,
-        message_digest=prefs.message_digest,
-        digest_frequency=prefs.digest_frequency,
-        integration_errors=prefs.integration_errors,
-        integration_connected=prefs.integration_connected,
-        product_updates=prefs.product_updates,
-        tips_and_tutorials=prefs.tips_and_tutorials,
-        promotional_emails=prefs.promotional_emails,
-        created_at=prefs.created_at,
-        updated_at=prefs.updated_at
-    )
+    return _email_preferences_response(prefs)
 
 
 # Webhooks
 @router.get("/webhooks/events")
 async def get_webhook_events():
     """Get list of available webhook events."""
-    return AVAILABLE_WEBHOOK_EVENTS
+    return Response(content=AVAILABLE_WEBHOOK_EVENTS_JSON, media_type="application/json")
 
 
 @router.get("/webhooks", response_model=List[WebhookResponse])
@@ -253,21 +227,9 @@ async def get_webhook_deliveries(
     if not webhook:
         raise HTTPException(status_code=404, detail="Webhook not found")
     
-    deliveries = notification_service.get_webhook_deliveries(db, webhook_id)
-    return [
-        WebhookDeliveryResponse(
-            id=str(d.id),
-            webhook_id=str(d.webhook_id),
-            event_type=d.event_type,
-            status_code=d.status_code,
-            duration_ms=d.duration_ms,
-            attempt_number=d.attempt_number,
-            success=d.success,
-            error_message=d.error_message,
-            delivered_at=d.delivered_at
-        )
-        for d in deliveries
-    ]
+    # Rows already have the response shape; response_model is for the docs only
+    rows = notification_service.get_webhook_delivery_log(db, webhook_id)
+    return Response(content=orjson.dumps(rows), media_type="application/json")
 
 
 @router.post("/webhooks/{webhook_id}/test", response_model=WebhookTestResponse)
@@ -0,0 +1,40 @@
+"""
+In-process caches for small, rarely changing per-user rows.
+"""
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+# Sentinel for "not cached", so a cached None (row doesn't exist) is a hit
+MISSING = object()
+
+
+class TTLCache:
+    """Small thread-safe TTL map; evicts the oldest entry when full."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return default
+            return entry[1]
+    
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+    
+    def pop(self, key: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
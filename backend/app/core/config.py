@@ -24,6 +24,9 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
+    DB_POOL_RECYCLE_SECONDS: int = 1800
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -79,6 +82,10 @@ class Settings(BaseSettings):
     
     # OpenAI (GPT-4 & Whisper)
     OPENAI_API_KEY: str = ""
+    # Classification-style tasks run on the small tier; summaries stay on GPT-4.
+    # These calls request JSON mode, so the model must support response_format.
+    SENTIMENT_MODEL: str = "gpt-4o-mini"
+    TRANSLATION_MODEL: str = "gpt-4o-mini"
     
     # Twilio (Voice/Video)
     TWILIO_ACCOUNT_SID: str = ""
@@ -1,6 +1,12 @@
 """
 Database base classes and session management.
 """
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -11,8 +17,13 @@ from app.core.config import settings
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_use_lifo=True,  # keep the hot set of connections warm
+    # JSON/JSONB columns (AI payloads, word timings, metadata) via orjson
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads
 )
 
 # Create session factory
@@ -22,6 +33,23 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 v7) for append-heavy primary keys."""
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                               # version
+    value |= ((rand >> 62) & 0xFFF) << 64            # rand_a
+    value |= 0b10 << 62                              # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF            # rand_b
+    return uuid.UUID(int=value)
+
+
+def utcnow() -> datetime:
+    """Naive UTC now, matching the DateTime columns; avoids deprecated utcnow()."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def get_db():
     """Dependency for getting database sessions."""
     db = SessionLocal()
@@ -3,7 +3,7 @@ Redis connection and utilities.
 """
 import json
 from datetime import timedelta
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import redis.asyncio as redis
 
@@ -15,6 +15,15 @@ redis_pool = redis.ConnectionPool.from_url(
     decode_responses=True
 )
 
+# INCR and start the window TTL on the first hit in one atomic round trip
+_INCR_WINDOW_LUA = """
+local n = redis.call('INCR', KEYS[1])
+if n == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return n
+"""
+
 
 async def get_redis() -> redis.Redis:
     """Get Redis connection."""
@@ -26,10 +35,12 @@ class RedisService:
     
     def __init__(self):
         self.redis: Optional[redis.Redis] = None
+        self._incr_window = None
     
     async def connect(self):
         """Connect to Redis."""
         self.redis = redis.Redis(connection_pool=redis_pool)
+        self._incr_window = self.redis.register_script(_INCR_WINDOW_LUA)
     
     async def disconnect(self):
         """Disconnect from Redis."""
@@ -50,6 +61,16 @@ class RedisService:
             return await self.redis.setex(key, expire, value)
         return await self.redis.set(key, value)
     
+    async def replace(self, key: str, value: Any) -> bool:
+        """Overwrite an existing key, keeping its remaining TTL."""
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value)
+        return bool(await self.redis.set(key, value, xx=True, keepttl=True))
+    
+    async def claim(self, key: str, expire: timedelta) -> bool:
+        """Set key only if it is absent; True if this caller got it."""
+        return bool(await self.redis.set(key, "1", ex=expire, nx=True))
+    
     async def get(self, key: str) -> Optional[str]:
         """Get a value by key."""
         return await self.redis.get(key)
@@ -77,6 +98,28 @@ class RedisService:
         """Set expiration on a key."""
         return await self.redis.expire(key, seconds)
     
+    async def hget(self, key: str, field: str) -> Optional[str]:
+        """Get a hash field."""
+        return await self.redis.hget(key, field)
+    
+    async def hset(
+        self,
+        key: str,
+        field: str,
+        value: str,
+        expire: Optional[timedelta] = None
+    ) -> None:
+        """Set a hash field, optionally expiring the whole hash, in one MULTI."""
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(key, field, value)
+        if expire:
+            pipe.expire(key, expire)
+        await pipe.execute()
+    
+    async def incr_window(self, key: str, window_seconds: int) -> int:
+        """Increment a counter, starting its expiry window on first use."""
+        return await self._incr_window(keys=[key], args=[window_seconds])
+    
     # Rate limiting helpers
     async def check_rate_limit(
         self,
@@ -88,11 +131,7 @@ class RedisService:
         Check if rate limit is exceeded.
         Returns (is_allowed, current_count).
         """
-        current = await self.incr(key)
-        
-        if current == 1:
-            await self.expire(key, window_seconds)
-        
+        current = await self.incr_window(key, window_seconds)
         return current <= limit, current
     
     # Session management
@@ -138,16 +177,9 @@ class RedisService:
         key = f"verification:{token}"
         return await self.get_json(key)
     
-    async def mark_verification_used(self, token: str) -> bool:
-        """Mark verification token as used."""
-        key = f"verification:{token}"
-        data = await self.get_json(key)
-        if data:
-            data["used"] = True
-            ttl = await self.redis.ttl(key)
-            if ttl > 0:
-                return await self.set(key, data, timedelta(seconds=ttl))
-        return False
+    async def mark_verification_used(self, token: str, data: dict) -> bool:
+        """Mark an already fetched verification token as used."""
+        return await self.replace(f"verification:{token}", {**data, "used": True})
     
     # Failed login tracking
     async def record_failed_login(
@@ -161,11 +193,7 @@ class RedisService:
         Returns (attempt_count, is_locked).
         """
         key = f"failed_login:{identifier}"
-        count = await self.incr(key)
-        
-        if count == 1:
-            await self.expire(key, lockout_minutes * 60)
-        
+        count = await self.incr_window(key, lockout_minutes * 60)
         is_locked = count >= max_attempts
         return count, is_locked
     
@@ -181,6 +209,42 @@ class RedisService:
         if count:
             return int(count) >= max_attempts
         return False
+    
+    # Recently seen members (sorted sets scored by last-seen epoch seconds)
+    async def check_recent(
+        self,
+        checks: List[Tuple[str, str]],
+        since: float
+    ) -> List[Optional[bool]]:
+        """
+        Check (key, member) pairs in one round trip: True if the member was
+        last seen at or after `since`. None for a pair whose set does not exist.
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        for key, member in checks:
+            pipe.exists(key)
+            pipe.zscore(key, member)
+        results = await pipe.execute()
+        return [
+            (score is not None and score >= since) if exists else None
+            for exists, score in zip(results[::2], results[1::2])
+        ]
+    
+    async def mark_seen(
+        self,
+        members: Dict[str, Dict[str, float]],
+        since: float,
+        expire_seconds: int
+    ) -> None:
+        """Record last-seen times (never moving one back) and prune older members."""
+        pipe = self.redis.pipeline(transaction=False)
+        for key, seen in members.items():
+            seen = {member: at for member, at in seen.items() if member}
+            if seen:
+                pipe.zadd(key, seen, gt=True)
+                pipe.zremrangebyscore(key, "-inf", f"({since}")
+                pipe.expire(key, expire_seconds)
+        await pipe.execute()
 
 
 redis_service = RedisService()
@@ -2,8 +2,12 @@
 Main FastAPI application.
 """
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+import anyio
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.docs import get_swagger_ui_html
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.db.redis import redis_service
@@ -12,16 +16,31 @@ from app.api.routes import notifications
 from app.api.routes import billing
 from app.api.routes import webhooks
 from app.middleware.rate_limiter import RateLimitMiddleware
+from app.services.ai_service import ai_service
+from app.services.security_event_service import security_event_buffer
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await redis_service.connect()
+    await security_event_buffer.start()
+    # Sync routes run in anyio's threadpool (40 threads by default); let every
+    # pooled DB connection be in use at once rather than queueing on threads
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    )
+    # All routers are mounted by now; render the schema once for the process
+    app.state.openapi_bytes = orjson.dumps(app.openapi())
     yield
+    await security_event_buffer.stop()
+    await ai_service.close()
     await redis_service.disconnect()
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
+    default_response_class=ORJSONResponse,
+    # Served below from bytes rendered at startup
+    openapi_url=None,
     lifespan=lifespan
 )
 
@@ -42,6 +61,14 @@ app.include_router(notifications.router, prefix=settings.API_V1_PREFIX)
 app.include_router(billing.router, prefix=settings.API_V1_PREFIX)
 app.include_router(webhooks.router, prefix=settings.API_V1_PREFIX)
 
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_schema():
+    return Response(content=app.state.openapi_bytes, media_type="application/json")
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui():
+    return get_swagger_ui_html(openapi_url="/openapi.json", title=f"{settings.APP_NAME} - Docs")
+
 @app.get("/health")
 async def health():
     return {"status": "healthy", "version": settings.APP_VERSION}
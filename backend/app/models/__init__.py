@@ -2,7 +2,7 @@
 from app.models.user import User, UserRole, OAuthAccount, SecurityEvent
 from app.models.integration import Integration, IntegrationType
 from app.models.conversation import Conversation, Message
-from app.models.order import Order, OrderStatus
+from app.models.order import Order, OrderExtra, OrderStatus
 
 __all__ = [
     "User",
@@ -14,5 +14,6 @@ __all__ = [
     "Conversation",
     "Message",
     "Order",
+    "OrderExtra",
     "OrderStatus",
 ]
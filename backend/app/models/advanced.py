@@ -5,7 +5,7 @@ Includes: Canned responses, Tags, Segments, AI features, CRM, Voice/Video, Block
 import uuid
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from sqlalchemy import Column, String, Text, Boolean, Integer, ForeignKey, DateTime, Numeric, ARRAY
+from sqlalchemy import Column, String, Text, Boolean, Integer, ForeignKey, DateTime, Date, Numeric, ARRAY, Index, Computed, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB, INET
 from sqlalchemy.orm import relationship
 
@@ -32,6 +32,35 @@ class CannedResponse(Base):
     
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        # Active responses, most used first
+        Index(
+            "ix_canned_responses_user_usage",
+            user_id,
+            usage_count.desc(),
+            postgresql_where=text("is_active")
+        ),
+        # Trigram indexes so the ILIKE '%term%' search can use an index
+        Index(
+            "ix_canned_responses_title_trgm",
+            title,
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_canned_responses_content_trgm",
+            content,
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_canned_responses_shortcut_trgm",
+            shortcut,
+            postgresql_using="gin",
+            postgresql_ops={"shortcut": "gin_trgm_ops"}
+        ),
+    )
 
 
 class CustomerTag(Base):
@@ -98,6 +127,27 @@ class CustomerProfile(Base):
     
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        # Profile list, most recently seen first
+        Index("ix_customer_profiles_user_last_seen", user_id, last_seen.desc()),
+        # Array containment filters (tags.contains / segments.contains)
+        Index("idx_customer_profiles_tags", tags, postgresql_using="gin"),
+        Index("ix_customer_profiles_segments_gin", segments, postgresql_using="gin"),
+        # Trigram indexes for the name/email ILIKE search
+        Index(
+            "ix_customer_profiles_name_trgm",
+            name,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_customer_profiles_email_trgm",
+            email,
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"}
+        ),
+    )
 
 
 class AISummary(Base):
@@ -138,7 +188,7 @@ class VoiceTranscription(Base):
     transcription = Column(Text, nullable=False)
     confidence = Column(Numeric(3, 2))
     language = Column(String(10))
-    word_timings = Column(JSONB)
+    word_timings = Column(JSONB)  # {"word": [...], "start": [...], "end": [...]}
     
     model_used = Column(String(100))
     processing_time_ms = Column(Integer)
@@ -165,6 +215,18 @@ class SentimentAnalysis(Base):
     
     model_used = Column(String(100))
     analyzed_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    # UTC calendar day, stored so the daily trend groups without a per-row cast
+    analyzed_date = Column(Date, Computed("(analyzed_at AT TIME ZONE 'UTC')::date", persisted=True))
+    
+    __table_args__ = (
+        # Dashboard window scan; INCLUDE makes the grouped query index-only
+        Index(
+            "ix_sentiment_analysis_user_analyzed",
+            user_id,
+            analyzed_at,
+            postgresql_include=["analyzed_date", "sentiment", "score"]
+        ),
+    )
 
 
 class CRMIntegration(Base):
@@ -381,6 +443,16 @@ class PredictiveAnalytics(Base):
     model_version = Column(String(50))
     
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    
+    __table_args__ = (
+        # Top-N per prediction type on the dashboard
+        Index(
+            "ix_predictive_analytics_user_type_value",
+            user_id,
+            prediction_type,
+            prediction_value.desc()
+        ),
+    )
 
 
 class AISettings(Base):
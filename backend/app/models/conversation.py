@@ -11,6 +11,7 @@ from sqlalchemy import (
     Enum,
     ForeignKey,
     Integer,
+    SmallInteger,
     String,
     Text,
 )
@@ -62,7 +63,7 @@ class Conversation(Base):
     
     # AI handling
     is_ai_handled = Column(Boolean, default=True, nullable=False)
-    ai_confidence = Column(Integer, nullable=True)  # 0-100
+    ai_confidence = Column(SmallInteger, nullable=True)  # 0-100
     requires_human = Column(Boolean, default=False, nullable=False)
     
     # Timestamps
@@ -143,7 +144,7 @@ class Message(Base):
     # AI processing
     is_ai_generated = Column(Boolean, default=False, nullable=False)
     ai_intent = Column(String(100), nullable=True)
-    ai_confidence = Column(Integer, nullable=True)
+    ai_confidence = Column(SmallInteger, nullable=True)  # 0-100
     ai_metadata = Column(Text, nullable=True)  # JSON
     
     # Timestamps
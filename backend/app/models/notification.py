@@ -7,6 +7,7 @@ from typing import Optional
 import uuid
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -40,6 +41,42 @@ class NotificationCategory(str, enum.Enum):
     MARKETING = "marketing"
 
 
+class EmailPref(enum.IntFlag):
+    """Email notification toggles, stored together as a bitmask."""
+    # Security
+    SECURITY_ALERTS = 1 << 0
+    NEW_LOGIN_ALERTS = 1 << 1
+    PASSWORD_CHANGES = 1 << 2
+    # Billing
+    PAYMENT_RECEIPTS = 1 << 3
+    PAYMENT_FAILURES = 1 << 4
+    SUBSCRIPTION_CHANGES = 1 << 5
+    USAGE_ALERTS = 1 << 6
+    # Team
+    TEAM_INVITES = 1 << 7
+    TEAM_MEMBER_JOINED = 1 << 8
+    ROLE_CHANGES = 1 << 9
+    # Messages
+    NEW_MESSAGES = 1 << 10
+    MESSAGE_DIGEST = 1 << 11
+    # Integrations
+    INTEGRATION_ERRORS = 1 << 12
+    INTEGRATION_CONNECTED = 1 << 13
+    # Marketing
+    PRODUCT_UPDATES = 1 << 14
+    TIPS_AND_TUTORIALS = 1 << 15
+    PROMOTIONAL_EMAILS = 1 << 16
+
+
+# Everything on except the digest and the opt-in marketing mails
+DEFAULT_EMAIL_PREFS = sum(EmailPref) & ~int(
+    EmailPref.MESSAGE_DIGEST | EmailPref.TIPS_AND_TUTORIALS | EmailPref.PROMOTIONAL_EMAILS
+)
+
+# Named toggle -> bit, for clients that still send/read individual booleans
+EMAIL_PREF_FIELDS = {pref.name.lower(): pref for pref in EmailPref}
+
+
 class EmailNotificationPreference(Base):
     """User email notification preferences."""
     __tablename__ = "email_notification_preferences"
@@ -52,39 +89,17 @@ class EmailNotificationPreference(Base):
         unique=True
     )
     
-    # Security notifications
-    security_alerts = Column(Boolean, default=True, nullable=False)
-    new_login_alerts = Column(Boolean, default=True, nullable=False)
-    password_changes = Column(Boolean, default=True, nullable=False)
-    
-    # Billing notifications
-    payment_receipts = Column(Boolean, default=True, nullable=False)
-    payment_failures = Column(Boolean, default=True, nullable=False)
-    subscription_changes = Column(Boolean, default=True, nullable=False)
-    usage_alerts = Column(Boolean, default=True, nullable=False)
-    
-    # Team notifications
-    team_invites = Column(Boolean, default=True, nullable=False)
-    team_member_joined = Column(Boolean, default=True, nullable=False)
-    role_changes = Column(Boolean, default=True, nullable=False)
-    
-    # Message notifications
-    new_messages = Column(Boolean, default=True, nullable=False)
-    message_digest = Column(Boolean, default=False, nullable=False)
+    # On/off toggles, one bit per EmailPref
+    flags = Column(BigInteger, default=DEFAULT_EMAIL_PREFS, nullable=False)
     digest_frequency = Column(String(20), default="daily", nullable=False)  # daily, weekly
     
-    # Integration notifications
-    integration_errors = Column(Boolean, default=True, nullable=False)
-    integration_connected = Column(Boolean, default=True, nullable=False)
-    
-    # Marketing
-    product_updates = Column(Boolean, default=True, nullable=False)
-    tips_and_tutorials = Column(Boolean, default=False, nullable=False)
-    promotional_emails = Column(Boolean, default=False, nullable=False)
-    
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def has_pref(self, pref: "EmailPref") -> bool:
+        """Check whether a notification toggle is enabled."""
+        return bool(self.flags & pref)
 
 
 class WebhookStatus(str, enum.Enum):
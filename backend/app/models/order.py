@@ -4,18 +4,22 @@ Order models for extracted orders from conversations.
 import enum
 from datetime import datetime
 from decimal import Decimal
+from typing import Dict, Optional
 
 from sqlalchemy import (
     Column,
+    Computed,
     DateTime,
     Enum,
     ForeignKey,
-    Integer,
+    Index,
     Numeric,
+    SmallInteger,
     String,
     Text,
 )
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 import uuid
 
@@ -41,6 +45,18 @@ class OrderSource(str, enum.Enum):
     IMPORTED = "imported"
 
 
+# Statuses that count as realised revenue
+REVENUE_STATUSES = (
+    OrderStatus.CONFIRMED,
+    OrderStatus.PROCESSING,
+    OrderStatus.SHIPPED,
+    OrderStatus.DELIVERED,
+)
+
+# Suffixes of the shipping_* columns, exposed together as Order.shipping
+SHIPPING_ADDRESS_PARTS = ("address", "city", "state", "zip", "country")
+
+
 class Order(Base):
     """Orders extracted from conversations or created manually."""
     __tablename__ = "orders"
@@ -73,7 +89,12 @@ class Order(Base):
     shipping_country = Column(String(100), nullable=True)
     
     # Order details
-    status = Column(Enum(OrderStatus), default=OrderStatus.PENDING, nullable=False)
+    # Stored as the lowercase values (see migrations/001 and 005), not member names
+    status = Column(
+        Enum(OrderStatus, values_callable=lambda e: [m.value for m in e]),
+        default=OrderStatus.PENDING,
+        nullable=False
+    )
     source = Column(Enum(OrderSource), default=OrderSource.AI_EXTRACTED, nullable=False)
     
     # Financials
@@ -81,21 +102,20 @@ class Order(Base):
     tax = Column(Numeric(10, 2), nullable=True)
     shipping_cost = Column(Numeric(10, 2), nullable=True)
     discount = Column(Numeric(10, 2), nullable=True)
-    total = Column(Numeric(10, 2), nullable=False)
+    total = Column(
+        Numeric(10, 2),
+        Computed(
+            "COALESCE(subtotal, 0) + COALESCE(tax, 0) "
+            "+ COALESCE(shipping_cost, 0) - COALESCE(discount, 0)",
+            persisted=True
+        ),
+        nullable=False
+    )  # Generated by PostgreSQL - never assign
     currency = Column(String(3), default="USD", nullable=False)
     
-    # Line items (JSON stored as text)
-    items = Column(Text, nullable=True)  # JSON array of items
-    
-    # Notes and metadata
-    notes = Column(Text, nullable=True)
-    internal_notes = Column(Text, nullable=True)
-    metadata = Column(Text, nullable=True)  # JSON
-    
-    # AI extraction data
+    # AI extraction data (raw payload lives in OrderExtra)
     ai_extracted_at = Column(DateTime, nullable=True)
-    ai_confidence = Column(Integer, nullable=True)
-    ai_raw_data = Column(Text, nullable=True)
+    ai_confidence = Column(SmallInteger, nullable=True)  # 0-100
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -109,6 +129,55 @@ class Order(Base):
     user = relationship("User", back_populates="orders")
     conversation = relationship("Conversation", back_populates="orders")
     
+    # Cold columns - must be loaded explicitly (selectinload/joinedload),
+    # so list queries never drag the narrative blobs into memory.
+    extra = relationship(
+        "OrderExtra",
+        back_populates="order",
+        uselist=False,
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+    
+    items = association_proxy("extra", "items", creator=lambda v: OrderExtra(items=v))
+    notes = association_proxy("extra", "notes", creator=lambda v: OrderExtra(notes=v))
+    internal_notes = association_proxy(
+        "extra", "internal_notes", creator=lambda v: OrderExtra(internal_notes=v)
+    )
+    ai_raw_data = association_proxy(
+        "extra", "ai_raw_data", creator=lambda v: OrderExtra(ai_raw_data=v)
+    )
+    
+    __table_args__ = (
+        # Revenue rollups only sum realised orders; total is stored, so
+        # this can serve them as an index-only scan.
+        Index(
+            "idx_orders_user_revenue",
+            "user_id",
+            "total",
+            postgresql_where=status.in_(REVENUE_STATUSES)
+        ),
+    )
+    
+    @property
+    def shipping(self) -> Optional[Dict[str, Optional[str]]]:
+        """Shipping columns as one mapping, or None if none are set."""
+        values = {
+            part: getattr(self, f"shipping_{part}") for part in SHIPPING_ADDRESS_PARTS
+        }
+        if all(value is None for value in values.values()):
+            return None
+        return values
+    
+    @shipping.setter
+    def shipping(self, value: Optional[Dict[str, Optional[str]]]) -> None:
+        # None clears the address; a mapping only touches the keys it carries
+        if value is None:
+            value = dict.fromkeys(SHIPPING_ADDRESS_PARTS)
+        for part, part_value in value.items():
+            setattr(self, f"shipping_{part}", part_value)
+    
     @staticmethod
     def generate_order_number() -> str:
         """Generate a unique order number."""
@@ -117,3 +186,31 @@ class Order(Base):
         prefix = datetime.utcnow().strftime("%Y%m%d")
         suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
         return f"GW-{prefix}-{suffix}"
+
+
+class OrderExtra(Base):
+    """
+    Rarely-read order columns, split 1-1 from orders.
+    Keeps the orders heap row narrow for dashboard/list scans.
+    """
+    __tablename__ = "orders_extra"
+    
+    order_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("orders.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    
+    # Line items (JSON stored as text)
+    items = Column(Text, nullable=True)  # JSON array of items
+    
+    # Notes and metadata
+    notes = Column(Text, nullable=True)
+    internal_notes = Column(Text, nullable=True)
+    extra_metadata = Column(Text, nullable=True)  # JSON
+    
+    # Raw AI extraction payload
+    ai_raw_data = Column(Text, nullable=True)
+    
+    # Relationship
+    order = relationship("Order", back_populates="extra")
@@ -12,10 +12,12 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -107,8 +109,7 @@ class Subscription(Base):
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        unique=True
+        nullable=False
     )
     plan_id = Column(
         UUID(as_uuid=True),
@@ -140,6 +141,17 @@ class Subscription(Base):
     
     # Relationships
     plan = relationship("Plan")
+    
+    __table_args__ = (
+        # One active subscription per user; canceled/expired rows are kept as history
+        Index(
+            "ux_subscriptions_active_user",
+            "user_id",
+            unique=True,
+            postgresql_where=text("status = 'active'")
+        ),
+        Index("idx_subscriptions_user_created", "user_id", "created_at"),
+    )
 
 
 class Payment(Base):
@@ -7,19 +7,29 @@ from typing import List, Optional
 
 from sqlalchemy import (
     Boolean,
+    CheckConstraint,
     Column,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     String,
     Text,
     UniqueConstraint,
+    exists,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 import uuid
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
+
+
+def _enum_values(enum_cls) -> List[str]:
+    """Persist enum values ('admin'), not member names ('ADMIN')."""
+    return [member.value for member in enum_cls]
 
 
 class AppRole(str, enum.Enum):
@@ -56,7 +66,10 @@ class User(Base):
     password_changed_at = Column(DateTime, nullable=True)
     
     # Relationships
-    roles = relationship("UserRole", back_populates="user", cascade="all, delete-orphan")
+    # Roles are checked on nearly every request - load them with the user
+    roles = relationship(
+        "UserRole", back_populates="user", cascade="all, delete-orphan", lazy="selectin"
+    )
     oauth_accounts = relationship("OAuthAccount", back_populates="user", cascade="all, delete-orphan")
     security_events = relationship("SecurityEvent", back_populates="user", cascade="all, delete-orphan")
     integrations = relationship("Integration", back_populates="user", cascade="all, delete-orphan")
@@ -71,12 +84,20 @@ class User(Base):
     
     def has_role(self, role: AppRole) -> bool:
         """Check if user has a specific role."""
+        # Read from the live collection so grants/revokes apply immediately
         return any(r.role == role for r in self.roles)
     
-    @property
+    @hybrid_property
     def is_admin(self) -> bool:
         """Check if user is admin."""
         return self.has_role(AppRole.ADMIN)
+    
+    @is_admin.expression
+    def is_admin(cls):
+        """SQL-side admin check, usable in filters without loading roles."""
+        return exists().where(
+            (UserRole.user_id == cls.id) & (UserRole.role == AppRole.ADMIN)
+        ).correlate(cls)
 
 
 class UserRole(Base):
@@ -86,13 +107,16 @@ class UserRole(Base):
     """
     __tablename__ = "user_roles"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False
     )
-    role = Column(Enum(AppRole), nullable=False)
+    role = Column(
+        Enum(AppRole, name="app_role", native_enum=True, values_callable=_enum_values),
+        nullable=False
+    )
     
     # Who assigned this role
     assigned_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
@@ -101,8 +125,15 @@ class UserRole(Base):
     # Relationship
     user = relationship("User", back_populates="roles", foreign_keys=[user_id])
     
+    # unique_user_role doubles as the (user_id, role) index behind has_role
     __table_args__ = (
         UniqueConstraint("user_id", "role", name="unique_user_role"),
+        # Index-only probe for User.is_admin in SQL filters
+        Index(
+            "ix_user_roles_admin",
+            "user_id",
+            postgresql_where=text(f"role = '{AppRole.ADMIN.value}'")
+        ),
     )
 
 
@@ -118,14 +149,17 @@ class OAuthAccount(Base):
     """OAuth account links - unified by verified email."""
     __tablename__ = "oauth_accounts"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False
     )
     
-    provider = Column(Enum(OAuthProvider), nullable=False)
+    provider = Column(
+        Enum(OAuthProvider, name="oauth_provider", native_enum=True, values_callable=_enum_values),
+        nullable=False
+    )
     provider_user_id = Column(String(255), nullable=False)
     provider_email = Column(String(255), nullable=False)
     
@@ -143,6 +177,7 @@ class OAuthAccount(Base):
     
     __table_args__ = (
         UniqueConstraint("provider", "provider_user_id", name="unique_oauth_account"),
+        Index("ix_oauth_user_provider", "user_id", "provider"),
     )
 
 
@@ -169,25 +204,58 @@ class SecurityEvent(Base):
     """Security event audit log."""
     __tablename__ = "security_events"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False
     )
     
-    event_type = Column(Enum(SecurityEventType), nullable=False)
+    # Plain string on this hot append-only table; SecurityEventType is
+    # enforced by the check constraint below rather than per-row coercion.
+    event_type = Column(String(40), nullable=False)
     
     # Context
     ip_address = Column(String(45), nullable=True)  # IPv6 support
     user_agent = Column(Text, nullable=True)
     device_fingerprint = Column(String(255), nullable=True)
     
-    # Additional data (JSON stored as text)
-    metadata = Column(Text, nullable=True)
+    # Additional data; "metadata" is reserved on declarative classes, so the
+    # attribute is renamed while the column keeps its name.
+    event_metadata = Column("metadata", JSONB, nullable=True, key="event_metadata")
     
-    # Timestamp
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Timestamp (partition key, hence part of the primary key)
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow, nullable=False)
     
     # Relationship
     user = relationship("User", back_populates="security_events")
+    
+    __table_args__ = (
+        CheckConstraint(
+            "event_type IN ({})".format(
+                ", ".join(f"'{value}'" for value in _enum_values(SecurityEventType))
+            ),
+            name="ck_security_events_event_type"
+        ),
+        # Per-user audit log pagination (newest first)
+        Index("ix_security_events_user_created", user_id, created_at.desc()),
+        # Server-side filtering on metadata keys
+        Index("ix_security_events_metadata_gin", event_metadata, postgresql_using="gin"),
+        # Failed-login lookups used by lockout and audit views
+        Index(
+            "ix_sec_events_failed_login",
+            user_id,
+            created_at,
+            postgresql_where=text(f"event_type = '{SecurityEventType.LOGIN_FAILED.value}'")
+        ),
+        # Known IPs/devices for new-login alerts (index-only scan)
+        Index(
+            "ix_sec_events_login_sources",
+            user_id,
+            created_at,
+            postgresql_include=["ip_address", "device_fingerprint"],
+            postgresql_where=text(f"event_type = '{SecurityEventType.LOGIN_SUCCESS.value}'")
+        ),
+        # Monthly range partitions; see migrations/011
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
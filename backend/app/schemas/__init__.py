@@ -1,40 +1,83 @@
 # Schemas module
-from app.schemas.user import (
-    UserBase,
-    UserCreate,
-    UserUpdate,
-    UserResponse,
-    UserInDB,
-)
-from app.schemas.auth import (
-    TokenPair,
-    TokenPayload,
-    LoginRequest,
-    SignupRequest,
-    PasswordResetRequest,
-    PasswordResetConfirm,
-    EmailVerificationRequest,
-    OAuthCallbackRequest,
-)
-from app.schemas.integration import (
-    IntegrationBase,
-    IntegrationCreate,
-    IntegrationUpdate,
-    IntegrationResponse,
-)
-from app.schemas.conversation import (
-    ConversationBase,
-    ConversationResponse,
-    MessageBase,
-    MessageCreate,
-    MessageResponse,
-)
-from app.schemas.order import (
-    OrderBase,
-    OrderCreate,
-    OrderUpdate,
-    OrderResponse,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing one schema does not build every model's core schema.
+_LAZY = {
+    "UserBase": "app.schemas.user",
+    "UserCreate": "app.schemas.user",
+    "UserUpdate": "app.schemas.user",
+    "UserResponse": "app.schemas.user",
+    "UserInDB": "app.schemas.user",
+    "TokenPair": "app.schemas.auth",
+    "TokenPayload": "app.schemas.auth",
+    "LoginRequest": "app.schemas.auth",
+    "SignupRequest": "app.schemas.auth",
+    "PasswordResetRequest": "app.schemas.auth",
+    "PasswordResetConfirm": "app.schemas.auth",
+    "EmailVerificationRequest": "app.schemas.auth",
+    "OAuthCallbackRequest": "app.schemas.auth",
+    "IntegrationBase": "app.schemas.integration",
+    "IntegrationCreate": "app.schemas.integration",
+    "IntegrationUpdate": "app.schemas.integration",
+    "IntegrationResponse": "app.schemas.integration",
+    "ConversationBase": "app.schemas.conversation",
+    "ConversationResponse": "app.schemas.conversation",
+    "MessageBase": "app.schemas.conversation",
+    "MessageCreate": "app.schemas.conversation",
+    "MessageResponse": "app.schemas.conversation",
+    "MessageSummary": "app.schemas.conversation",
+    "ConversationSummary": "app.schemas.conversation",
+    "OrderBase": "app.schemas.order",
+    "OrderCreate": "app.schemas.order",
+    "OrderUpdate": "app.schemas.order",
+    "OrderResponse": "app.schemas.order",
+    "OrderSummary": "app.schemas.order",
+    "ShippingAddress": "app.schemas.order",
+}
+
+if TYPE_CHECKING:
+    from app.schemas.user import (
+        UserBase,
+        UserCreate,
+        UserUpdate,
+        UserResponse,
+        UserInDB,
+    )
+    from app.schemas.auth import (
+        TokenPair,
+        TokenPayload,
+        LoginRequest,
+        SignupRequest,
+        PasswordResetRequest,
+        PasswordResetConfirm,
+        EmailVerificationRequest,
+        OAuthCallbackRequest,
+    )
+    from app.schemas.integration import (
+        IntegrationBase,
+        IntegrationCreate,
+        IntegrationUpdate,
+        IntegrationResponse,
+    )
+    from app.schemas.conversation import (
+        ConversationBase,
+        ConversationResponse,
+        MessageBase,
+        MessageCreate,
+        MessageResponse,
+        MessageSummary,
+        ConversationSummary,
+    )
+    from app.schemas.order import (
+        OrderBase,
+        OrderCreate,
+        OrderUpdate,
+        OrderResponse,
+        OrderSummary,
+        ShippingAddress,
+    )
 
 __all__ = [
     # User
@@ -63,9 +106,26 @@ __all__ = [
     "MessageBase",
     "MessageCreate",
     "MessageResponse",
+    "MessageSummary",
+    "ConversationSummary",
     # Order
     "OrderBase",
     "OrderCreate",
     "OrderUpdate",
     "OrderResponse",
+    "OrderSummary",
+    "ShippingAddress",
 ]
+
+
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
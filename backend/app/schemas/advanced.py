@@ -2,9 +2,32 @@
 Pydantic schemas for advanced features.
 """
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Type
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, create_model, field_validator
+
+from app.schemas.base import list_adapter
+
+# Read-heavy response models: intern repeated dict keys (sentiment_breakdown,
+# emotions, field_mappings, ...) while validating JSON.
+RESPONSE_CONFIG = ConfigDict(from_attributes=True, cache_strings="keys")
+
+
+def make_partial(
+    model: Type[BaseModel],
+    name: str,
+    exclude: Iterable[str] = (),
+    **extra: Any
+) -> Type[BaseModel]:
+    """Build a PATCH schema where every field of `model` is optional."""
+    fields = {
+        field_name: (Optional[field.annotation], None)
+        for field_name, field in model.model_fields.items()
+        if field_name not in exclude
+    }
+    for field_name, annotation in extra.items():
+        fields[field_name] = (Optional[annotation], None)
+    return create_model(name, __module__=__name__, **fields)
 
 
 # ==========================================
@@ -15,20 +38,14 @@ class CannedResponseBase(BaseModel):
     content: str
     shortcut: Optional[str] = None
     category: Optional[str] = None
-    tags: List[str] = []
+    tags: List[str] = Field(default_factory=list)
 
 
 class CannedResponseCreate(CannedResponseBase):
     pass
 
 
-class CannedResponseUpdate(BaseModel):
-    title: Optional[str] = None
-    content: Optional[str] = None
-    shortcut: Optional[str] = None
-    category: Optional[str] = None
-    tags: Optional[List[str]] = None
-    is_active: Optional[bool] = None
+CannedResponseUpdate = make_partial(CannedResponseBase, "CannedResponseUpdate", is_active=bool)
 
 
 class CannedResponseResponse(CannedResponseBase):
@@ -58,10 +75,7 @@ class CustomerTagCreate(CustomerTagBase):
     pass
 
 
-class CustomerTagUpdate(BaseModel):
-    name: Optional[str] = None
-    color: Optional[str] = None
-    description: Optional[str] = None
+CustomerTagUpdate = make_partial(CustomerTagBase, "CustomerTagUpdate")
 
 
 class CustomerTagResponse(CustomerTagBase):
@@ -86,13 +100,22 @@ class SegmentCondition(BaseModel):
 
 class SegmentRules(BaseModel):
     operator: str = "AND"  # AND, OR
-    conditions: List[SegmentCondition] = []
+    conditions: List[SegmentCondition] = Field(default_factory=list)
+
+
+class _FrozenSegmentRules(SegmentRules):
+    model_config = ConfigDict(frozen=True)
+
+
+# Shared by every segment response whose stored rules are empty, instead of
+# building a fresh SegmentRules per row. Frozen since all readers hold it.
+EMPTY_SEGMENT_RULES: SegmentRules = _FrozenSegmentRules()
 
 
 class CustomerSegmentBase(BaseModel):
     name: str
     description: Optional[str] = None
-    rules: SegmentRules = SegmentRules()
+    rules: SegmentRules = Field(default_factory=SegmentRules)
     is_dynamic: bool = True
 
 
@@ -100,16 +123,13 @@ class CustomerSegmentCreate(CustomerSegmentBase):
     pass
 
 
-class CustomerSegmentUpdate(BaseModel):
-    name: Optional[str] = None
-    description: Optional[str] = None
-    rules: Optional[SegmentRules] = None
-    is_dynamic: Optional[bool] = None
+CustomerSegmentUpdate = make_partial(CustomerSegmentBase, "CustomerSegmentUpdate")
 
 
 class CustomerSegmentResponse(CustomerSegmentBase):
     id: UUID
     user_id: UUID
+    rules: SegmentRules = Field(default_factory=lambda: EMPTY_SEGMENT_RULES)
     customer_count: int = 0
     last_computed: Optional[datetime] = None
     created_at: datetime
@@ -118,6 +138,12 @@ class CustomerSegmentResponse(CustomerSegmentBase):
     class Config:
         from_attributes = True
 
+    @field_validator("rules", mode="before")
+    @classmethod
+    def share_empty_rules(cls, v):
+        """Rows stored with no rules ({} or NULL) get the shared instance."""
+        return v or EMPTY_SEGMENT_RULES
+
 
 # ==========================================
 # CUSTOMER PROFILES
@@ -127,21 +153,17 @@ class CustomerProfileBase(BaseModel):
     phone: Optional[str] = None
     name: Optional[str] = None
     avatar_url: Optional[str] = None
-    attributes: Dict[str, Any] = {}
+    attributes: Dict[str, Any] = Field(default_factory=dict)
 
 
 class CustomerProfileCreate(CustomerProfileBase):
     external_id: Optional[str] = None
-    tags: List[UUID] = []
+    tags: List[UUID] = Field(default_factory=list)
 
 
-class CustomerProfileUpdate(BaseModel):
-    email: Optional[str] = None
-    phone: Optional[str] = None
-    name: Optional[str] = None
-    avatar_url: Optional[str] = None
-    attributes: Optional[Dict[str, Any]] = None
-    tags: Optional[List[UUID]] = None
+CustomerProfileUpdate = make_partial(
+    CustomerProfileCreate, "CustomerProfileUpdate", exclude={"external_id"}
+)
 
 
 class CustomerProfileResponse(CustomerProfileBase):
@@ -150,8 +172,8 @@ class CustomerProfileResponse(CustomerProfileBase):
     external_id: Optional[str] = None
     first_seen: datetime
     last_seen: Optional[datetime] = None
-    tags: List[UUID] = []
-    segments: List[UUID] = []
+    tags: List[UUID] = Field(default_factory=list)
+    segments: List[UUID] = Field(default_factory=list)
     total_conversations: int = 0
     total_orders: int = 0
     total_spent: float = 0
@@ -161,8 +183,7 @@ class CustomerProfileResponse(CustomerProfileBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # ==========================================
@@ -172,8 +193,8 @@ class AISummaryResponse(BaseModel):
     id: UUID
     conversation_id: UUID
     summary: str
-    key_points: List[str] = []
-    action_items: List[str] = []
+    key_points: List[str] = Field(default_factory=list)
+    action_items: List[str] = Field(default_factory=list)
     overall_sentiment: Optional[str] = None
     sentiment_score: Optional[float] = None
     sentiment_breakdown: Optional[Dict[str, float]] = None
@@ -183,14 +204,26 @@ class AISummaryResponse(BaseModel):
     processing_time_ms: Optional[int] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class GenerateSummaryRequest(BaseModel):
     conversation_id: UUID
 
 
+class AISummaryCompletion(BaseModel):
+    """JSON payload returned by the summary prompt."""
+    model_config = ConfigDict(cache_strings="keys")
+
+    summary: str
+    key_points: List[str] = Field(default_factory=list)
+    action_items: List[str] = Field(default_factory=list)
+    sentiment: Optional[str] = None
+    sentiment_score: Optional[float] = None
+    sentiment_breakdown: Optional[Dict[str, float]] = None
+    language: str = "en"
+
+
 # ==========================================
 # VOICE TRANSCRIPTION
 # ==========================================
@@ -209,11 +242,24 @@ class VoiceTranscriptionResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @field_validator("word_timings", mode="before")
+    @classmethod
+    def expand_word_timings(cls, v):
+        """Stored column-wise as {word: [...], start: [...], end: [...]}."""
+        if isinstance(v, dict):
+            return [
+                {"word": word, "start": start, "end": end}
+                for word, start, end in zip(v["word"], v["start"], v["end"])
+            ]
+        return v
+
 
 class TranscribeAudioRequest(BaseModel):
     audio_url: str
     conversation_id: UUID
     message_id: Optional[UUID] = None
+    language: Optional[str] = Field(None, min_length=2, max_length=2)  # ISO-639-1, skips detection
+    prompt: Optional[str] = Field(None, max_length=1000)  # names/jargon to bias spelling
 
 
 # ==========================================
@@ -227,12 +273,23 @@ class SentimentAnalysisResponse(BaseModel):
     score: float
     confidence: Optional[float] = None
     emotions: Optional[Dict[str, float]] = None
-    keywords: List[str] = []
-    topics: List[str] = []
+    keywords: List[str] = Field(default_factory=list)
+    topics: List[str] = Field(default_factory=list)
     analyzed_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
+
+
+class SentimentCompletion(BaseModel):
+    """JSON payload returned by the sentiment prompt."""
+    model_config = ConfigDict(cache_strings="keys")
+
+    sentiment: str
+    score: float
+    confidence: float = 0.8
+    emotions: Optional[Dict[str, float]] = None
+    keywords: List[str] = Field(default_factory=list)
+    topics: List[str] = Field(default_factory=list)
 
 
 class SentimentDashboardResponse(BaseModel):
@@ -252,17 +309,16 @@ class CRMIntegrationBase(BaseModel):
     crm_type: str  # salesforce, hubspot, pipedrive, zoho
     sync_enabled: bool = True
     sync_interval_minutes: int = 15
-    field_mappings: Dict[str, str] = {}
+    field_mappings: Dict[str, str] = Field(default_factory=dict)
 
 
 class CRMIntegrationCreate(CRMIntegrationBase):
     credentials: Dict[str, Any]
 
 
-class CRMIntegrationUpdate(BaseModel):
-    sync_enabled: Optional[bool] = None
-    sync_interval_minutes: Optional[int] = None
-    field_mappings: Optional[Dict[str, str]] = None
+CRMIntegrationUpdate = make_partial(
+    CRMIntegrationBase, "CRMIntegrationUpdate", exclude={"crm_type"}
+)
 
 
 class CRMIntegrationResponse(CRMIntegrationBase):
@@ -292,13 +348,12 @@ class CRMSyncLogResponse(BaseModel):
     records_created: int
     records_updated: int
     records_failed: int
-    errors: List[Dict[str, Any]] = []
+    errors: List[Dict[str, Any]] = Field(default_factory=list)
     started_at: datetime
     completed_at: Optional[datetime] = None
     duration_seconds: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class CRMOAuthURLResponse(BaseModel):
@@ -313,22 +368,18 @@ class AITrainingDataBase(BaseModel):
     training_type: str  # response, classification, extraction
     input_text: str
     expected_output: str
-    context: Dict[str, Any] = {}
+    context: Dict[str, Any] = Field(default_factory=dict)
     category: Optional[str] = None
-    tags: List[str] = []
+    tags: List[str] = Field(default_factory=list)
 
 
 class AITrainingDataCreate(AITrainingDataBase):
     pass
 
 
-class AITrainingDataUpdate(BaseModel):
-    input_text: Optional[str] = None
-    expected_output: Optional[str] = None
-    context: Optional[Dict[str, Any]] = None
-    category: Optional[str] = None
-    tags: Optional[List[str]] = None
-    is_validated: Optional[bool] = None
+AITrainingDataUpdate = make_partial(
+    AITrainingDataBase, "AITrainingDataUpdate", exclude={"training_type"}, is_validated=bool
+)
 
 
 class AITrainingDataResponse(AITrainingDataBase):
@@ -437,8 +488,7 @@ class BlockchainAuditLogResponse(BaseModel):
     submitted_at: datetime
     confirmed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class VerifyAuditLogRequest(BaseModel):
@@ -505,13 +555,12 @@ class PredictiveAnalyticsResponse(BaseModel):
     entity_id: Optional[UUID] = None
     prediction_value: float
     confidence: float
-    factors: List[Dict[str, Any]] = []
+    factors: List[Dict[str, Any]] = Field(default_factory=list)
     prediction_date: datetime
     valid_until: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class PredictionDashboardResponse(BaseModel):
@@ -532,14 +581,14 @@ class AISettingsBase(BaseModel):
     system_prompt: Optional[str] = None
     personality: str = "professional"
     primary_language: str = "en"
-    supported_languages: List[str] = ["en"]
+    supported_languages: List[str] = Field(default_factory=lambda: ["en"])
     auto_translate: bool = True
     auto_respond: bool = False
     auto_summarize: bool = True
     sentiment_analysis: bool = True
     response_delay_seconds: int = 0
     fallback_message: Optional[str] = None
-    escalation_keywords: List[str] = []
+    escalation_keywords: List[str] = Field(default_factory=list)
 
 
 class AISettingsUpdate(AISettingsBase):
@@ -594,3 +643,11 @@ class WebSocketConnectionResponse(BaseModel):
     connection_id: str
     user_id: UUID
     connected_at: datetime
+
+
+# ==========================================
+# LIST ADAPTERS
+# ==========================================
+CannedResponseListAdapter = list_adapter(CannedResponseResponse)
+CustomerProfileListAdapter = list_adapter(CustomerProfileResponse)
+BlockchainAuditLogListAdapter = list_adapter(BlockchainAuditLogResponse)
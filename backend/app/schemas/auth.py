@@ -4,7 +4,7 @@ Authentication schemas.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, model_validator
 
 from app.models.user import OAuthProvider
 
@@ -53,6 +53,12 @@ class SignupRequest(BaseModel):
     first_name: Optional[str] = Field(None, max_length=100)
     last_name: Optional[str] = Field(None, max_length=100)
     device_fingerprint: Optional[str] = None
+    
+    @model_validator(mode="after")
+    def check_passwords_match(self) -> "SignupRequest":
+        if self.password != self.confirm_password:
+            raise ValueError("Passwords do not match")
+        return self
 
 
 class SignupResponse(BaseModel):
@@ -89,6 +95,12 @@ class PasswordResetConfirm(BaseModel):
     token: str
     new_password: str = Field(..., min_length=8, max_length=100)
     confirm_password: str = Field(..., min_length=8, max_length=100)
+    
+    @model_validator(mode="after")
+    def check_passwords_match(self) -> "PasswordResetConfirm":
+        if self.new_password != self.confirm_password:
+            raise ValueError("Passwords do not match")
+        return self
 
 
 class OAuthCallbackRequest(BaseModel):
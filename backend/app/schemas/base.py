@@ -0,0 +1,138 @@
+"""
+Shared schema base classes.
+"""
+import enum
+from typing import Annotated, Any, ClassVar, Dict, FrozenSet, List, Literal, Optional, Tuple, Type
+
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    SerializerFunctionWrapHandler,
+    StringConstraints,
+    TypeAdapter,
+    model_serializer,
+)
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.associationproxy import AssociationProxyExtensionType
+
+_MISSING = object()
+
+
+def _unloaded_relations(obj: Any) -> FrozenSet[str]:
+    """
+    Relationships not loaded on an ORM row, plus the association proxies
+    that read through them. Reading either would trigger (or, with
+    lazy="raise", refuse) a load; expired columns are not included and
+    still refresh as usual.
+    """
+    state = sa_inspect(obj, raiseerr=False)
+    if state is None or not state.unloaded:
+        return frozenset()
+    mapper = state.mapper
+    names = {key for key in state.unloaded if key in mapper.relationships}
+    if names:
+        names.update(
+            key for key, attr in mapper.all_orm_descriptors.items()
+            if attr.extension_type is AssociationProxyExtensionType.ASSOCIATION_PROXY
+            and attr.target_collection in names
+        )
+    return frozenset(names)
+
+# Response models built once from a DB row and never mutated afterwards.
+# Enum fields hold the member's shared value string rather than the member.
+# These stay BaseModels rather than slotted pydantic dataclasses: the trusted
+# constructor relies on model_construct and CompactDumpMixin on model_serializer.
+FROZEN_ORM_CONFIG = ConfigDict(
+    from_attributes=True,
+    frozen=True,
+    extra="ignore",
+    populate_by_name=True,
+    use_enum_values=True,
+)
+
+# AI confidence as a 0-100 percentage; matches the SmallInteger columns
+ConfidenceScore = Annotated[int, Field(ge=0, le=100)]
+
+# Response-side ids. Rows already hold canonical UUIDs, so they are only
+# stringified rather than parsed; inputs keep the strict UUID type.
+_UUID_TO_STR = BeforeValidator(str)
+UuidStr = Annotated[str, _UUID_TO_STR, StringConstraints(min_length=36, max_length=36)]
+
+# Deepest page a list endpoint will serve; OFFSET scans grow with the page
+MAX_LIST_PAGE = 10_000
+
+
+def enum_literal(enum_cls: Type[enum.Enum]) -> Any:
+    """Literal of an enum's values, for response fields read from trusted rows.
+
+    Response fields validate the stored value string against this Literal
+    rather than the Enum, so no member lookup happens per row and the dump
+    emits the value as-is.
+    """
+    return Literal[tuple(member.value for member in enum_cls)]
+
+
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter for List[model], built once at import.
+
+    List endpoints validate a whole result set in a single call instead of
+    one model_validate per row.
+    """
+    return TypeAdapter(List[model])
+
+
+class TrustedORMModel(BaseModel):
+    """
+    Response schema that can be built from a DB row without validation.
+    Use from_orm_trusted only for ORM objects; anything user-supplied
+    must still go through model_validate.
+    """
+    # (field name, row attribute) pairs; the attribute is the validation alias if set
+    _orm_fields: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+    _uuid_str_fields: ClassVar[FrozenSet[str]] = frozenset()
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._orm_fields = tuple(
+            (name, field.validation_alias if isinstance(field.validation_alias, str) else name)
+            for name, field in cls.model_fields.items()
+        )
+        cls._uuid_str_fields = frozenset(
+            name for name, field in cls.model_fields.items()
+            if _UUID_TO_STR in field.metadata or field.annotation == Optional[UuidStr]
+        )
+    
+    @classmethod
+    def _orm_data(cls, obj: Any) -> Dict[str, Any]:
+        """Read every schema field present on the row; missing or unloaded ones take defaults."""
+        data = {}
+        unloaded = _unloaded_relations(obj)
+        for name, attr in cls._orm_fields:
+            if attr in unloaded:
+                continue
+            value = getattr(obj, attr, _MISSING)
+            if value is not _MISSING:
+                if value is not None and name in cls._uuid_str_fields:
+                    value = str(value)
+                data[name] = value
+        return data
+    
+    @classmethod
+    def from_orm_trusted(cls, obj: Any):
+        """Construct from a trusted ORM object, skipping validation."""
+        return cls.model_construct(**cls._orm_data(obj))
+
+
+class CompactDumpMixin(BaseModel):
+    """
+    Omit None fields when serialising. For list-heavy responses where most
+    nullable columns are unset. Done in the serializer so it also applies
+    to FastAPI responses and when nested inside other models.
+    """
+    
+    @model_serializer(mode="wrap")
+    def _drop_none(self, handler: SerializerFunctionWrapHandler) -> Dict[str, Any]:
+        return {key: value for key, value in handler(self).items() if value is not None}
@@ -4,7 +4,7 @@ Billing and payment schemas.
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
 class PlanResponse(BaseModel):
@@ -5,7 +5,17 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
+
+from app.schemas.base import (
+    FROZEN_ORM_CONFIG,
+    MAX_LIST_PAGE,
+    CompactDumpMixin,
+    ConfidenceScore,
+    TrustedORMModel,
+    UuidStr,
+    enum_literal,
+)
 
 from app.models.conversation import (
     ConversationStatus,
@@ -14,6 +24,11 @@ from app.models.conversation import (
     MessageType,
 )
 
+MessageTypeValue = enum_literal(MessageType)
+MessageDirectionValue = enum_literal(MessageDirection)
+MessageStatusValue = enum_literal(MessageStatus)
+ConversationStatusValue = enum_literal(ConversationStatus)
+
 
 class MessageBase(BaseModel):
     """Base message schema."""
@@ -28,25 +43,37 @@ class MessageCreate(MessageBase):
     direction: MessageDirection = MessageDirection.OUTBOUND
 
 
-class MessageResponse(BaseModel):
+class MessageResponse(CompactDumpMixin, TrustedORMModel):
     """Message response schema."""
-    id: UUID
-    conversation_id: UUID
-    type: MessageType
-    direction: MessageDirection
+    id: UuidStr
+    conversation_id: UuidStr
+    type: MessageTypeValue
+    direction: MessageDirectionValue
     content: Optional[str]
     media_url: Optional[str]
     media_mime_type: Optional[str]
     media_filename: Optional[str]
-    status: MessageStatus
+    status: MessageStatusValue
     external_id: Optional[str]
     is_ai_generated: bool
     ai_intent: Optional[str]
-    ai_confidence: Optional[int]
+    ai_confidence: Optional[ConfidenceScore]
     created_at: datetime
     delivered_at: Optional[datetime]
     read_at: Optional[datetime]
     
+    model_config = FROZEN_ORM_CONFIG
+
+
+class MessageSummary(TrustedORMModel):
+    """Lean message schema for list endpoints."""
+    id: UuidStr
+    type: MessageTypeValue
+    direction: MessageDirectionValue
+    content: Optional[str] = None
+    status: MessageStatusValue
+    created_at: datetime
+    
     class Config:
         from_attributes = True
 
@@ -58,20 +85,20 @@ class ConversationBase(BaseModel):
     subject: Optional[str] = None
 
 
-class ConversationResponse(BaseModel):
+class ConversationResponse(CompactDumpMixin, TrustedORMModel):
     """Conversation response schema."""
-    id: UUID
-    user_id: UUID
-    integration_id: UUID
+    id: UuidStr
+    user_id: UuidStr
+    integration_id: UuidStr
     contact_id: str
     contact_name: Optional[str]
     contact_avatar: Optional[str]
     contact_phone: Optional[str]
     contact_email: Optional[str]
-    status: ConversationStatus
+    status: ConversationStatusValue
     subject: Optional[str]
     is_ai_handled: bool
-    ai_confidence: Optional[int]
+    ai_confidence: Optional[ConfidenceScore]
     requires_human: bool
     unread_count: int
     message_count: int
@@ -82,6 +109,27 @@ class ConversationResponse(BaseModel):
     # Last message preview
     last_message: Optional[MessageResponse] = None
     
+    model_config = FROZEN_ORM_CONFIG
+    
+    @classmethod
+    def from_orm_trusted(cls, obj):
+        """Construct from a trusted ORM object, skipping validation."""
+        data = cls._orm_data(obj)
+        if data.get("last_message") is not None:
+            data["last_message"] = MessageResponse.from_orm_trusted(data["last_message"])
+        return cls.model_construct(**data)
+
+
+class ConversationSummary(TrustedORMModel):
+    """Lean conversation schema for list endpoints."""
+    id: UuidStr
+    contact_name: Optional[str] = None
+    status: ConversationStatusValue
+    unread_count: int
+    message_count: int
+    last_message_at: Optional[datetime] = None
+    last_message_preview: Optional[str] = None
+    
     class Config:
         from_attributes = True
 
@@ -107,8 +155,13 @@ class ConversationListParams(BaseModel):
     status: Optional[ConversationStatus] = None
     requires_human: Optional[bool] = None
     search: Optional[str] = None
-    page: int = Field(1, ge=1)
+    page: int = Field(1, ge=1, le=MAX_LIST_PAGE)
     page_size: int = Field(20, ge=1, le=100)
+    
+    @computed_field
+    @property
+    def offset(self) -> int:
+        return (self.page - 1) * self.page_size
 
 
 class SendMessageRequest(BaseModel):
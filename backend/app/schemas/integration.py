@@ -8,6 +8,10 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 
 from app.models.integration import IntegrationStatus, IntegrationType
+from app.schemas.base import FROZEN_ORM_CONFIG, TrustedORMModel, enum_literal
+
+IntegrationTypeValue = enum_literal(IntegrationType)
+IntegrationStatusValue = enum_literal(IntegrationStatus)
 
 
 class IntegrationBase(BaseModel):
@@ -36,14 +40,14 @@ class IntegrationUpdate(BaseModel):
     n8n_webhook_url: Optional[str] = None
 
 
-class IntegrationResponse(BaseModel):
+class IntegrationResponse(TrustedORMModel):
     """Integration response schema."""
     id: UUID
     user_id: UUID
     name: str
-    type: IntegrationType
+    type: IntegrationTypeValue
     description: Optional[str]
-    status: IntegrationStatus
+    status: IntegrationStatusValue
     is_active: bool
     external_id: Optional[str]
     external_name: Optional[str]
@@ -55,8 +59,7 @@ class IntegrationResponse(BaseModel):
     last_error: Optional[str]
     error_count: int
     
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_ORM_CONFIG
 
 
 class IntegrationStats(BaseModel):
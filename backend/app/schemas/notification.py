@@ -3,45 +3,26 @@ Notification and webhook schemas.
 """
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, TypeAdapter, create_model, field_validator
+
+from app.models.notification import DEFAULT_EMAIL_PREFS, EMAIL_PREF_FIELDS
 
 
 class EmailPreferencesBase(BaseModel):
-    """Base email preferences."""
-    # Security
-    security_alerts: bool = True
-    new_login_alerts: bool = True
-    password_changes: bool = True
-    
-    # Billing
-    payment_receipts: bool = True
-    payment_failures: bool = True
-    subscription_changes: bool = True
-    usage_alerts: bool = True
-    
-    # Team
-    team_invites: bool = True
-    team_member_joined: bool = True
-    role_changes: bool = True
-    
-    # Messages
-    new_messages: bool = True
-    message_digest: bool = False
+    """Base email preferences; toggles are an EmailPref bitmask."""
+    flags: int = Field(DEFAULT_EMAIL_PREFS, ge=0)
     digest_frequency: str = "daily"
-    
-    # Integrations
-    integration_errors: bool = True
-    integration_connected: bool = True
-    
-    # Marketing
-    product_updates: bool = True
-    tips_and_tutorials: bool = False
-    promotional_emails: bool = False
 
 
-class EmailPreferencesUpdate(EmailPreferencesBase):
-    """Update email preferences request."""
-    pass
+# Accepts `flags` or the legacy per-toggle booleans (applied on top of flags)
+EmailPreferencesUpdate = create_model(
+    "EmailPreferencesUpdate",
+    __doc__="Update email preferences request.",
+    __module__=__name__,
+    flags=(Optional[int], Field(None, ge=0)),
+    digest_frequency=(Optional[str], None),
+    **{name: (Optional[bool], None) for name in EMAIL_PREF_FIELDS}
+)
 
 
 class EmailPreferencesResponse(EmailPreferencesBase):
@@ -55,6 +36,21 @@ class EmailPreferencesResponse(EmailPreferencesBase):
         from_attributes = True
 
 
+EmailPreferencesLegacyView = create_model(
+    "EmailPreferencesLegacyView",
+    __base__=EmailPreferencesResponse,
+    __doc__="Email preferences with every toggle expanded to a named boolean.",
+    __module__=__name__,
+    **{name: (bool, bool(DEFAULT_EMAIL_PREFS & pref)) for name, pref in EMAIL_PREF_FIELDS.items()}
+)
+
+
+def expand_email_preferences(response: EmailPreferencesResponse) -> EmailPreferencesLegacyView:
+    """Decode the bitmask into the verbose per-toggle form."""
+    toggles = {name: bool(response.flags & pref) for name, pref in EMAIL_PREF_FIELDS.items()}
+    return EmailPreferencesLegacyView(**response.model_dump(), **toggles)
+
+
 # Webhook schemas
 class WebhookEventType(BaseModel):
     """Webhook event type."""
@@ -80,6 +76,23 @@ AVAILABLE_WEBHOOK_EVENTS = [
     WebhookEventType(id="billing.subscription_updated", name="Subscription Updated", description="When subscription changes", category="billing"),
 ]
 
+# The catalogue never changes at runtime, so serve pre-encoded bytes
+AVAILABLE_WEBHOOK_EVENTS_JSON: bytes = TypeAdapter(List[WebhookEventType]).dump_json(
+    AVAILABLE_WEBHOOK_EVENTS
+)
+
+# Event ids a webhook may subscribe to ("*" subscribes to everything)
+ALLOWED_WEBHOOK_EVENT_IDS = frozenset(e.id for e in AVAILABLE_WEBHOOK_EVENTS) | {"*"}
+
+
+def _validate_event_ids(events: Optional[List[str]]) -> Optional[List[str]]:
+    """Reject event ids that are not in AVAILABLE_WEBHOOK_EVENTS."""
+    if events:
+        invalid = [e for e in events if e not in ALLOWED_WEBHOOK_EVENT_IDS]
+        if invalid:
+            raise ValueError(f"Unknown webhook events: {', '.join(invalid)}")
+    return events
+
 
 class WebhookCreate(BaseModel):
     """Create webhook request."""
@@ -90,6 +103,11 @@ class WebhookCreate(BaseModel):
     max_retries: int = Field(default=3, ge=0, le=10)
     retry_delay_seconds: int = Field(default=60, ge=10, le=3600)
 
+    @field_validator("events")
+    @classmethod
+    def validate_events(cls, events):
+        return _validate_event_ids(events)
+
 
 class WebhookUpdate(BaseModel):
     """Update webhook request."""
@@ -101,6 +119,11 @@ class WebhookUpdate(BaseModel):
     max_retries: Optional[int] = Field(None, ge=0, le=10)
     retry_delay_seconds: Optional[int] = Field(None, ge=10, le=3600)
 
+    @field_validator("events")
+    @classmethod
+    def validate_events(cls, events):
+        return _validate_event_ids(events)
+
 
 class WebhookResponse(BaseModel):
     """Webhook response."""
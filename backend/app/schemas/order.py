@@ -2,13 +2,50 @@
 Order schemas.
 """
 from datetime import datetime
-from decimal import Decimal
-from typing import List, Optional
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Annotated, Any, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+import orjson
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    EmailStr,
+    Field,
+    computed_field,
+    field_validator,
+)
 
 from app.models.order import OrderSource, OrderStatus
+from app.schemas.base import (
+    FROZEN_ORM_CONFIG,
+    MAX_LIST_PAGE,
+    CompactDumpMixin,
+    ConfidenceScore,
+    TrustedORMModel,
+    UuidStr,
+    enum_literal,
+    list_adapter,
+)
+
+OrderStatusValue = enum_literal(OrderStatus)
+OrderSourceValue = enum_literal(OrderSource)
+
+
+def to_cents(value: Any) -> Any:
+    """Decimal money to integer minor units; anything else passes through."""
+    if isinstance(value, Decimal):
+        return int((value * 100).to_integral_value(rounding=ROUND_HALF_UP))
+    return value
+
+
+def format_cents(cents: Optional[int]) -> Optional[str]:
+    """Integer minor units back to a two-place decimal string."""
+    return None if cents is None else str(Decimal(cents).scaleb(-2))
+
+
+# Money on the wire: integer minor units, read from the Numeric(10, 2) columns
+Cents = Annotated[int, BeforeValidator(to_cents)]
 
 
 class OrderItemBase(BaseModel):
@@ -20,16 +57,21 @@ class OrderItemBase(BaseModel):
     notes: Optional[str] = None
 
 
+class ShippingAddress(BaseModel):
+    """Shipping address, shared by the order input and response schemas."""
+    address: Optional[str] = None
+    city: Optional[str] = Field(None, max_length=100)
+    state: Optional[str] = Field(None, max_length=100)
+    zip: Optional[str] = Field(None, max_length=20)
+    country: Optional[str] = Field(None, max_length=100)
+
+
 class OrderBase(BaseModel):
     """Base order schema."""
     customer_name: Optional[str] = None
     customer_email: Optional[EmailStr] = None
     customer_phone: Optional[str] = None
-    shipping_address: Optional[str] = None
-    shipping_city: Optional[str] = None
-    shipping_state: Optional[str] = None
-    shipping_zip: Optional[str] = None
-    shipping_country: Optional[str] = None
+    shipping: Optional[ShippingAddress] = None
     notes: Optional[str] = None
 
 
@@ -41,7 +83,6 @@ class OrderCreate(OrderBase):
     tax: Optional[Decimal] = Decimal("0")
     shipping_cost: Optional[Decimal] = Decimal("0")
     discount: Optional[Decimal] = Decimal("0")
-    total: Decimal
     currency: str = "USD"
     source: OrderSource = OrderSource.MANUAL
 
@@ -52,48 +93,115 @@ class OrderUpdate(BaseModel):
     customer_name: Optional[str] = None
     customer_email: Optional[EmailStr] = None
     customer_phone: Optional[str] = None
-    shipping_address: Optional[str] = None
-    shipping_city: Optional[str] = None
-    shipping_state: Optional[str] = None
-    shipping_zip: Optional[str] = None
-    shipping_country: Optional[str] = None
+    shipping: Optional[ShippingAddress] = None
     notes: Optional[str] = None
     internal_notes: Optional[str] = None
 
 
-class OrderResponse(BaseModel):
+class OrderResponse(CompactDumpMixin, TrustedORMModel):
     """Order response schema."""
-    id: UUID
-    user_id: UUID
-    conversation_id: Optional[UUID]
+    id: UuidStr
+    user_id: UuidStr
+    conversation_id: Optional[UuidStr]
     order_number: str
     customer_name: Optional[str]
     customer_email: Optional[str]
     customer_phone: Optional[str]
-    shipping_address: Optional[str]
-    shipping_city: Optional[str]
-    shipping_state: Optional[str]
-    shipping_zip: Optional[str]
-    shipping_country: Optional[str]
-    status: OrderStatus
-    source: OrderSource
-    subtotal: Optional[Decimal]
-    tax: Optional[Decimal]
-    shipping_cost: Optional[Decimal]
-    discount: Optional[Decimal]
-    total: Decimal
+    shipping: Optional[ShippingAddress] = None
+    status: OrderStatusValue
+    source: OrderSourceValue
+    subtotal_cents: Optional[Cents] = Field(..., validation_alias="subtotal")
+    tax_cents: Optional[Cents] = Field(..., validation_alias="tax")
+    shipping_cost_cents: Optional[Cents] = Field(..., validation_alias="shipping_cost")
+    discount_cents: Optional[Cents] = Field(..., validation_alias="discount")
+    total_cents: Cents = Field(..., validation_alias="total")
     currency: str
-    items: Optional[List[dict]] = None  # Parsed JSON
+    items: Optional[List[OrderItemBase]] = None  # JSON text in orders_extra
     notes: Optional[str]
-    ai_confidence: Optional[int]
+    ai_confidence: Optional[ConfidenceScore]
     created_at: datetime
     updated_at: Optional[datetime]
     confirmed_at: Optional[datetime]
     shipped_at: Optional[datetime]
     delivered_at: Optional[datetime]
     
+    model_config = FROZEN_ORM_CONFIG
+    
+    @field_validator("items", mode="before")
+    @classmethod
+    def parse_items(cls, value):
+        """Decode the stored JSON text before validating the line items."""
+        if isinstance(value, (str, bytes)):
+            return orjson.loads(value)
+        return value
+    
+    # Formatted amounts for clients that still read the decimal strings
+    @computed_field
+    @property
+    def subtotal(self) -> Optional[str]:
+        return format_cents(self.subtotal_cents)
+    
+    @computed_field
+    @property
+    def tax(self) -> Optional[str]:
+        return format_cents(self.tax_cents)
+    
+    @computed_field
+    @property
+    def shipping_cost(self) -> Optional[str]:
+        return format_cents(self.shipping_cost_cents)
+    
+    @computed_field
+    @property
+    def discount(self) -> Optional[str]:
+        return format_cents(self.discount_cents)
+    
+    @computed_field
+    @property
+    def total(self) -> str:
+        return format_cents(self.total_cents)
+    
+    @classmethod
+    def from_orm_trusted(cls, obj):
+        """Construct from a trusted ORM object, skipping validation."""
+        data = cls._orm_data(obj)
+        for name in ("subtotal_cents", "tax_cents", "shipping_cost_cents", "discount_cents", "total_cents"):
+            if name in data:
+                data[name] = to_cents(data[name])
+        if data.get("shipping") is not None:
+            data["shipping"] = ShippingAddress.model_construct(**data["shipping"])
+        if isinstance(data.get("items"), (str, bytes)):
+            data["items"] = OrderItemListAdapter.validate_json(data["items"])
+        return cls.model_construct(**data)
+
+
+class OrderSummary(TrustedORMModel):
+    """Lean order schema for list endpoints; use OrderResponse for detail."""
+    id: UuidStr
+    order_number: str
+    customer_name: Optional[str] = None
+    status: OrderStatusValue
+    source: OrderSourceValue
+    total_cents: Cents = Field(..., validation_alias="total")
+    currency: str
+    created_at: datetime
+    
     class Config:
         from_attributes = True
+    
+    # Same money format as OrderResponse
+    @computed_field
+    @property
+    def total(self) -> str:
+        return format_cents(self.total_cents)
+    
+    @classmethod
+    def from_orm_trusted(cls, obj):
+        """Construct from a trusted ORM object, skipping validation."""
+        data = cls._orm_data(obj)
+        if "total_cents" in data:
+            data["total_cents"] = to_cents(data["total_cents"])
+        return cls.model_construct(**data)
 
 
 class OrderListParams(BaseModel):
@@ -103,8 +211,13 @@ class OrderListParams(BaseModel):
     search: Optional[str] = None
     date_from: Optional[datetime] = None
     date_to: Optional[datetime] = None
-    page: int = Field(1, ge=1)
+    page: int = Field(1, ge=1, le=MAX_LIST_PAGE)
     page_size: int = Field(20, ge=1, le=100)
+    
+    @computed_field
+    @property
+    def offset(self) -> int:
+        return (self.page - 1) * self.page_size
 
 
 class OrderStats(BaseModel):
@@ -115,6 +228,27 @@ class OrderStats(BaseModel):
     shipped_orders: int
     delivered_orders: int
     cancelled_orders: int
-    total_revenue: Decimal
-    revenue_today: Decimal
-    average_order_value: Decimal
+    total_revenue_cents: Cents
+    revenue_today_cents: Cents
+    average_order_value_cents: Cents
+    
+    @computed_field
+    @property
+    def total_revenue(self) -> str:
+        return format_cents(self.total_revenue_cents)
+    
+    @computed_field
+    @property
+    def revenue_today(self) -> str:
+        return format_cents(self.revenue_today_cents)
+    
+    @computed_field
+    @property
+    def average_order_value(self) -> str:
+        return format_cents(self.average_order_value_cents)
+
+
+# ==========================================
+# LIST ADAPTERS
+# ==========================================
+OrderItemListAdapter = list_adapter(OrderItemBase)
@@ -5,9 +5,10 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, model_validator
 
 from app.models.user import AppRole
+from app.schemas.base import TrustedORMModel
 
 
 class UserBase(BaseModel):
@@ -22,9 +23,11 @@ class UserCreate(UserBase):
     password: str = Field(..., min_length=8, max_length=100)
     confirm_password: str = Field(..., min_length=8, max_length=100)
     
-    def validate_passwords_match(self) -> bool:
-        """Validate that passwords match."""
-        return self.password == self.confirm_password
+    @model_validator(mode="after")
+    def check_passwords_match(self) -> "UserCreate":
+        if self.password != self.confirm_password:
+            raise ValueError("Passwords do not match")
+        return self
 
 
 class UserUpdate(BaseModel):
@@ -34,7 +37,7 @@ class UserUpdate(BaseModel):
     avatar_url: Optional[str] = Field(None, max_length=500)
 
 
-class UserRoleResponse(BaseModel):
+class UserRoleResponse(TrustedORMModel):
     """User role response."""
     role: AppRole
     assigned_at: datetime
@@ -43,10 +46,10 @@ class UserRoleResponse(BaseModel):
         from_attributes = True
 
 
-class UserResponse(BaseModel):
+class UserResponse(TrustedORMModel):
     """User response schema."""
     id: UUID
-    email: EmailStr
+    email: str  # validated on the way in; no need to re-check on every read
     first_name: Optional[str]
     last_name: Optional[str]
     avatar_url: Optional[str]
@@ -59,6 +62,13 @@ class UserResponse(BaseModel):
     
     class Config:
         from_attributes = True
+    
+    @classmethod
+    def from_orm_trusted(cls, obj):
+        """Construct from a trusted ORM object, skipping validation."""
+        data = cls._orm_data(obj)
+        data["roles"] = [UserRoleResponse.from_orm_trusted(r) for r in data.get("roles", [])]
+        return cls.model_construct(**data)
 
 
 class UserInDB(UserBase):
@@ -79,3 +89,9 @@ class PasswordChange(BaseModel):
     current_password: str
     new_password: str = Field(..., min_length=8, max_length=100)
     confirm_new_password: str = Field(..., min_length=8, max_length=100)
+    
+    @model_validator(mode="after")
+    def check_passwords_match(self) -> "PasswordChange":
+        if self.new_password != self.confirm_new_password:
+            raise ValueError("New passwords do not match")
+        return self
@@ -2,21 +2,182 @@
 Advanced Features Service.
 Includes: Canned responses, Tags, Segments, White-label, Predictive analytics
 """
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+import asyncio
+import logging
+import time
+from concurrent.futures import Future
+from datetime import timedelta
+from itertools import chain
+from typing import Optional, List, Dict, Any, Set
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+import orjson
+from redis.exceptions import RedisError
+from sqlalchemy.orm import Session, load_only, raiseload
+from sqlalchemy import (
+    Text, and_, bindparam, case, cast, event, func, insert, literal_column, or_, select, update
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array, insert as pg_insert
 
+from app.core.cache import MISSING, TTLCache
+from app.db.redis import redis_service
 from app.models.advanced import (
     CannedResponse, CustomerTag, CustomerSegment, CustomerProfile,
     WhiteLabelSettings, PredictiveAnalytics, SentimentAnalysis
 )
 
+logger = logging.getLogger(__name__)
+
+# Encoded dashboard JSON per user, one hash field per `days` window; dropped
+# whenever a new sentiment analysis is stored. Each field carries its write
+# time, since the hash's own expiry is renewed by every field written.
+SENTIMENT_DASHBOARD_TTL = timedelta(minutes=5)
+
+
+def _sentiment_dashboard_key(user_id: UUID) -> str:
+    return f"sentiment_dashboard:{user_id}"
+
+
+# Session.info key: (loop, user ids) whose dashboards go stale on commit
+_STALE_DASHBOARDS_KEY = "stale_sentiment_dashboards"
+# Scheduled invalidations, held until they finish
+_pending_invalidations: Set[Future] = set()
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_dashboards(session: Session) -> None:
+    pending = session.info.pop(_STALE_DASHBOARDS_KEY, None)
+    if not pending:
+        return
+    loop, user_ids = pending
+    for user_id in user_ids:
+        future = asyncio.run_coroutine_threadsafe(
+            advanced_service.invalidate_sentiment_dashboard(user_id), loop
+        )
+        _pending_invalidations.add(future)
+        future.add_done_callback(_pending_invalidations.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_stale_dashboards(session: Session) -> None:
+    session.info.pop(_STALE_DASHBOARDS_KEY, None)
+
+
+# Branding is read on every branded page and changes rarely. Per process, so
+# other workers may serve a stale row for up to the TTL after an update.
+_white_label_cache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def _domain_dns_records(domain: str, user_id: UUID) -> List[Dict[str, str]]:
+    """DNS records a user must publish to verify a custom domain."""
+    return [
+        {"type": "CNAME", "name": domain, "value": "app.ghostworker.io"},
+        {"type": "TXT", "name": domain, "value": f"ghostworker-verify={user_id}"}
+    ]
+
+
+# Search predicates built once; the pattern is bound per call via .params(),
+# so every search shares one statement shape in SQLAlchemy's compiled cache.
+_CANNED_RESPONSE_SEARCH = or_(
+    CannedResponse.title.ilike(bindparam("search_pattern")),
+    CannedResponse.content.ilike(bindparam("search_pattern")),
+    CannedResponse.shortcut.ilike(bindparam("search_pattern"))
+)
+_CUSTOMER_PROFILE_SEARCH = or_(
+    CustomerProfile.name.ilike(bindparam("search_pattern")),
+    CustomerProfile.email.ilike(bindparam("search_pattern"))
+)
+
+# Columns each update_* method may write; anything else in `data` is ignored
+_CANNED_RESPONSE_FIELDS = frozenset({"title", "content", "shortcut", "category", "tags", "is_active"})
+_TAG_FIELDS = frozenset({"name", "color", "description"})
+_SEGMENT_FIELDS = frozenset({"name", "description", "rules", "is_dynamic"})
+_PROFILE_FIELDS = frozenset({"email", "phone", "name", "avatar_url", "attributes", "tags"})
+_WHITE_LABEL_FIELDS = frozenset({
+    "company_name", "logo_url", "favicon_url",
+    "primary_color", "secondary_color", "accent_color",
+    "custom_domain", "custom_from_email", "custom_from_name",
+    "custom_head_scripts", "custom_body_scripts", "hide_powered_by"
+})
+
+
+def _updatable(data: Dict[str, Any], allowed: frozenset) -> Dict[str, Any]:
+    """Whitelisted, non-null values from a partial update payload."""
+    return {key: value for key, value in data.items() if key in allowed and value is not None}
+
+# (field, operator) -> filter for segment rule conditions. Rules are
+# evaluated by Postgres; profile columns never come back to Python.
+_SEGMENT_RULE_FILTERS = {
+    ("total_spent", "greater_than"): lambda value: CustomerProfile.total_spent > value,
+    ("total_spent", "less_than"): lambda value: CustomerProfile.total_spent < value,
+    ("total_orders", "greater_than"): lambda value: CustomerProfile.total_orders > value,
+}
+
+
+def _segment_criteria(user_id: UUID, rules: Optional[dict]) -> List[Any]:
+    """WHERE clauses selecting the profiles a segment's rules match."""
+    criteria = [CustomerProfile.user_id == user_id]
+    for condition in (rules or {}).get("conditions", []):
+        build = _SEGMENT_RULE_FILTERS.get((condition.get("field"), condition.get("operator")))
+        if build is not None:
+            criteria.append(build(condition.get("value")))
+    return criteria
+
 
 class AdvancedFeaturesService:
     """Service for advanced features."""
     
+    def _bulk_create(
+        self,
+        db: Session,
+        model: Any,
+        user_id: UUID,
+        rows: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """Insert many rows in one multi-row INSERT ... RETURNING and commit once."""
+        if not rows:
+            return []
+        created = db.scalars(
+            insert(model).returning(model),
+            [{**row, "user_id": user_id} for row in rows]
+        ).all()
+        # RETURNING already loaded every column; detach so commit doesn't
+        # expire them and force a reload per row
+        for obj in created:
+            db.expunge(obj)
+        db.commit()
+        return created
+    
+    def _update_returning(
+        self,
+        db: Session,
+        model: Any,
+        row_id: UUID,
+        user_id: UUID,
+        values: Dict[str, Any],
+        *criteria: Any,
+        commit: bool = True
+    ) -> Optional[Any]:
+        """UPDATE ... RETURNING one owned row; None if no row matched.
+        
+        With no values the row is only read, so ownership is still checked.
+        """
+        if not values:
+            return db.query(model).filter(model.id == row_id, model.user_id == user_id).first()
+        
+        row = db.execute(
+            update(model)
+            .where(model.id == row_id, model.user_id == user_id, *criteria)
+            .values(**values)
+            .returning(model)
+        ).scalar_one_or_none()
+        # RETURNING loaded every column; detach so commit doesn't expire it
+        # and force a reload
+        if row is not None:
+            db.expunge(row)
+        if commit:
+            db.commit()
+        return row
+    
     # ==========================================
     # CANNED RESPONSES
     # ==========================================
@@ -38,11 +199,7 @@ class AdvancedFeaturesService:
             query = query.filter(CannedResponse.category == category)
         
         if search:
-            query = query.filter(
-                CannedResponse.title.ilike(f"%{search}%") |
-                CannedResponse.content.ilike(f"%{search}%") |
-                CannedResponse.shortcut.ilike(f"%{search}%")
-            )
+            query = query.filter(_CANNED_RESPONSE_SEARCH).params(search_pattern=f"%{search}%")
         
         return query.order_by(CannedResponse.usage_count.desc()).all()
     
@@ -59,6 +216,15 @@ class AdvancedFeaturesService:
         db.refresh(response)
         return response
     
+    def create_canned_responses_bulk(
+        self,
+        db: Session,
+        user_id: UUID,
+        rows: List[Dict[str, Any]]
+    ) -> List[CannedResponse]:
+        """Create many canned responses in one statement."""
+        return self._bulk_create(db, CannedResponse, user_id, rows)
+    
     def update_canned_response(
         self,
         db: Session,
@@ -67,19 +233,9 @@ class AdvancedFeaturesService:
         data: Dict[str, Any]
     ) -> Optional[CannedResponse]:
         """Update a canned response."""
-        response = db.query(CannedResponse).filter(
-            CannedResponse.id == response_id,
-            CannedResponse.user_id == user_id
-        ).first()
-        
-        if response:
-            for key, value in data.items():
-                if hasattr(response, key) and value is not None:
-                    setattr(response, key, value)
-            db.commit()
-            db.refresh(response)
-        
-        return response
+        return self._update_returning(
+            db, CannedResponse, response_id, user_id, _updatable(data, _CANNED_RESPONSE_FIELDS)
+        )
     
     def delete_canned_response(
         self,
@@ -106,16 +262,22 @@ class AdvancedFeaturesService:
         user_id: UUID
     ) -> Optional[CannedResponse]:
         """Mark canned response as used."""
-        response = db.query(CannedResponse).filter(
-            CannedResponse.id == response_id,
-            CannedResponse.user_id == user_id
-        ).first()
+        # Increment in SQL so concurrent uses are never lost
+        response = db.execute(
+            update(CannedResponse)
+            .where(
+                CannedResponse.id == response_id,
+                CannedResponse.user_id == user_id
+            )
+            .values(
+                usage_count=CannedResponse.usage_count + 1,
+                last_used=func.now()
+            )
+            .returning(CannedResponse)
+        ).scalar_one_or_none()
         
         if response:
-            response.usage_count += 1
-            response.last_used = datetime.utcnow()
             db.commit()
-            db.refresh(response)
         
         return response
     
@@ -142,6 +304,15 @@ class AdvancedFeaturesService:
         db.refresh(tag)
         return tag
     
+    def create_tags_bulk(
+        self,
+        db: Session,
+        user_id: UUID,
+        rows: List[Dict[str, Any]]
+    ) -> List[CustomerTag]:
+        """Create many tags in one statement."""
+        return self._bulk_create(db, CustomerTag, user_id, rows)
+    
     def update_tag(
         self,
         db: Session,
@@ -150,19 +321,9 @@ class AdvancedFeaturesService:
         data: Dict[str, Any]
     ) -> Optional[CustomerTag]:
         """Update a tag."""
-        tag = db.query(CustomerTag).filter(
-            CustomerTag.id == tag_id,
-            CustomerTag.user_id == user_id
-        ).first()
-        
-        if tag:
-            for key, value in data.items():
-                if hasattr(tag, key) and value is not None:
-                    setattr(tag, key, value)
-            db.commit()
-            db.refresh(tag)
-        
-        return tag
+        return self._update_returning(
+            db, CustomerTag, tag_id, user_id, _updatable(data, _TAG_FIELDS)
+        )
     
     def delete_tag(self, db: Session, tag_id: UUID, user_id: UUID) -> bool:
         """Delete a tag."""
@@ -200,6 +361,15 @@ class AdvancedFeaturesService:
         db.refresh(segment)
         return segment
     
+    def create_segments_bulk(
+        self,
+        db: Session,
+        user_id: UUID,
+        rows: List[Dict[str, Any]]
+    ) -> List[CustomerSegment]:
+        """Create many segments in one statement."""
+        return self._bulk_create(db, CustomerSegment, user_id, rows)
+    
     def update_segment(
         self,
         db: Session,
@@ -208,19 +378,9 @@ class AdvancedFeaturesService:
         data: Dict[str, Any]
     ) -> Optional[CustomerSegment]:
         """Update a segment."""
-        segment = db.query(CustomerSegment).filter(
-            CustomerSegment.id == segment_id,
-            CustomerSegment.user_id == user_id
-        ).first()
-        
-        if segment:
-            for key, value in data.items():
-                if hasattr(segment, key) and value is not None:
-                    setattr(segment, key, value)
-            db.commit()
-            db.refresh(segment)
-        
-        return segment
+        return self._update_returning(
+            db, CustomerSegment, segment_id, user_id, _updatable(data, _SEGMENT_FIELDS)
+        )
     
     def delete_segment(self, db: Session, segment_id: UUID, user_id: UUID) -> bool:
         """Delete a segment."""
@@ -250,42 +410,30 @@ class AdvancedFeaturesService:
         if not segment:
             return None
         
-        # Apply rules to find matching customers
-        # This is a simplified implementation
-        query = db.query(CustomerProfile).filter(
-            CustomerProfile.user_id == user_id
+        criteria = _segment_criteria(user_id, segment.rules)
+        
+        # count(*) rather than count(id): the id never needs fetching, so
+        # rules on indexed columns can be counted from the index alone
+        segment.customer_count = db.query(func.count()).select_from(CustomerProfile).filter(
+            *criteria
+        ).scalar()
+        segment.last_computed = func.now()
+        
+        # Tag matching profiles server-side; no profile rows are loaded
+        db.execute(
+            update(CustomerProfile)
+            .where(
+                *criteria,
+                or_(
+                    CustomerProfile.segments.is_(None),
+                    ~CustomerProfile.segments.contains([segment.id])
+                )
+            )
+            .values(segments=func.array_append(CustomerProfile.segments, segment.id))
+            .execution_options(synchronize_session=False)
         )
         
-        rules = segment.rules or {}
-        conditions = rules.get("conditions", [])
-        
-        for condition in conditions:
-            field = condition.get("field")
-            op = condition.get("operator")
-            value = condition.get("value")
-            
-            if field == "total_spent":
-                if op == "greater_than":
-                    query = query.filter(CustomerProfile.total_spent > value)
-                elif op == "less_than":
-                    query = query.filter(CustomerProfile.total_spent < value)
-            elif field == "total_orders":
-                if op == "greater_than":
-                    query = query.filter(CustomerProfile.total_orders > value)
-        
-        matching_profiles = query.all()
-        
-        # Update segment membership
-        segment.customer_count = len(matching_profiles)
-        segment.last_computed = datetime.utcnow()
-        
-        # Update customer profiles with segment ID
-        for profile in matching_profiles:
-            if segment.id not in (profile.segments or []):
-                profile.segments = (profile.segments or []) + [segment.id]
-        
         db.commit()
-        db.refresh(segment)
         return segment
     
     # ==========================================
@@ -314,10 +462,7 @@ class AdvancedFeaturesService:
             query = query.filter(CustomerProfile.segments.contains([segment_id]))
         
         if search:
-            query = query.filter(
-                CustomerProfile.name.ilike(f"%{search}%") |
-                CustomerProfile.email.ilike(f"%{search}%")
-            )
+            query = query.filter(_CUSTOMER_PROFILE_SEARCH).params(search_pattern=f"%{search}%")
         
         return query.order_by(CustomerProfile.last_seen.desc()).offset(offset).limit(limit).all()
     
@@ -341,16 +486,9 @@ class AdvancedFeaturesService:
         data: Dict[str, Any]
     ) -> Optional[CustomerProfile]:
         """Update customer profile."""
-        profile = self.get_customer_profile(db, profile_id, user_id)
-        
-        if profile:
-            for key, value in data.items():
-                if hasattr(profile, key) and value is not None:
-                    setattr(profile, key, value)
-            db.commit()
-            db.refresh(profile)
-        
-        return profile
+        return self._update_returning(
+            db, CustomerProfile, profile_id, user_id, _updatable(data, _PROFILE_FIELDS)
+        )
     
     def add_tag_to_customer(
         self,
@@ -360,19 +498,23 @@ class AdvancedFeaturesService:
         user_id: UUID
     ) -> Optional[CustomerProfile]:
         """Add tag to customer profile."""
-        profile = self.get_customer_profile(db, profile_id, user_id)
-        
-        if profile:
-            if tag_id not in (profile.tags or []):
-                profile.tags = (profile.tags or []) + [tag_id]
-                
-                # Update tag usage count
-                tag = db.query(CustomerTag).filter(CustomerTag.id == tag_id).first()
-                if tag:
-                    tag.usage_count += 1
-                
-                db.commit()
-                db.refresh(profile)
+        profile = self._update_returning(
+            db, CustomerProfile, profile_id, user_id,
+            {"tags": func.array_append(CustomerProfile.tags, tag_id)},
+            or_(CustomerProfile.tags.is_(None), ~CustomerProfile.tags.contains([tag_id])),
+            commit=False
+        )
+        
+        if not profile:
+            # Unknown profile, or it already carries the tag
+            return self.get_customer_profile(db, profile_id, user_id)
+        
+        db.execute(
+            update(CustomerTag)
+            .where(CustomerTag.id == tag_id, CustomerTag.user_id == user_id)
+            .values(usage_count=CustomerTag.usage_count + 1)
+        )
+        db.commit()
         
         return profile
     
@@ -384,12 +526,23 @@ class AdvancedFeaturesService:
         user_id: UUID
     ) -> Optional[CustomerProfile]:
         """Remove tag from customer profile."""
-        profile = self.get_customer_profile(db, profile_id, user_id)
+        profile = self._update_returning(
+            db, CustomerProfile, profile_id, user_id,
+            {"tags": func.array_remove(CustomerProfile.tags, tag_id)},
+            CustomerProfile.tags.contains([tag_id]),
+            commit=False
+        )
         
-        if profile and profile.tags:
-            profile.tags = [t for t in profile.tags if t != tag_id]
-            db.commit()
-            db.refresh(profile)
+        if not profile:
+            # Unknown profile, or it never carried the tag
+            return self.get_customer_profile(db, profile_id, user_id)
+        
+        db.execute(
+            update(CustomerTag)
+            .where(CustomerTag.id == tag_id, CustomerTag.user_id == user_id)
+            .values(usage_count=func.greatest(CustomerTag.usage_count - 1, 0))
+        )
+        db.commit()
         
         return profile
     
@@ -407,25 +560,41 @@ class AdvancedFeaturesService:
             WhiteLabelSettings.user_id == user_id
         ).first()
     
+    def get_white_label_settings_cached(
+        self,
+        db: Session,
+        user_id: UUID
+    ) -> Optional[WhiteLabelSettings]:
+        """Read-only white label settings, served from the in-process cache.
+        
+        The returned row is detached; use get_white_label_settings to modify it.
+        """
+        settings = _white_label_cache.get(user_id, MISSING)
+        if settings is MISSING:
+            settings = self.get_white_label_settings(db, user_id)
+            if settings is not None:
+                db.expunge(settings)
+            _white_label_cache.set(user_id, settings)
+        return settings
+    
     def update_white_label_settings(
         self,
         db: Session,
         user_id: UUID,
         data: Dict[str, Any]
     ) -> WhiteLabelSettings:
-        """Update white label settings."""
-        settings = self.get_white_label_settings(db, user_id)
-        
-        if not settings:
-            settings = WhiteLabelSettings(user_id=user_id, **data)
-            db.add(settings)
-        else:
-            for key, value in data.items():
-                if hasattr(settings, key):
-                    setattr(settings, key, value)
-        
+        """Create or update white label settings in one upsert."""
+        values = {key: value for key, value in data.items() if key in _WHITE_LABEL_FIELDS}
+        stmt = pg_insert(WhiteLabelSettings).values(user_id=user_id, **values)
+        settings = db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[WhiteLabelSettings.user_id],
+                set_={**values, "updated_at": func.now()}
+            ).returning(WhiteLabelSettings)
+        ).scalar_one()
+        db.expunge(settings)
         db.commit()
-        db.refresh(settings)
+        _white_label_cache.pop(user_id)
         return settings
     
     def verify_domain(
@@ -442,22 +611,17 @@ class AdvancedFeaturesService:
             # Simulate DNS verification
             settings.domain_verified = True
             db.commit()
+            _white_label_cache.pop(user_id)
             
             return {
                 "verified": True,
-                "dns_records": [
-                    {"type": "CNAME", "name": domain, "value": "app.ghostworker.io"},
-                    {"type": "TXT", "name": domain, "value": f"ghostworker-verify={user_id}"}
-                ],
+                "dns_records": _domain_dns_records(domain, user_id),
                 "message": "Domain verified successfully"
             }
         
         return {
             "verified": False,
-            "dns_records": [
-                {"type": "CNAME", "name": domain, "value": "app.ghostworker.io"},
-                {"type": "TXT", "name": domain, "value": f"ghostworker-verify={user_id}"}
-            ],
+            "dns_records": _domain_dns_records(domain, user_id),
             "message": "Please add the DNS records and try again"
         }
     
@@ -472,37 +636,36 @@ class AdvancedFeaturesService:
         days: int = 30
     ) -> Dict[str, Any]:
         """Get sentiment analysis dashboard data."""
-        start_date = datetime.utcnow() - timedelta(days=days)
+        day = SentimentAnalysis.analyzed_date
         
-        # Get sentiment distribution
-        sentiments = db.query(
+        # One scan, grouped by (day, sentiment); the distribution, overall
+        # average and daily trend are all folded from these few rows.
+        rows = db.query(
+            day.label("date"),
             SentimentAnalysis.sentiment,
-            func.count(SentimentAnalysis.id)
+            func.count().label("analyses"),
+            func.count(SentimentAnalysis.score).label("scored"),
+            func.sum(SentimentAnalysis.score).label("score_sum")
         ).filter(
             SentimentAnalysis.user_id == user_id,
-            SentimentAnalysis.analyzed_at >= start_date
-        ).group_by(SentimentAnalysis.sentiment).all()
+            SentimentAnalysis.analyzed_at >= func.now() - timedelta(days=days)
+        ).group_by(day, SentimentAnalysis.sentiment).order_by(day).all()
         
-        distribution = {s[0]: s[1] for s in sentiments}
-        total = sum(distribution.values()) or 1
+        distribution: Dict[str, int] = {}
+        daily: Dict[Any, List[float]] = {}
+        scored_total = 0
+        score_total = 0.0
         
-        # Calculate average score
-        avg_score = db.query(func.avg(SentimentAnalysis.score)).filter(
-            SentimentAnalysis.user_id == user_id,
-            SentimentAnalysis.analyzed_at >= start_date
-        ).scalar() or 0
-        
-        # Get trend (daily averages)
-        from sqlalchemy import cast, Date
-        trend = db.query(
-            cast(SentimentAnalysis.analyzed_at, Date).label('date'),
-            func.avg(SentimentAnalysis.score).label('avg_score')
-        ).filter(
-            SentimentAnalysis.user_id == user_id,
-            SentimentAnalysis.analyzed_at >= start_date
-        ).group_by(
-            cast(SentimentAnalysis.analyzed_at, Date)
-        ).order_by('date').all()
+        for row in rows:
+            distribution[row.sentiment] = distribution.get(row.sentiment, 0) + row.analyses
+            if row.scored:
+                day_totals = daily.setdefault(row.date, [0.0, 0])
+                day_totals[0] += float(row.score_sum)
+                day_totals[1] += row.scored
+                score_total += float(row.score_sum)
+                scored_total += row.scored
+        
+        avg_score = score_total / scored_total if scored_total else 0
         
         # Determine overall sentiment
         if avg_score > 0.3:
@@ -517,14 +680,61 @@ class AdvancedFeaturesService:
             "average_score": float(avg_score),
             "sentiment_distribution": distribution,
             "sentiment_trend": [
-                {"date": str(t.date), "score": float(t.avg_score)}
-                for t in trend
+                {"date": str(date), "score": score_sum / scored}
+                for date, (score_sum, scored) in daily.items()
             ],
             "top_emotions": {},  # Would aggregate from emotions column
             "top_keywords": [],  # Would aggregate from keywords column
             "top_topics": []     # Would aggregate from topics column
         }
     
+    async def get_sentiment_dashboard_cached(
+        self,
+        db: Session,
+        user_id: UUID,
+        days: int = 30
+    ) -> str:
+        """Sentiment dashboard as encoded JSON, served from Redis when fresh."""
+        key = _sentiment_dashboard_key(user_id)
+        try:
+            cached = await redis_service.hget(key, str(days))
+        except RedisError:
+            logger.warning("Sentiment dashboard cache unavailable; computing uncached", exc_info=True)
+            cached = None
+        
+        if cached is not None:
+            written_at, _, encoded = cached.partition(":")
+            if (
+                written_at.isdigit()
+                and time.time() - int(written_at) < SENTIMENT_DASHBOARD_TTL.total_seconds()
+            ):
+                return encoded
+        
+        dashboard = await asyncio.to_thread(self.get_sentiment_dashboard, db, user_id, days)
+        encoded = orjson.dumps(dashboard).decode()
+        try:
+            await redis_service.hset(
+                key, str(days), f"{int(time.time())}:{encoded}", SENTIMENT_DASHBOARD_TTL
+            )
+        except RedisError:
+            logger.warning("Failed to cache sentiment dashboard", exc_info=True)
+        return encoded
+    
+    async def invalidate_sentiment_dashboard(self, user_id: UUID) -> None:
+        """Drop cached dashboards after new sentiment data lands."""
+        try:
+            await redis_service.delete(_sentiment_dashboard_key(user_id))
+        except RedisError:
+            # Stale for at most SENTIMENT_DASHBOARD_TTL
+            logger.warning("Failed to invalidate sentiment dashboard", exc_info=True)
+    
+    def invalidate_sentiment_dashboard_on_commit(self, db: Session, user_id: UUID) -> None:
+        """Drop cached dashboards once `db` commits, for writes left to the caller's commit."""
+        loop, user_ids = db.info.setdefault(
+            _STALE_DASHBOARDS_KEY, (asyncio.get_running_loop(), set())
+        )
+        user_ids.add(user_id)
+    
     # ==========================================
     # PREDICTIVE ANALYTICS
     # ==========================================
@@ -536,9 +746,24 @@ class AdvancedFeaturesService:
         prediction_type: Optional[str] = None
     ) -> List[PredictiveAnalytics]:
         """Get predictions for user."""
-        query = db.query(PredictiveAnalytics).filter(
+        # Only what PredictiveAnalyticsResponse serialises
+        query = db.query(PredictiveAnalytics).options(
+            load_only(
+                PredictiveAnalytics.id,
+                PredictiveAnalytics.prediction_type,
+                PredictiveAnalytics.entity_type,
+                PredictiveAnalytics.entity_id,
+                PredictiveAnalytics.prediction_value,
+                PredictiveAnalytics.confidence,
+                PredictiveAnalytics.factors,
+                PredictiveAnalytics.prediction_date,
+                PredictiveAnalytics.valid_until,
+                PredictiveAnalytics.created_at,
+            ),
+            raiseload("*")
+        ).filter(
             PredictiveAnalytics.user_id == user_id,
-            PredictiveAnalytics.valid_until >= datetime.utcnow()
+            PredictiveAnalytics.valid_until >= func.now()
         )
         
         if prediction_type:
@@ -546,64 +771,94 @@ class AdvancedFeaturesService:
         
         return query.order_by(PredictiveAnalytics.prediction_date.desc()).all()
     
+    def _prediction_list_json(
+        self,
+        user_id: UUID,
+        prediction_type: str,
+        limit: int,
+        sort_key: Any,
+        fields: Dict[str, Any]
+    ) -> Any:
+        """JSON array of the top `limit` active predictions of one type, by `sort_key` desc."""
+        top = select(
+            sort_key.label("sort_key"),
+            *(column.label(name) for name, column in fields.items())
+        ).where(
+            PredictiveAnalytics.user_id == user_id,
+            PredictiveAnalytics.valid_until >= func.now(),
+            PredictiveAnalytics.prediction_type == prediction_type
+        ).order_by(sort_key.desc()).limit(limit).subquery()
+        
+        item = func.json_build_object(*chain.from_iterable((name, top.c[name]) for name in fields))
+        return select(func.coalesce(
+            func.json_agg(aggregate_order_by(item, top.c.sort_key.desc())),
+            literal_column("'[]'::json")
+        )).scalar_subquery()
+    
     def get_prediction_dashboard(
         self,
         db: Session,
         user_id: UUID
-    ) -> Dict[str, Any]:
-        """Get predictive analytics dashboard."""
-        predictions = self.get_predictions(db, user_id)
-        
-        churn = [p for p in predictions if p.prediction_type == "churn"]
-        conversion = [p for p in predictions if p.prediction_type == "conversion"]
-        volume = [p for p in predictions if p.prediction_type == "volume"]
-        sentiment = [p for p in predictions if p.prediction_type == "sentiment_trend"]
-        
-        insights = []
-        
-        # Generate insights based on predictions
-        high_churn = [p for p in churn if p.prediction_value > 0.7]
-        if high_churn:
-            insights.append(f"{len(high_churn)} customers at high risk of churn")
-        
-        high_conversion = [p for p in conversion if p.prediction_value > 0.6]
-        if high_conversion:
-            insights.append(f"{len(high_conversion)} leads likely to convert")
+    ) -> str:
+        """Get predictive analytics dashboard, encoded as JSON by Postgres."""
+        # Highest-scoring entities first; forecasts newest first
+        churn = self._prediction_list_json(
+            user_id, "churn", 10, PredictiveAnalytics.prediction_value, {
+                "entity_id": PredictiveAnalytics.entity_id,
+                "risk": PredictiveAnalytics.prediction_value,
+                "confidence": PredictiveAnalytics.confidence,
+                "factors": PredictiveAnalytics.factors
+            }
+        )
+        conversion = self._prediction_list_json(
+            user_id, "conversion", 10, PredictiveAnalytics.prediction_value, {
+                "entity_id": PredictiveAnalytics.entity_id,
+                "likelihood": PredictiveAnalytics.prediction_value,
+                "confidence": PredictiveAnalytics.confidence
+            }
+        )
+        volume = self._prediction_list_json(
+            user_id, "volume", 30, PredictiveAnalytics.prediction_date, {
+                "date": PredictiveAnalytics.prediction_date,
+                "predicted_volume": PredictiveAnalytics.prediction_value
+            }
+        )
+        sentiment = self._prediction_list_json(
+            user_id, "sentiment_trend", 30, PredictiveAnalytics.prediction_date, {
+                "date": PredictiveAnalytics.prediction_date,
+                "predicted_sentiment": PredictiveAnalytics.prediction_value
+            }
+        )
         
-        return {
-            "churn_predictions": [
-                {
-                    "entity_id": str(p.entity_id),
-                    "risk": float(p.prediction_value),
-                    "confidence": float(p.confidence),
-                    "factors": p.factors
-                }
-                for p in churn[:10]
-            ],
-            "conversion_predictions": [
-                {
-                    "entity_id": str(p.entity_id),
-                    "likelihood": float(p.prediction_value),
-                    "confidence": float(p.confidence)
-                }
-                for p in conversion[:10]
-            ],
-            "volume_forecast": [
-                {
-                    "date": str(p.prediction_date),
-                    "predicted_volume": float(p.prediction_value)
-                }
-                for p in volume[:30]
-            ],
-            "sentiment_trend": [
-                {
-                    "date": str(p.prediction_date),
-                    "predicted_sentiment": float(p.prediction_value)
-                }
-                for p in sentiment[:30]
-            ],
-            "key_insights": insights
-        }
+        # Insight counts cover every active prediction, not just the top rows
+        counts = select(
+            func.count().filter(and_(
+                PredictiveAnalytics.prediction_type == "churn",
+                PredictiveAnalytics.prediction_value > 0.7
+            )).label("high_churn"),
+            func.count().filter(and_(
+                PredictiveAnalytics.prediction_type == "conversion",
+                PredictiveAnalytics.prediction_value > 0.6
+            )).label("high_conversion")
+        ).where(
+            PredictiveAnalytics.user_id == user_id,
+            PredictiveAnalytics.valid_until >= func.now()
+        ).subquery()
+        
+        insights = func.array_to_json(func.array_remove(array([
+            case((counts.c.high_churn > 0,
+                  func.concat(counts.c.high_churn, " customers at high risk of churn"))),
+            case((counts.c.high_conversion > 0,
+                  func.concat(counts.c.high_conversion, " leads likely to convert")))
+        ]), None))
+        
+        return db.scalar(select(cast(func.json_build_object(
+            "churn_predictions", churn,
+            "conversion_predictions", conversion,
+            "volume_forecast", volume,
+            "sentiment_trend", sentiment,
+            "key_insights", insights
+        ), Text)).select_from(counts))
 
 
 # Singleton instance
@@ -2,18 +2,292 @@
 AI Service for GPT-4 powered features.
 Includes: summaries, sentiment analysis, translations, auto-responses
 """
-import json
+import asyncio
 import hashlib
-from datetime import datetime
-from typing import Optional, List, Dict, Any
-from uuid import UUID
+import io
+import logging
+import random
+import re
+import tempfile
+import time
+from datetime import timedelta
+from operator import itemgetter
+from typing import Optional, List, Dict, Any, AsyncIterator, BinaryIO, Callable, Tuple, TypeVar
+from uuid import UUID, uuid4
 import httpx
+import orjson
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from app.core.cache import MISSING, TTLCache
 from app.core.config import settings
+from app.db.redis import redis_service
 from app.models.advanced import (
     AISummary, SentimentAnalysis, VoiceTranscription, AISettings
 )
+from app.schemas.advanced import (
+    AISummaryCompletion, SentimentCompletion, AITranslateResponse
+)
+from app.services.advanced_service import advanced_service
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Concurrent OpenAI requests per process, to stay inside the account rate limit
+OPENAI_MAX_CONCURRENCY = 20
+
+# Rate limits and transient upstream errors are retried with jittered
+# exponential backoff (or the server's Retry-After); anything else fails fast
+OPENAI_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+OPENAI_MAX_ATTEMPTS = 5
+OPENAI_MAX_BACKOFF = 30.0
+
+# Conversation budget for summaries, in characters (~4 per token, so about
+# 6k tokens): leaves room in gpt-4's 8k context for the prompt and reply
+SUMMARY_INPUT_CHARS = 24_000
+# Share of the budget kept from the start of the conversation; the rest
+# goes to the most recent messages
+SUMMARY_HEAD_CHARS = 2_000
+
+# AI settings are read on every generated reply and change rarely. Per
+# process, so other workers may use stale settings for up to the TTL.
+_ai_settings_cache = TTLCache(maxsize=10_000, ttl=60)
+
+# Audio up to this size is buffered in memory on its way to Whisper; larger
+# files spill to a temp file instead of being held as one bytes object. Disk
+# writes and reads (including while streaming the upload) go through
+# asyncio.to_thread so a long clip never blocks the event loop.
+AUDIO_SPOOL_BYTES = 4 * 1024 * 1024
+UPLOAD_CHUNK_BYTES = 64 * 1024
+
+# Fixed prompt text, filled with str.format per call
+_SUMMARY_SYSTEM = "You are an expert conversation analyst. Always respond in valid JSON."
+_SUMMARY_PROMPT = """Analyze this conversation and provide:
+1. A concise summary (2-3 sentences)
+2. Key points (bullet points)
+3. Action items if any
+4. Overall sentiment (positive/neutral/negative)
+5. Detected language
+
+Conversation:
+{conversation_text}
+
+Respond in JSON format:
+{{
+    "summary": "...",
+    "key_points": ["...", "..."],
+    "action_items": ["...", "..."],
+    "sentiment": "positive|neutral|negative",
+    "sentiment_score": 0.0 to 1.0 (-1 to 1),
+    "sentiment_breakdown": {{"positive": 0.0, "neutral": 0.0, "negative": 0.0}},
+    "language": "en"
+}}"""
+
+_SENTIMENT_SYSTEM = "You are a sentiment analysis expert. Always respond in valid JSON."
+_SENTIMENT_PROMPT = """Analyze the sentiment of this text:
+
+"{text}"
+
+Respond in JSON format:
+{{
+    "sentiment": "positive|neutral|negative",
+    "score": -1.0 to 1.0,
+    "confidence": 0.0 to 1.0,
+    "emotions": {{"joy": 0.0, "anger": 0.0, "sadness": 0.0, "fear": 0.0, "surprise": 0.0}},
+    "keywords": ["keyword1", "keyword2"],
+    "topics": ["topic1", "topic2"]
+}}"""
+
+_TRANSLATE_SYSTEM = "You are a translation expert. Always respond in valid JSON."
+_TRANSLATE_PROMPT = """Translate the following text to {target_language}:
+
+"{text}"
+
+Respond in JSON format:
+{{
+    "translated_text": "...",
+    "source_language": "detected language code",
+    "target_language": "{target_language}",
+    "confidence": 0.0 to 1.0
+}}"""
+
+# Texts shorter than this (empty, "ok", a lone emoji) or made only of links
+# carry too little to analyse or translate, and skip the model call
+MIN_SENTIMENT_CHARS = 3
+_URLS_ONLY = re.compile(r"(?:(?:https?://|www\.)\S+\s*)+")
+
+
+def _is_trivial(text: str) -> bool:
+    """Empty, too short, or nothing but URLs (text already stripped)."""
+    return len(text) < MIN_SENTIMENT_CHARS or _URLS_ONLY.fullmatch(text) is not None
+
+
+def _trivial_sentiment() -> Dict[str, Any]:
+    """Neutral SentimentAnalysis columns; fresh per call, as rows keep the containers."""
+    return {
+        "sentiment": "neutral",
+        "score": 0.0,
+        "confidence": 1.0,
+        "emotions": {},
+        "keywords": [],
+        "topics": [],
+        "model_used": "rules"
+    }
+
+# Completions for byte-identical prompts are reused for this long. Sampling
+# is low-temperature, and the same text gives the same answer in practice.
+SUMMARY_CACHE_TTL = timedelta(days=1)
+SENTIMENT_CACHE_TTL = timedelta(days=7)
+TRANSLATION_CACHE_TTL = timedelta(days=30)
+
+# Collected sentiment batches are remembered this long (OpenAI keeps batch
+# output files for 30 days), so a re-run can't store the results twice
+SENTIMENT_BATCH_CLAIM_TTL = timedelta(days=30)
+
+
+def _sentiment_request(text: str) -> Dict[str, Any]:
+    """Chat completion body for one sentiment analysis."""
+    # Whitespace carries no sentiment; collapsing it lets re-sent or
+    # re-pasted messages share one cached completion
+    text = " ".join(text.split())
+    prompt = _SENTIMENT_PROMPT.format(text=text)
+    
+    return {
+        "model": settings.SENTIMENT_MODEL,
+        "messages": [
+            {"role": "system", "content": _SENTIMENT_SYSTEM},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.2,
+        "max_tokens": 500,
+        "response_format": {"type": "json_object"}
+    }
+
+
+def _response_request(
+    ai_settings: Optional[AISettings],
+    conversation_context: List[Dict[str, str]],
+    customer_message: str
+) -> Dict[str, Any]:
+    """Chat completion body for a support reply, per the user's AI settings."""
+    system_prompt = ai_settings.system_prompt if ai_settings else (
+        "You are a helpful customer support assistant. Be concise and professional."
+    )
+    
+    messages = [{"role": "system", "content": system_prompt}]
+    
+    # Add conversation context
+    for msg in conversation_context[-10:]:  # Last 10 messages
+        role = "assistant" if msg["sender_type"] in ["agent", "ai"] else "user"
+        messages.append({"role": role, "content": msg["content"]})
+    
+    # Add current message
+    messages.append({"role": "user", "content": customer_message})
+    
+    return {
+        "model": ai_settings.model if ai_settings else "gpt-4",
+        "messages": messages,
+        "temperature": float(ai_settings.temperature) if ai_settings else 0.7,
+        "max_tokens": ai_settings.max_tokens if ai_settings else 500
+    }
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """Seconds to wait before retry `attempt + 1`."""
+    if response is not None:
+        try:
+            return min(float(response.headers["retry-after"]), OPENAI_MAX_BACKOFF)
+        except (KeyError, ValueError):
+            pass
+    return random.uniform(0.5, 1.0) * min(2.0 ** (attempt - 1), OPENAI_MAX_BACKOFF)
+
+
+def _fit_conversation(lines: List[str]) -> str:
+    """Join conversation lines, dropping middle messages past the summary budget."""
+    if sum(len(line) + 1 for line in lines) <= SUMMARY_INPUT_CHARS:
+        return "\n".join(lines)
+    
+    head: List[str] = []
+    used = 0
+    for line in lines:
+        if used + len(line) + 1 > SUMMARY_HEAD_CHARS:
+            break
+        head.append(line)
+        used += len(line) + 1
+    
+    tail: List[str] = []
+    for line in reversed(lines[len(head):]):
+        if used + len(line) + 1 > SUMMARY_INPUT_CHARS:
+            break
+        tail.append(line)
+        used += len(line) + 1
+    tail.reverse()
+    
+    omitted = len(lines) - len(head) - len(tail)
+    return "\n".join([*head, f"[... {omitted} messages omitted ...]", *tail])
+
+
+def _spill_to_disk(buffer: io.BytesIO) -> BinaryIO:
+    """Move buffered audio into an anonymous temp file (blocking)."""
+    spilled = tempfile.TemporaryFile()
+    spilled.write(buffer.getvalue())
+    buffer.close()
+    return spilled
+
+
+def _multipart_head(boundary: str, fields: Dict[str, Any], filename: str, content_type: str) -> bytes:
+    """Encode form fields plus the file part header; list values repeat the field."""
+    parts = []
+    for name, value in fields.items():
+        for item in value if isinstance(value, list) else (value,):
+            parts.append(
+                f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{item}\r\n'
+            )
+    parts.append(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    )
+    return "".join(parts).encode()
+
+
+async def _multipart_body(head: bytes, file: BinaryIO, on_disk: bool, tail: bytes) -> AsyncIterator[bytes]:
+    """Stream a multipart body, reading a spilled temp file off the event loop."""
+    yield head
+    while True:
+        if on_disk:
+            chunk = await asyncio.to_thread(file.read, UPLOAD_CHUNK_BYTES)
+        else:
+            chunk = file.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        yield chunk
+    yield tail
+
+
+def _parse_content(schema):
+    """Parser for a chat completion whose message content is `schema` JSON."""
+    def parse(response: Dict[str, Any]):
+        return schema.model_validate_json(response["choices"][0]["message"]["content"])
+    return parse
+
+
+def _sentiment_values(response: Dict[str, Any]) -> Dict[str, Any]:
+    """SentimentAnalysis columns from a chat completion."""
+    result = SentimentCompletion.model_validate_json(
+        response["choices"][0]["message"]["content"]
+    )
+    return {
+        "sentiment": result.sentiment,
+        "score": result.score,
+        "confidence": result.confidence,
+        "emotions": result.emotions,
+        "keywords": result.keywords,
+        "topics": result.topics,
+        "model_used": settings.SENTIMENT_MODEL
+    }
 
 
 class AIService:
@@ -22,6 +296,20 @@ class AIService:
     def __init__(self):
         self.openai_api_key = getattr(settings, 'OPENAI_API_KEY', '')
         self.openai_base_url = "https://api.openai.com/v1"
+        # One pooled client for the process so calls reuse warm TLS
+        # connections. Auth is sent per request because the same client
+        # also downloads audio from arbitrary URLs.
+        self._client = httpx.AsyncClient(
+            base_url=self.openai_base_url,
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+        self._openai_slots = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+        self._inflight: Dict[str, asyncio.Task] = {}
+    
+    async def close(self) -> None:
+        """Close pooled connections on shutdown."""
+        await self._client.aclose()
     
     async def _call_openai(
         self, 
@@ -29,88 +317,195 @@ class AIService:
         payload: Dict[str, Any],
         timeout: float = 60.0
     ) -> Dict[str, Any]:
-        """Make a request to OpenAI API."""
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                f"{self.openai_base_url}/{endpoint}",
+        """Make a request to OpenAI API, retrying rate limits and transient errors."""
+        body = orjson.dumps(payload)
+        
+        for attempt in range(1, OPENAI_MAX_ATTEMPTS + 1):
+            try:
+                async with self._openai_slots:
+                    response = await self._client.post(
+                        f"/{endpoint}",
+                        headers={
+                            "Authorization": f"Bearer {self.openai_api_key}",
+                            "Content-Type": "application/json"
+                        },
+                        content=body,
+                        timeout=timeout
+                    )
+            except httpx.TransportError:
+                if attempt == OPENAI_MAX_ATTEMPTS:
+                    raise
+                delay = _retry_delay(attempt)
+            else:
+                if response.status_code not in OPENAI_RETRY_STATUSES or attempt == OPENAI_MAX_ATTEMPTS:
+                    response.raise_for_status()
+                    return orjson.loads(response.content)
+                delay = _retry_delay(attempt, response)
+            
+            # Sleep outside the semaphore so waiting calls don't hold a slot
+            logger.warning("OpenAI %s attempt %d failed; retrying in %.1fs", endpoint, attempt, delay)
+            await asyncio.sleep(delay)
+    
+    async def _call_openai_stream(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        timeout: float = 60.0
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion, yielding content deltas as they arrive."""
+        async with self._openai_slots:
+            async with self._client.stream(
+                "POST",
+                f"/{endpoint}",
                 headers={
                     "Authorization": f"Bearer {self.openai_api_key}",
                     "Content-Type": "application/json"
                 },
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+                content=orjson.dumps({**payload, "stream": True}),
+                timeout=timeout
+            ) as response:
+                response.raise_for_status()
+                # Server-sent events: one `data: {chunk}` line per delta
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[len("data: "):]
+                    if data == "[DONE]":
+                        break
+                    choices = orjson.loads(data)["choices"]
+                    if choices and choices[0]["delta"].get("content"):
+                        yield choices[0]["delta"]["content"]
+    
+    def _persist(self, db: Session, record: Any, commit: bool) -> None:
+        """INSERT a record; commit now, or leave that to a caller batching several.
+        
+        Every column is known after the flush (Python defaults, plus computed
+        columns returned by the INSERT), so no refresh is needed.
+        """
+        db.add(record)
+        db.flush()
+        if commit:
+            # Detach so commit doesn't expire the row and force a reload
+            db.expunge(record)
+            db.commit()
+    
+    async def _call_openai_cached(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        ttl: timedelta,
+        parse: Callable[[Dict[str, Any]], T]
+    ) -> Tuple[T, int]:
+        """_call_openai, reusing the stored response for an identical request.
+        
+        Returns parse(response) and the tokens this call spent (0 when the
+        response came from the cache or from another caller's in-flight
+        request). Only responses that parse are
+        stored, and Redis being unavailable just means an uncached call.
+        Concurrent identical requests in this process share one in-flight
+        lookup, so a burst of duplicates costs a single OpenAI call.
+        """
+        digest = hashlib.sha256(
+            endpoint.encode() + b"|" + orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+        key = f"openai:{digest}"
+        
+        # No await between lookup and registration, so no two tasks per key
+        task = self._inflight.get(key)
+        if task is not None:
+            # Joined an existing call: its creator accounts for the tokens
+            result, _ = await asyncio.shield(task)
+            return result, 0
+        task = asyncio.create_task(self._fetch_cached(key, endpoint, payload, ttl, parse))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded: one caller being cancelled doesn't cancel the others' call
+        return await asyncio.shield(task)
+    
+    async def _fetch_cached(
+        self,
+        key: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        ttl: timedelta,
+        parse: Callable[[Dict[str, Any]], T]
+    ) -> Tuple[T, int]:
+        try:
+            cached = await redis_service.get(key)
+        except RedisError:
+            logger.warning("OpenAI cache unavailable; calling uncached", exc_info=True)
+            cached = None
+        
+        if cached is not None:
+            try:
+                return parse(orjson.loads(cached)), 0
+            except (ValueError, KeyError, IndexError, ValidationError):
+                # Stored before validation was enforced; drop it and refetch
+                await self._forget(key)
+        
+        response = await self._call_openai(endpoint, payload)
+        result = parse(response)
+        
+        try:
+            await redis_service.set(key, orjson.dumps(response).decode(), expire=ttl)
+        except RedisError:
+            logger.warning("Failed to cache OpenAI response", exc_info=True)
+        return result, response["usage"]["total_tokens"]
+    
+    @staticmethod
+    async def _forget(key: str) -> None:
+        try:
+            await redis_service.delete(key)
+        except RedisError:
+            logger.warning("Failed to drop cached OpenAI response", exc_info=True)
     
     async def generate_summary(
         self,
         db: Session,
         conversation_id: UUID,
         messages: List[Dict[str, str]],
-        user_id: UUID
+        user_id: UUID,
+        commit: bool = True
     ) -> AISummary:
         """Generate AI summary for a conversation."""
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
         
         # Format messages for GPT
-        conversation_text = "\n".join([
+        conversation_text = _fit_conversation([
             f"{msg['sender']}: {msg['content']}" for msg in messages
         ])
         
-        prompt = f"""Analyze this conversation and provide:
-1. A concise summary (2-3 sentences)
-2. Key points (bullet points)
-3. Action items if any
-4. Overall sentiment (positive/neutral/negative)
-5. Detected language
-
-Conversation:
-{conversation_text}
-
-Respond in JSON format:
-{{
-    "summary": "...",
-    "key_points": ["...", "..."],
-    "action_items": ["...", "..."],
-    "sentiment": "positive|neutral|negative",
-    "sentiment_score": 0.0 to 1.0 (-1 to 1),
-    "sentiment_breakdown": {{"positive": 0.0, "neutral": 0.0, "negative": 0.0}},
-    "language": "en"
-}}"""
+        prompt = _SUMMARY_PROMPT.format(conversation_text=conversation_text)
         
-        response = await self._call_openai("chat/completions", {
+        # The model's JSON is parsed straight into the schema (single pass)
+        result, tokens_used = await self._call_openai_cached("chat/completions", {
             "model": "gpt-4",
             "messages": [
-                {"role": "system", "content": "You are an expert conversation analyst. Always respond in valid JSON."},
+                {"role": "system", "content": _SUMMARY_SYSTEM},
                 {"role": "user", "content": prompt}
             ],
             "temperature": 0.3,
             "max_tokens": 1000
-        })
-        
-        result_text = response["choices"][0]["message"]["content"]
-        result = json.loads(result_text)
+        }, SUMMARY_CACHE_TTL, _parse_content(AISummaryCompletion))
         
-        processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         # Create summary record
         summary = AISummary(
             conversation_id=conversation_id,
-            summary=result["summary"],
-            key_points=result.get("key_points", []),
-            action_items=result.get("action_items", []),
-            overall_sentiment=result.get("sentiment"),
-            sentiment_score=result.get("sentiment_score"),
-            sentiment_breakdown=result.get("sentiment_breakdown"),
-            detected_language=result.get("language", "en"),
+            summary=result.summary,
+            key_points=result.key_points,
+            action_items=result.action_items,
+            overall_sentiment=result.sentiment,
+            sentiment_score=result.sentiment_score,
+            sentiment_breakdown=result.sentiment_breakdown,
+            detected_language=result.language,
             model_used="gpt-4",
-            tokens_used=response["usage"]["total_tokens"],
+            tokens_used=tokens_used,
             processing_time_ms=processing_time
         )
         
-        db.add(summary)
-        db.commit()
-        db.refresh(summary)
+        self._persist(db, summary, commit)
         
         return summary
     
@@ -120,93 +515,261 @@ Respond in JSON format:
         text: str,
         entity_type: str,
         entity_id: UUID,
-        user_id: UUID
+        user_id: UUID,
+        commit: bool = True
     ) -> SentimentAnalysis:
         """Perform sentiment analysis on text."""
-        prompt = f"""Analyze the sentiment of this text:
-
-"{text}"
-
-Respond in JSON format:
-{{
-    "sentiment": "positive|neutral|negative",
-    "score": -1.0 to 1.0,
-    "confidence": 0.0 to 1.0,
-    "emotions": {{"joy": 0.0, "anger": 0.0, "sadness": 0.0, "fear": 0.0, "surprise": 0.0}},
-    "keywords": ["keyword1", "keyword2"],
-    "topics": ["topic1", "topic2"]
-}}"""
-        
-        response = await self._call_openai("chat/completions", {
-            "model": "gpt-4",
-            "messages": [
-                {"role": "system", "content": "You are a sentiment analysis expert. Always respond in valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.2,
-            "max_tokens": 500
-        })
-        
-        result = json.loads(response["choices"][0]["message"]["content"])
-        
         analysis = SentimentAnalysis(
             user_id=user_id,
             entity_type=entity_type,
             entity_id=entity_id,
-            sentiment=result["sentiment"],
-            score=result["score"],
-            confidence=result.get("confidence", 0.8),
-            emotions=result.get("emotions"),
-            keywords=result.get("keywords", []),
-            topics=result.get("topics", []),
-            model_used="gpt-4"
+            **await self._sentiment_for(text)
         )
         
-        db.add(analysis)
-        db.commit()
-        db.refresh(analysis)
+        self._persist(db, analysis, commit)
+        
+        if commit:
+            await advanced_service.invalidate_sentiment_dashboard(user_id)
+        else:
+            # Invalidating now would let a concurrent read re-cache the
+            # dashboard before this row is visible
+            advanced_service.invalidate_sentiment_dashboard_on_commit(db, user_id)
         
         return analysis
     
+    async def _sentiment_for(self, text: str) -> Dict[str, Any]:
+        """SentimentAnalysis columns for one text; trivial texts skip the model."""
+        if _is_trivial(text.strip()):
+            return _trivial_sentiment()
+        values, _ = await self._call_openai_cached(
+            "chat/completions", _sentiment_request(text), SENTIMENT_CACHE_TTL,
+            _sentiment_values
+        )
+        return values
+    
+    async def analyze_sentiments(
+        self,
+        db: Session,
+        items: List[Dict[str, Any]],
+        user_id: UUID
+    ) -> List[SentimentAnalysis]:
+        """Analyze many texts concurrently and store the results in one commit.
+        
+        Each item needs text, entity_type and entity_id. Items whose call
+        fails are logged and skipped.
+        """
+        results = await asyncio.gather(
+            *(self._sentiment_for(item["text"]) for item in items),
+            return_exceptions=True
+        )
+        
+        rows = []
+        for item, values in zip(items, results):
+            if isinstance(values, Exception):
+                logger.warning(
+                    "Sentiment analysis failed for %s %s: %s",
+                    item["entity_type"], item["entity_id"], values
+                )
+                continue
+            rows.append({
+                "user_id": user_id,
+                "entity_type": item["entity_type"],
+                "entity_id": item["entity_id"],
+                **values
+            })
+        
+        return await self._store_sentiments(db, user_id, rows)
+    
+    async def _store_sentiments(
+        self,
+        db: Session,
+        user_id: UUID,
+        rows: List[Dict[str, Any]]
+    ) -> List[SentimentAnalysis]:
+        """Insert analyses with one multi-row INSERT ... RETURNING and commit once."""
+        if not rows:
+            return []
+        
+        analyses = db.scalars(insert(SentimentAnalysis).returning(SentimentAnalysis), rows).all()
+        for analysis in analyses:
+            db.expunge(analysis)
+        db.commit()
+        
+        await advanced_service.invalidate_sentiment_dashboard(user_id)
+        
+        return analyses
+    
+    async def submit_sentiment_batch(self, items: List[Dict[str, Any]]) -> str:
+        """Queue sentiment analyses on the OpenAI Batch API and return the batch id.
+        
+        Each item needs text, entity_type and entity_id. Batches are billed at
+        half price but complete within 24 hours, so this is for background
+        backfills only; collect results with collect_sentiment_batch.
+        """
+        # custom_id must be unique per batch; the index keeps repeated
+        # entities apart
+        lines = b"\n".join(
+            orjson.dumps({
+                "custom_id": f"{i}:{item['entity_type']}:{item['entity_id']}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": _sentiment_request(item["text"])
+            })
+            for i, item in enumerate(items)
+        )
+        
+        upload = await self._client.post(
+            "/files",
+            headers={"Authorization": f"Bearer {self.openai_api_key}"},
+            files={"file": ("sentiment.jsonl", lines, "application/jsonl")},
+            data={"purpose": "batch"}
+        )
+        upload.raise_for_status()
+        
+        batch = await self._call_openai("batches", {
+            "input_file_id": orjson.loads(upload.content)["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h"
+        })
+        return batch["id"]
+    
+    async def collect_sentiment_batch(
+        self,
+        db: Session,
+        batch_id: str,
+        user_id: UUID
+    ) -> Optional[List[SentimentAnalysis]]:
+        """Store the results of a finished sentiment batch.
+        
+        Returns None while it is still running, and an empty list if the
+        batch was already collected. Lines that failed or don't parse are
+        logged and skipped.
+        """
+        headers = {"Authorization": f"Bearer {self.openai_api_key}"}
+        
+        response = await self._client.get(f"/batches/{batch_id}", headers=headers)
+        response.raise_for_status()
+        batch = orjson.loads(response.content)
+        
+        if batch["status"] in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"Sentiment batch {batch_id} ended as {batch['status']}")
+        if batch["status"] != "completed":
+            return None
+        
+        claim_key = f"sentiment_batch:{batch_id}:collected"
+        if not await redis_service.claim(claim_key, SENTIMENT_BATCH_CLAIM_TTL):
+            return []
+        
+        try:
+            output = await self._client.get(
+                f"/files/{batch['output_file_id']}/content", headers=headers
+            )
+            output.raise_for_status()
+            
+            rows = []
+            for line in output.content.splitlines():
+                result = orjson.loads(line)
+                if result.get("error") or result["response"]["status_code"] != 200:
+                    logger.warning(
+                        "Sentiment batch %s: request %s failed",
+                        batch_id, result.get("custom_id")
+                    )
+                    continue
+                try:
+                    values = _sentiment_values(result["response"]["body"])
+                except (ValueError, KeyError, IndexError, ValidationError):
+                    logger.warning(
+                        "Sentiment batch %s: unparseable reply for %s",
+                        batch_id, result["custom_id"]
+                    )
+                    continue
+                _, entity_type, entity_id = result["custom_id"].split(":", 2)
+                rows.append({
+                    "user_id": user_id,
+                    "entity_type": entity_type,
+                    "entity_id": UUID(entity_id),
+                    **values
+                })
+            
+            return await self._store_sentiments(db, user_id, rows)
+        except BaseException:
+            # Nothing was stored; let a later run collect it
+            await redis_service.delete(claim_key)
+            raise
+    
     async def transcribe_audio(
         self,
         db: Session,
         audio_url: str,
         conversation_id: UUID,
-        message_id: Optional[UUID] = None
+        message_id: Optional[UUID] = None,
+        commit: bool = True,
+        language: Optional[str] = None,
+        prompt: Optional[str] = None
     ) -> VoiceTranscription:
-        """Transcribe audio using Whisper API."""
-        start_time = datetime.utcnow()
-        
-        # Download audio file
-        async with httpx.AsyncClient() as client:
-            audio_response = await client.get(audio_url)
-            audio_data = audio_response.content
-        
-        # Call Whisper API
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                f"{self.openai_base_url}/audio/transcriptions",
-                headers={"Authorization": f"Bearer {self.openai_api_key}"},
-                files={"file": ("audio.mp3", audio_data, "audio/mpeg")},
-                data={
-                    "model": "whisper-1",
-                    "response_format": "verbose_json",
-                    "timestamp_granularities": ["word"]
-                }
+        """Transcribe audio using Whisper API.
+        
+        A known ISO-639-1 `language` skips Whisper's language detection pass;
+        `prompt` biases spelling of names and domain terms.
+        """
+        start_ns = time.perf_counter_ns()
+        
+        whisper_options = {
+            "model": "whisper-1",
+            "response_format": "verbose_json",
+            "timestamp_granularities": ["word"]
+        }
+        if language:
+            whisper_options["language"] = language
+        if prompt:
+            whisper_options["prompt"] = prompt
+        
+        audio_file: BinaryIO = io.BytesIO()
+        on_disk = False
+        try:
+            # Download audio file in chunks
+            async with self._client.stream("GET", audio_url) as audio_response:
+                audio_response.raise_for_status()
+                async for chunk in audio_response.aiter_bytes(UPLOAD_CHUNK_BYTES):
+                    if not on_disk and audio_file.tell() + len(chunk) > AUDIO_SPOOL_BYTES:
+                        audio_file = await asyncio.to_thread(_spill_to_disk, audio_file)
+                        on_disk = True
+                    if on_disk:
+                        await asyncio.to_thread(audio_file.write, chunk)
+                    else:
+                        audio_file.write(chunk)
+            size = audio_file.tell()
+            audio_file.seek(0)
+            
+            # Call Whisper API, streaming the multipart body from the buffer
+            # or temp file (httpx's files= would read a temp file synchronously)
+            boundary = uuid4().hex
+            head = _multipart_head(boundary, whisper_options, "audio.mp3", "audio/mpeg")
+            tail = f"\r\n--{boundary}--\r\n".encode()
+            response = await self._client.post(
+                "/audio/transcriptions",
+                headers={
+                    "Authorization": f"Bearer {self.openai_api_key}",
+                    "Content-Type": f"multipart/form-data; boundary={boundary}",
+                    "Content-Length": str(len(head) + size + len(tail)),
+                },
+                content=_multipart_body(head, audio_file, on_disk, tail),
+                timeout=120.0
             )
-            response.raise_for_status()
-            result = response.json()
+        finally:
+            audio_file.close()
+        response.raise_for_status()
+        result = orjson.loads(response.content)
         
-        processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
         
-        # Extract word timings
-        word_timings = []
-        if "words" in result:
-            word_timings = [
-                {"word": w["word"], "start": w["start"], "end": w["end"]}
-                for w in result["words"]
-            ]
+        # Word timings are stored column-wise (one array per field) so the
+        # keys aren't repeated for every word of a long clip
+        words = result.get("words", [])
+        word_timings = {
+            field: list(map(itemgetter(field), words))
+            for field in ("word", "start", "end")
+        }
         
         transcription = VoiceTranscription(
             message_id=message_id,
@@ -215,15 +778,13 @@ Respond in JSON format:
             audio_duration_seconds=int(result.get("duration", 0)),
             transcription=result["text"],
             confidence=0.95,  # Whisper doesn't return confidence
-            language=result.get("language", "en"),
+            language=result.get("language", language or "en"),
             word_timings=word_timings,
             model_used="whisper-1",
             processing_time_ms=processing_time
         )
         
-        db.add(transcription)
-        db.commit()
-        db.refresh(transcription)
+        self._persist(db, transcription, commit)
         
         return transcription
     
@@ -237,35 +798,13 @@ Respond in JSON format:
     ) -> Dict[str, Any]:
         """Generate AI response for a customer message."""
         if not ai_settings:
-            ai_settings = db.query(AISettings).filter(
-                AISettings.user_id == user_id
-            ).first()
+            ai_settings = self.get_ai_settings_cached(db, user_id)
         
-        system_prompt = ai_settings.system_prompt if ai_settings else (
-            "You are a helpful customer support assistant. Be concise and professional."
+        response = await self._call_openai(
+            "chat/completions",
+            _response_request(ai_settings, conversation_context, customer_message)
         )
         
-        model = ai_settings.model if ai_settings else "gpt-4"
-        temperature = float(ai_settings.temperature) if ai_settings else 0.7
-        max_tokens = ai_settings.max_tokens if ai_settings else 500
-        
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        # Add conversation context
-        for msg in conversation_context[-10:]:  # Last 10 messages
-            role = "assistant" if msg["sender_type"] in ["agent", "ai"] else "user"
-            messages.append({"role": role, "content": msg["content"]})
-        
-        # Add current message
-        messages.append({"role": "user", "content": customer_message})
-        
-        response = await self._call_openai("chat/completions", {
-            "model": model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens
-        })
-        
         return {
             "response": response["choices"][0]["message"]["content"],
             "confidence": 0.85,
@@ -273,41 +812,83 @@ Respond in JSON format:
             "tokens_used": response["usage"]["total_tokens"]
         }
     
+    async def generate_response_stream(
+        self,
+        db: Session,
+        user_id: UUID,
+        conversation_context: List[Dict[str, str]],
+        customer_message: str,
+        ai_settings: Optional[AISettings] = None
+    ) -> AsyncIterator[str]:
+        """Generate an AI response as a stream of text chunks.
+        
+        Settings are loaded before returning, so the stream itself never
+        touches `db` and can outlive the request's session.
+        """
+        if not ai_settings:
+            ai_settings = self.get_ai_settings_cached(db, user_id)
+        
+        return self._call_openai_stream(
+            "chat/completions",
+            _response_request(ai_settings, conversation_context, customer_message)
+        )
+    
     async def translate_text(
         self,
         text: str,
         target_language: str,
         source_language: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> AITranslateResponse:
         """Translate text to target language."""
-        prompt = f"""Translate the following text to {target_language}:
-
-"{text}"
-
-Respond in JSON format:
-{{
-    "translated_text": "...",
-    "source_language": "detected language code",
-    "target_language": "{target_language}",
-    "confidence": 0.0 to 1.0
-}}"""
+        # Line breaks are kept for the translation; only the edges are trimmed
+        text = text.strip()
         
-        response = await self._call_openai("chat/completions", {
-            "model": "gpt-4",
+        # Nothing to translate: empty text or bare links, or it is already in
+        # the target language
+        if (
+            not text
+            or _URLS_ONLY.fullmatch(text)
+            or (source_language or "").lower() == target_language.lower()
+        ):
+            return AITranslateResponse(
+                translated_text=text,
+                source_language=source_language or target_language,
+                target_language=target_language,
+                confidence=1.0
+            )
+        
+        prompt = _TRANSLATE_PROMPT.format(target_language=target_language, text=text)
+        
+        result, _ = await self._call_openai_cached("chat/completions", {
+            "model": settings.TRANSLATION_MODEL,
             "messages": [
-                {"role": "system", "content": "You are a translation expert. Always respond in valid JSON."},
+                {"role": "system", "content": _TRANSLATE_SYSTEM},
                 {"role": "user", "content": prompt}
             ],
             "temperature": 0.2,
-            "max_tokens": 1000
-        })
+            "max_tokens": 1000,
+            "response_format": {"type": "json_object"}
+        }, TRANSLATION_CACHE_TTL, _parse_content(AITranslateResponse))
         
-        return json.loads(response["choices"][0]["message"]["content"])
+        return result
     
     def get_ai_settings(self, db: Session, user_id: UUID) -> Optional[AISettings]:
         """Get user's AI settings."""
         return db.query(AISettings).filter(AISettings.user_id == user_id).first()
     
+    def get_ai_settings_cached(self, db: Session, user_id: UUID) -> Optional[AISettings]:
+        """Read-only AI settings, served from the in-process cache.
+        
+        The returned row is detached; use get_ai_settings to modify it.
+        """
+        ai_settings = _ai_settings_cache.get(user_id, MISSING)
+        if ai_settings is MISSING:
+            ai_settings = self.get_ai_settings(db, user_id)
+            if ai_settings is not None:
+                db.expunge(ai_settings)
+            _ai_settings_cache.set(user_id, ai_settings)
+        return ai_settings
+    
     def update_ai_settings(
         self, 
         db: Session, 
@@ -327,6 +908,7 @@ Respond in JSON format:
         
         db.commit()
         db.refresh(ai_settings)
+        _ai_settings_cache.pop(user_id)
         return ai_settings
 
 
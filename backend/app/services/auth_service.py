@@ -1,11 +1,12 @@
 """
 Authentication service - core auth logic.
 """
-import json
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -25,6 +26,7 @@ from app.core.security import (
     hash_password,
     verify_password,
 )
+from app.db.base import utcnow
 from app.db.redis import redis_service
 from app.models.user import (
     AppRole,
@@ -42,6 +44,15 @@ from app.schemas.auth import (
     TokenPair,
 )
 from app.services.email_service import email_service
+from app.services.security_event_service import security_event_buffer
+
+# How long an IP or device stays known after the user last logged in from it
+KNOWN_SOURCE_DAYS = 30
+
+
+def _epoch(value: datetime) -> float:
+    """Epoch seconds for a naive UTC datetime."""
+    return value.replace(tzinfo=timezone.utc).timestamp()
 
 
 class AuthService:
@@ -49,21 +60,22 @@ class AuthService:
     
     async def check_email(self, db: Session, email: str) -> EmailCheckResponse:
         """Check if email exists and what auth methods are available."""
-        user = db.query(User).filter(User.email == email.lower()).first()
-        
-        if not user:
+        # One row per linked provider (a single row with NULL if none), so
+        # the user and their OAuth providers come back in one round trip
+        rows = db.query(
+            User.hashed_password.isnot(None),
+            OAuthAccount.provider
+        ).outerjoin(
+            OAuthAccount, OAuthAccount.user_id == User.id
+        ).filter(User.email == email.lower()).all()
+        
+        if not rows:
             return EmailCheckResponse(exists=False, has_password=False, providers=[])
         
-        # Get linked OAuth providers
-        oauth_accounts = db.query(OAuthAccount).filter(
-            OAuthAccount.user_id == user.id
-        ).all()
-        providers = [acc.provider.value for acc in oauth_accounts]
-        
         return EmailCheckResponse(
             exists=True,
-            has_password=user.hashed_password is not None,
-            providers=providers
+            has_password=rows[0][0],
+            providers=[provider.value for _, provider in rows if provider is not None]
         )
     
     async def signup(
@@ -77,11 +89,7 @@ class AuthService:
         Register a new user.
         Returns (user, verification_token).
         """
-        # Validate passwords match
-        if request.password != request.confirm_password:
-            raise ValidationError("Passwords do not match")
-        
-        # Validate password strength
+        # Validate password strength (confirmation is checked by SignupRequest)
         self._validate_password_strength(request.password)
         
         # Check if email already exists
@@ -95,7 +103,7 @@ class AuthService:
         # Create user
         user = User(
             email=request.email.lower(),
-            hashed_password=hash_password(request.password),
+            hashed_password=await asyncio.to_thread(hash_password, request.password),
             first_name=request.first_name,
             last_name=request.last_name,
             is_email_verified=False,
@@ -171,7 +179,8 @@ class AuthService:
             raise AuthenticationError("Invalid email or password")
         
         # Verify password
-        if not verify_password(request.password, user.hashed_password):
+        # bcrypt is deliberately slow; keep it off the event loop
+        if not await asyncio.to_thread(verify_password, request.password, user.hashed_password):
             await self._handle_failed_login(
                 db, email, ip_address, user_agent, user.id
             )
@@ -188,16 +197,19 @@ class AuthService:
         # Clear failed login attempts
         await redis_service.clear_failed_logins(email)
         
+        # One clock read for every timestamp this login writes
+        now = utcnow()
+        
         # Check for new device/IP
         await self._check_new_device_ip(
-            db, user, ip_address, user_agent, request.device_fingerprint
+            db, user, ip_address, user_agent, request.device_fingerprint, now
         )
         
         # Create tokens
         tokens = self._create_token_pair(user)
         
         # Update last login
-        user.last_login_at = datetime.utcnow()
+        user.last_login_at = now
         
         # Log security event
         self._log_security_event(
@@ -206,7 +218,9 @@ class AuthService:
             event_type=SecurityEventType.LOGIN_SUCCESS,
             ip_address=ip_address,
             user_agent=user_agent,
-            metadata={"device_fingerprint": request.device_fingerprint}
+            device_fingerprint=request.device_fingerprint,
+            metadata={"device_fingerprint": request.device_fingerprint},
+            now=now
         )
         
         db.commit()
@@ -240,11 +254,12 @@ class AuthService:
             raise ValidationError("Email is already verified")
         
         # Mark email as verified
+        now = utcnow()
         user.is_email_verified = True
-        user.email_verified_at = datetime.utcnow()
+        user.email_verified_at = now
         
         # Mark token as used
-        await redis_service.mark_verification_used(token)
+        await redis_service.mark_verification_used(token, token_data)
         
         # Log security event
         self._log_security_event(
@@ -252,7 +267,8 @@ class AuthService:
             user_id=user.id,
             event_type=SecurityEventType.EMAIL_VERIFIED,
             ip_address=ip_address,
-            user_agent=user_agent
+            user_agent=user_agent,
+            now=now
         )
         
         db.commit()
@@ -418,12 +434,13 @@ class AuthService:
             raise NotFoundError("User not found")
         
         # Update password
-        user.hashed_password = hash_password(new_password)
-        user.password_changed_at = datetime.utcnow()
+        user.hashed_password = await asyncio.to_thread(hash_password, new_password)
+        now = utcnow()
+        user.password_changed_at = now
         
         # Mark token as used
         token_data["used"] = True
-        await redis_service.set(f"password_reset:{token}", token_data, timedelta(hours=1))
+        await redis_service.replace(f"password_reset:{token}", token_data)
         
         # Log security event
         self._log_security_event(
@@ -431,7 +448,8 @@ class AuthService:
             user_id=user.id,
             event_type=SecurityEventType.PASSWORD_RESET_COMPLETED,
             ip_address=ip_address,
-            user_agent=user_agent
+            user_agent=user_agent,
+            now=now
         )
         
         db.commit()
@@ -473,13 +491,14 @@ class AuthService:
         if len(password) < 8:
             errors.append("Password must be at least 8 characters")
         
-        if not any(c.isupper() for c in password):
+        # map() over the str predicates stays in C and stops at the first hit
+        if not any(map(str.isupper, password)):
             errors.append("Password must contain at least one uppercase letter")
         
-        if not any(c.islower() for c in password):
+        if not any(map(str.islower, password)):
             errors.append("Password must contain at least one lowercase letter")
         
-        if not any(c.isdigit() for c in password):
+        if not any(map(str.isdigit, password)):
             errors.append("Password must contain at least one number")
         
         if errors:
@@ -536,25 +555,53 @@ class AuthService:
         user: User,
         ip_address: Optional[str],
         user_agent: Optional[str],
-        device_fingerprint: Optional[str]
+        device_fingerprint: Optional[str],
+        now: datetime
     ) -> None:
         """Check for new device or IP and send alert."""
-        # Check recent login history
-        recent_events = db.query(SecurityEvent).filter(
-            SecurityEvent.user_id == user.id,
-            SecurityEvent.event_type == SecurityEventType.LOGIN_SUCCESS,
-            SecurityEvent.created_at >= datetime.utcnow() - timedelta(days=30)
-        ).all()
-        
-        known_ips = {e.ip_address for e in recent_events if e.ip_address}
-        known_fingerprints = {
-            e.device_fingerprint for e in recent_events if e.device_fingerprint
+        ip_key = f"known_ips:{user.id}"
+        fp_key = f"known_fp:{user.id}"
+        cutoff = now - timedelta(days=KNOWN_SOURCE_DAYS)
+        known_ip, known_device = await redis_service.check_recent(
+            [(ip_key, ip_address or ""), (fp_key, device_fingerprint or "")],
+            _epoch(cutoff)
+        )
+        
+        seen = {
+            ip_key: {ip_address: _epoch(now)},
+            fp_key: {device_fingerprint: _epoch(now)},
         }
         
-        is_new_ip = ip_address and ip_address not in known_ips
-        is_new_device = (
-            device_fingerprint and device_fingerprint not in known_fingerprints
-        )
+        if (ip_address and known_ip is None) or (device_fingerprint and known_device is None):
+            # Sets expired or were never built: rehydrate from login history
+            recent = db.query(
+                SecurityEvent.ip_address,
+                SecurityEvent.device_fingerprint,
+                func.max(SecurityEvent.created_at)
+            ).filter(
+                SecurityEvent.user_id == user.id,
+                SecurityEvent.event_type == SecurityEventType.LOGIN_SUCCESS,
+                SecurityEvent.created_at >= cutoff
+            ).group_by(
+                SecurityEvent.ip_address,
+                SecurityEvent.device_fingerprint
+            ).all()
+            
+            history = {ip_key: {}, fp_key: {}}
+            for ip, fp, last_seen in recent:
+                for key, member in ((ip_key, ip), (fp_key, fp)):
+                    if member:
+                        history[key][member] = max(history[key].get(member, 0), _epoch(last_seen))
+            
+            known_ip = ip_address in history[ip_key]
+            known_device = device_fingerprint in history[fp_key]
+            for key, members in history.items():
+                seen[key] = {**members, **seen[key]}
+        
+        await redis_service.mark_seen(seen, _epoch(cutoff), KNOWN_SOURCE_DAYS * 86400)
+        
+        is_new_ip = ip_address and not known_ip
+        is_new_device = device_fingerprint and not known_device
         
         if is_new_ip or is_new_device:
             event_type = (
@@ -569,7 +616,8 @@ class AuthService:
                 event_type=event_type,
                 ip_address=ip_address,
                 user_agent=user_agent,
-                metadata={"device_fingerprint": device_fingerprint}
+                metadata={"device_fingerprint": device_fingerprint},
+                now=now
             )
             
             # Send security alert
@@ -589,19 +637,19 @@ class AuthService:
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
         device_fingerprint: Optional[str] = None,
-        metadata: Optional[dict] = None
-    ) -> SecurityEvent:
+        metadata: Optional[dict] = None,
+        now: Optional[datetime] = None
+    ) -> None:
         """Log a security event."""
-        event = SecurityEvent(
+        security_event_buffer.record(
+            db,
             user_id=user_id,
             event_type=event_type,
             ip_address=ip_address,
             user_agent=user_agent,
             device_fingerprint=device_fingerprint,
-            metadata=json.dumps(metadata) if metadata else None
+            metadata=metadata,
+            now=now
         )
-        db.add(event)
-        return event
-
 
 auth_service = AuthService()
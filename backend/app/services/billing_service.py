@@ -64,8 +64,10 @@ class BillingService:
     
     # Subscription methods
     def get_user_subscription(self, db: Session, user_id: uuid.UUID) -> Optional[Subscription]:
-        """Get user's current subscription."""
-        return db.query(Subscription).filter(Subscription.user_id == user_id).first()
+        """Get user's current (most recent) subscription."""
+        return db.query(Subscription).filter(
+            Subscription.user_id == user_id
+        ).order_by(Subscription.created_at.desc()).first()
     
     def create_subscription(
         self,
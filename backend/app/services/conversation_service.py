@@ -77,11 +77,10 @@ class ConversationService:
         total = query.count()
         
         # Apply pagination and ordering
-        skip = (params.page - 1) * params.page_size
         conversations = query.order_by(
             Conversation.last_message_at.desc().nullslast(),
             Conversation.updated_at.desc()
-        ).offset(skip).limit(params.page_size).all()
+        ).offset(params.offset).limit(params.page_size).all()
         
         return conversations, total
     
@@ -4,6 +4,7 @@ Supports: Salesforce, HubSpot, Pipedrive, Zoho
 """
 import secrets
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 import httpx
@@ -51,20 +52,25 @@ class CRMService:
             raise ValueError(f"Unsupported CRM type: {crm_type}")
         
         state = secrets.token_urlsafe(32)
-        client_id = getattr(settings, f"{crm_type.upper()}_CLIENT_ID", "")
+        url = f"{self._oauth_url_prefix(crm_type, redirect_uri)}&state={state}"
         
+        return {"url": url, "state": state}
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _oauth_url_prefix(crm_type: str, redirect_uri: str) -> str:
+        """Build the OAuth URL up to (excluding) the per-request state."""
+        config = CRMService.CRM_CONFIG[crm_type]
+        client_id = getattr(settings, f"{crm_type.upper()}_CLIENT_ID", "")
         scopes = " ".join(config["scopes"])
         
-        url = (
+        return (
             f"{config['auth_url']}?"
             f"client_id={client_id}&"
             f"redirect_uri={redirect_uri}&"
             f"scope={scopes}&"
-            f"state={state}&"
             f"response_type=code"
         )
-        
-        return {"url": url, "state": state}
     
     async def handle_oauth_callback(
         self,
@@ -6,15 +6,16 @@ import hmac
 import httpx
 import json
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import uuid
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.exceptions import AppException
 from app.models.notification import (
-    EmailNotificationPreference, Webhook, WebhookStatus, WebhookDelivery
+    EMAIL_PREF_FIELDS, EmailNotificationPreference, Webhook, WebhookStatus, WebhookDelivery
 )
 
 
@@ -49,10 +50,21 @@ class NotificationService:
         """Update email preferences."""
         prefs = self.get_email_preferences(db, user_id)
         
+        flags = updates.pop("flags", None)
+        if flags is None:
+            flags = prefs.flags
+        
+        # Legacy per-toggle booleans are folded into the bitmask
         for key, value in updates.items():
-            if hasattr(prefs, key):
+            pref = EMAIL_PREF_FIELDS.get(key)
+            if pref is not None:
+                if value is not None:
+                    flags = flags | pref if value else flags & ~pref
+            elif hasattr(prefs, key) and value is not None:
                 setattr(prefs, key, value)
         
+        prefs.flags = int(flags)
+        
         db.commit()
         db.refresh(prefs)
         return prefs
@@ -124,16 +136,31 @@ class NotificationService:
         db.delete(webhook)
         db.commit()
     
-    def get_webhook_deliveries(
+    def get_webhook_delivery_log(
         self,
         db: Session,
         webhook_id: uuid.UUID,
         limit: int = 50
-    ) -> List[WebhookDelivery]:
-        """Get delivery logs for a webhook."""
-        return db.query(WebhookDelivery).filter(
-            WebhookDelivery.webhook_id == webhook_id
-        ).order_by(WebhookDelivery.delivered_at.desc()).limit(limit).all()
+    ) -> List[Dict[str, Any]]:
+        """Delivery log rows as plain dicts, shaped like WebhookDeliveryResponse."""
+        # Only the listed columns; payload/response_body are never read here
+        rows = db.execute(
+            select(
+                WebhookDelivery.id,
+                WebhookDelivery.webhook_id,
+                WebhookDelivery.event_type,
+                WebhookDelivery.status_code,
+                WebhookDelivery.duration_ms,
+                WebhookDelivery.attempt_number,
+                WebhookDelivery.success,
+                WebhookDelivery.error_message,
+                WebhookDelivery.delivered_at,
+            )
+            .where(WebhookDelivery.webhook_id == webhook_id)
+            .order_by(WebhookDelivery.delivered_at.desc())
+            .limit(limit)
+        ).mappings().all()
+        return [dict(row) for row in rows]
     
     # Webhook delivery
     def _generate_signature(self, payload: str, secret: str) -> str:
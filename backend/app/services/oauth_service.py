@@ -3,11 +3,14 @@ OAuth service for handling OAuth authentication flows.
 """
 import secrets
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Tuple
 from uuid import UUID
 
 import httpx
-from sqlalchemy.orm import Session
+from sqlalchemy import func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.config import settings
 from app.core.exceptions import AuthenticationError, ValidationError
@@ -16,13 +19,13 @@ from app.models.user import (
     AppRole,
     OAuthAccount,
     OAuthProvider,
-    SecurityEvent,
     SecurityEventType,
     User,
     UserRole,
 )
 from app.schemas.auth import OAuthUrlResponse, TokenPair
 from app.services.auth_service import auth_service
+from app.services.security_event_service import security_event_buffer
 
 
 class OAuthService:
@@ -62,26 +65,7 @@ class OAuthService:
         
         # Generate state for CSRF protection
         state = secrets.token_urlsafe(32)
-        
-        # Build authorization URL
-        redirect_uri = f"{settings.FRONTEND_URL}/auth/callback/{provider.value}"
-        scopes = " ".join(config["scopes"])
-        
-        params = {
-            "client_id": client_id,
-            "redirect_uri": redirect_uri,
-            "response_type": "code",
-            "scope": scopes,
-            "state": state,
-        }
-        
-        # Add provider-specific params
-        if provider == OAuthProvider.GOOGLE:
-            params["access_type"] = "offline"
-            params["prompt"] = "consent"
-        
-        query_string = "&".join(f"{k}={v}" for k, v in params.items())
-        url = f"{config['auth_url']}?{query_string}"
+        url = f"{self._auth_url_prefix(provider, client_id)}&state={state}"
         
         return OAuthUrlResponse(url=url, state=state)
     
@@ -221,29 +205,39 @@ class OAuthService:
         email = email.lower()
         provider_user_id = str(user_info["id"])
         
-        # Check if OAuth account already linked
-        oauth_account = db.query(OAuthAccount).filter(
-            OAuthAccount.provider == provider,
-            OAuthAccount.provider_user_id == provider_user_id
-        ).first()
+        token_values = {
+            "access_token": tokens.get("access_token"),
+            "refresh_token": tokens.get("refresh_token"),
+        }
+        if tokens.get("expires_in"):
+            token_values["token_expires_at"] = datetime.utcnow() + timedelta(
+                seconds=tokens["expires_in"]
+            )
+        
+        # Already linked: refresh tokens and find the owner in one statement
+        linked_user_id = db.execute(
+            update(OAuthAccount)
+            .where(
+                OAuthAccount.provider == provider,
+                OAuthAccount.provider_user_id == provider_user_id
+            )
+            .values(**token_values, updated_at=func.now())
+            .returning(OAuthAccount.user_id)
+        ).scalar_one_or_none()
         
-        if oauth_account:
-            # Update tokens
-            oauth_account.access_token = tokens.get("access_token")
-            oauth_account.refresh_token = tokens.get("refresh_token")
-            if tokens.get("expires_in"):
-                oauth_account.token_expires_at = datetime.utcnow() + timedelta(
-                    seconds=tokens["expires_in"]
-                )
-            
-            user = oauth_account.user
+        if linked_user_id:
+            user = db.query(User).options(
+                selectinload(User.roles)
+            ).filter(User.id == linked_user_id).one()
             user.last_login_at = datetime.utcnow()
             
             db.commit()
             return user
         
         # Check if user exists with this email
-        user = db.query(User).filter(User.email == email).first()
+        user = db.query(User).options(
+            selectinload(User.roles)
+        ).filter(User.email == email).first()
         
         if not user:
             # Create new user
@@ -263,38 +257,61 @@ class OAuthService:
             user_role = UserRole(user_id=user.id, role=AppRole.USER)
             db.add(user_role)
         
-        # Link OAuth account
-        oauth_account = OAuthAccount(
-            user_id=user.id,
-            provider=provider,
-            provider_user_id=provider_user_id,
-            provider_email=email,
-            access_token=tokens.get("access_token"),
-            refresh_token=tokens.get("refresh_token"),
-        )
-        
-        if tokens.get("expires_in"):
-            oauth_account.token_expires_at = datetime.utcnow() + timedelta(
-                seconds=tokens["expires_in"]
+        # Link OAuth account; a concurrent callback for the same provider
+        # account resolves to a token refresh instead of a unique violation
+        db.execute(
+            pg_insert(OAuthAccount)
+            .values(
+                user_id=user.id,
+                provider=provider,
+                provider_user_id=provider_user_id,
+                provider_email=email,
+                **token_values
             )
-        
-        db.add(oauth_account)
+            .on_conflict_do_update(
+                index_elements=[OAuthAccount.provider, OAuthAccount.provider_user_id],
+                set_={**token_values, "updated_at": func.now()}
+            )
+        )
         
         # Log security event
-        event = SecurityEvent(
+        security_event_buffer.record(
+            db,
             user_id=user.id,
             event_type=SecurityEventType.OAUTH_CONNECTED,
             ip_address=ip_address,
             user_agent=user_agent,
-            metadata=f'{{"provider": "{provider.value}"}}'
+            metadata={"provider": provider.value}
         )
-        db.add(event)
         
         user.last_login_at = datetime.utcnow()
         db.commit()
         
         return user
     
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _auth_url_prefix(provider: OAuthProvider, client_id: str) -> str:
+        """Build the authorization URL up to (excluding) the per-request state."""
+        config = OAuthService.PROVIDERS[provider]
+        redirect_uri = f"{settings.FRONTEND_URL}/auth/callback/{provider.value}"
+        scopes = " ".join(config["scopes"])
+        
+        params = {
+            "client_id": client_id,
+            "redirect_uri": redirect_uri,
+            "response_type": "code",
+            "scope": scopes,
+        }
+        
+        # Add provider-specific params
+        if provider == OAuthProvider.GOOGLE:
+            params["access_type"] = "offline"
+            params["prompt"] = "consent"
+        
+        query_string = "&".join(f"{k}={v}" for k, v in params.items())
+        return f"{config['auth_url']}?{query_string}"
+    
     def _get_client_id(self, provider: OAuthProvider) -> Optional[str]:
         """Get OAuth client ID for provider."""
         if provider == OAuthProvider.GOOGLE:
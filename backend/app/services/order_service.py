@@ -8,11 +8,13 @@ from typing import List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.exceptions import NotFoundError
-from app.models.order import Order, OrderStatus, OrderSource
-from app.schemas.order import OrderCreate, OrderUpdate, OrderListParams, OrderStats
+from app.models.order import Order, OrderExtra, OrderStatus, OrderSource, REVENUE_STATUSES
+from app.schemas.order import (
+    OrderCreate, OrderItemListAdapter, OrderUpdate, OrderListParams, OrderStats
+)
 
 
 class OrderService:
@@ -32,28 +34,25 @@ class OrderService:
             customer_name=data.customer_name,
             customer_email=data.customer_email,
             customer_phone=data.customer_phone,
-            shipping_address=data.shipping_address,
-            shipping_city=data.shipping_city,
-            shipping_state=data.shipping_state,
-            shipping_zip=data.shipping_zip,
-            shipping_country=data.shipping_country,
+            shipping=data.shipping.model_dump() if data.shipping else None,
             status=OrderStatus.PENDING,
             source=data.source,
             subtotal=data.subtotal,
             tax=data.tax,
             shipping_cost=data.shipping_cost,
             discount=data.discount,
-            total=data.total,
             currency=data.currency,
-            items=json.dumps([item.model_dump() for item in data.items]),
-            notes=data.notes
+            extra=OrderExtra(
+                items=OrderItemListAdapter.dump_json(data.items).decode(),
+                notes=data.notes
+            )
         )
         
         db.add(order)
         db.commit()
-        db.refresh(order)
         
-        return order
+        # Reload with the cold columns attached; refresh() leaves them unloaded
+        return self.get_by_id(db, order.id)
     
     def get_by_id(
         self,
@@ -61,8 +60,10 @@ class OrderService:
         order_id: UUID,
         user_id: Optional[UUID] = None
     ) -> Optional[Order]:
-        """Get order by ID."""
-        query = db.query(Order).filter(Order.id == order_id)
+        """Get order by ID (with cold columns loaded)."""
+        query = db.query(Order).options(
+            selectinload(Order.extra)
+        ).filter(Order.id == order_id)
         
         if user_id:
             query = query.filter(Order.user_id == user_id)
@@ -117,10 +118,9 @@ class OrderService:
         total = query.count()
         
         # Apply pagination
-        skip = (params.page - 1) * params.page_size
         orders = query.order_by(
             Order.created_at.desc()
-        ).offset(skip).limit(params.page_size).all()
+        ).offset(params.offset).limit(params.page_size).all()
         
         return orders, total
     
@@ -157,9 +157,8 @@ class OrderService:
             setattr(order, field, value)
         
         db.commit()
-        db.refresh(order)
         
-        return order
+        return self.get_by_id(db, order_id, user_id)
     
     def delete(
         self,
@@ -197,24 +196,14 @@ class OrderService:
         # Total revenue
         total_revenue = db.query(func.sum(Order.total)).filter(
             Order.user_id == user_id,
-            Order.status.in_([
-                OrderStatus.CONFIRMED,
-                OrderStatus.PROCESSING,
-                OrderStatus.SHIPPED,
-                OrderStatus.DELIVERED
-            ])
+            Order.status.in_(REVENUE_STATUSES)
         ).scalar() or Decimal("0")
         
         # Revenue today
         revenue_today = db.query(func.sum(Order.total)).filter(
             Order.user_id == user_id,
             Order.created_at >= today,
-            Order.status.in_([
-                OrderStatus.CONFIRMED,
-                OrderStatus.PROCESSING,
-                OrderStatus.SHIPPED,
-                OrderStatus.DELIVERED
-            ])
+            Order.status.in_(REVENUE_STATUSES)
         ).scalar() or Decimal("0")
         
         # Average order value
@@ -228,9 +217,9 @@ class OrderService:
             shipped_orders=status_map.get(OrderStatus.SHIPPED, 0),
             delivered_orders=status_map.get(OrderStatus.DELIVERED, 0),
             cancelled_orders=status_map.get(OrderStatus.CANCELLED, 0),
-            total_revenue=total_revenue,
-            revenue_today=revenue_today,
-            average_order_value=avg_order_value
+            total_revenue_cents=total_revenue,
+            revenue_today_cents=revenue_today,
+            average_order_value_cents=avg_order_value
         )
     
     def create_from_ai_extraction(
@@ -242,13 +231,19 @@ class OrderService:
         confidence: int
     ) -> Order:
         """Create order from AI-extracted data."""
-        items = extracted_data.get("items", [])
+        # Fill the gaps the model leaves so stored items match OrderItemBase
+        items = OrderItemListAdapter.validate_python([
+            {
+                **item,
+                "name": item.get("name") or "Item",
+                "quantity": max(int(item.get("quantity") or 1), 1),
+                "price": Decimal(str(item.get("price") or 0)),
+            }
+            for item in extracted_data.get("items", [])
+        ])
         
         # Calculate totals
-        subtotal = sum(
-            Decimal(str(item.get("price", 0))) * item.get("quantity", 1)
-            for item in items
-        )
+        subtotal = sum(item.price * item.quantity for item in items)
         
         order = Order(
             user_id=user_id,
@@ -264,20 +259,20 @@ class OrderService:
             shipping_country=extracted_data.get("shipping_country"),
             status=OrderStatus.PENDING,
             source=OrderSource.AI_EXTRACTED,
-            subtotal=subtotal,
-            total=subtotal,  # Simplified; add tax/shipping logic as needed
+            subtotal=subtotal,  # total is derived by the database
             currency=extracted_data.get("currency", "USD"),
-            items=json.dumps(items),
             ai_extracted_at=datetime.utcnow(),
             ai_confidence=confidence,
-            ai_raw_data=json.dumps(extracted_data)
+            extra=OrderExtra(
+                items=OrderItemListAdapter.dump_json(items).decode(),
+                ai_raw_data=json.dumps(extracted_data)
+            )
         )
         
         db.add(order)
         db.commit()
-        db.refresh(order)
         
-        return order
+        return self.get_by_id(db, order.id)
 
 
 order_service = OrderService()
@@ -0,0 +1,225 @@
+"""
+Buffered writer for the security event audit log.
+Routine events are queued once the caller commits and batched off the
+request path; critical ones are written with the caller's transaction in
+one multi-row INSERT at commit time.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import event, insert, text
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal, utcnow, uuid7
+from app.models.user import SecurityEvent, SecurityEventType
+
+logger = logging.getLogger(__name__)
+
+# Written synchronously so they are durable once the request commits
+CRITICAL_EVENT_TYPES = frozenset({
+    SecurityEventType.ACCOUNT_LOCKED,
+    SecurityEventType.PASSWORD_CHANGED,
+    SecurityEventType.PASSWORD_RESET_COMPLETED,
+})
+
+# Monthly partitions kept ready ahead of the clock (see migrations/019)
+PARTITION_MONTHS_AHEAD = 2
+PARTITION_CHECK_SECONDS = 24 * 60 * 60
+
+# Session.info keys for rows waiting on the caller's commit: written in
+# the transaction, or handed to the buffer once it has committed
+_PENDING_KEY = "pending_security_events"
+_QUEUED_KEY = "queued_security_events"
+
+
+@event.listens_for(Session, "before_commit")
+def _insert_pending(session: Session) -> None:
+    rows = session.info.pop(_PENDING_KEY, None)
+    if rows:
+        session.execute(insert(SecurityEvent), rows)
+
+
+@event.listens_for(Session, "after_commit")
+def _queue_committed(session: Session) -> None:
+    rows = session.info.pop(_QUEUED_KEY, None)
+    if rows:
+        security_event_buffer.enqueue(rows)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_QUEUED_KEY, None)
+
+
+class SecurityEventBuffer:
+    """Batches security events into multi-row INSERTs."""
+
+    def __init__(
+        self,
+        max_batch: int = 500,
+        flush_interval: float = 0.2,
+        max_pending: int = 10000
+    ):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._partition_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the background flusher and partition upkeep."""
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._loop = asyncio.get_running_loop()
+            self._task = asyncio.create_task(self._run())
+            self._partition_task = asyncio.create_task(self._maintain_partitions())
+
+    async def stop(self) -> None:
+        """Stop the flusher and write whatever is still queued."""
+        if self._task is None:
+            return
+        for task in (self._task, self._partition_task):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._partition_task = None
+        # Commits from here on write their own events
+        self._loop = None
+
+        pending = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        if pending:
+            await self._flush(pending)
+
+    def record(
+        self,
+        db: Session,
+        user_id: UUID,
+        event_type: SecurityEventType,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        device_fingerprint: Optional[str] = None,
+        metadata: Optional[dict] = None,
+        now: Optional[datetime] = None
+    ) -> None:
+        """Record a security event, buffering it unless it is critical."""
+        row = {
+            "id": uuid7(),
+            "user_id": user_id,
+            "event_type": event_type,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "device_fingerprint": device_fingerprint,
+            "event_metadata": metadata,
+            "created_at": now or utcnow(),
+        }
+
+        if self._task is not None and event_type not in CRITICAL_EVENT_TYPES:
+            # Only logged if the caller's transaction commits
+            db.info.setdefault(_QUEUED_KEY, []).append(row)
+        else:
+            # Flusher not running, or critical: join the caller's transaction
+            db.info.setdefault(_PENDING_KEY, []).append(row)
+
+    def enqueue(self, rows: List[Dict[str, Any]]) -> None:
+        """Hand committed rows to the flusher; safe to call from any thread."""
+        if self._loop is None:
+            self._write_rows(rows)
+            return
+        self._loop.call_soon_threadsafe(self._put, rows)
+
+    def _put(self, rows: List[Dict[str, Any]]) -> None:
+        for i, row in enumerate(rows):
+            try:
+                self._queue.put_nowait(row)
+            except asyncio.QueueFull:
+                # Backed up: write the overflow directly instead of dropping it
+                asyncio.create_task(self._flush(rows[i:]))
+                return
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        await asyncio.to_thread(self._write_rows, batch)
+
+    @classmethod
+    def _write_rows(cls, batch: List[Dict[str, Any]]) -> None:
+        """Write a batch; on a bad row, split it so only that row is lost."""
+        try:
+            cls._write(batch)
+        except (IntegrityError, DataError):
+            if len(batch) == 1:
+                logger.exception(
+                    "Dropped security event %s for user %s",
+                    batch[0]["event_type"], batch[0]["user_id"]
+                )
+                return
+            mid = len(batch) // 2
+            cls._write_rows(batch[:mid])
+            cls._write_rows(batch[mid:])
+        except Exception:
+            logger.exception("Failed to write %d security events", len(batch))
+
+    async def _maintain_partitions(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self._create_partitions)
+            except Exception:
+                logger.exception("Failed to create security_events partitions")
+            await asyncio.sleep(PARTITION_CHECK_SECONDS)
+
+    @staticmethod
+    def _create_partitions() -> None:
+        db = SessionLocal()
+        try:
+            db.execute(
+                text(
+                    "SELECT create_security_events_partition("
+                    "(date_trunc('month', now()) + make_interval(months => m))::date) "
+                    "FROM generate_series(0, :ahead) AS m"
+                ),
+                {"ahead": PARTITION_MONTHS_AHEAD}
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    @staticmethod
+    def _write(batch: List[Dict[str, Any]]) -> None:
+        # executemany on insert() is sent as a single multi-row INSERT
+        db = SessionLocal()
+        try:
+            db.execute(insert(SecurityEvent), batch)
+            db.commit()
+        finally:
+            db.close()
+
+
+# Singleton instance
+security_event_buffer = SecurityEventBuffer()
@@ -1,6 +1,7 @@
 """
 User service for user management operations.
 """
+import asyncio
 from typing import List, Optional
 from uuid import UUID
 
@@ -11,6 +12,7 @@ from app.core.security import hash_password, verify_password
 from app.models.user import User, UserRole, AppRole, SecurityEvent, SecurityEventType
 from app.schemas.user import UserUpdate, PasswordChange
 from app.services.email_service import email_service
+from app.services.security_event_service import security_event_buffer
 
 
 class UserService:
@@ -108,24 +110,22 @@ class UserService:
         if not user.hashed_password:
             raise AuthorizationError("Cannot change password for OAuth-only account")
         
-        if not verify_password(password_data.current_password, user.hashed_password):
+        if not await asyncio.to_thread(
+            verify_password, password_data.current_password, user.hashed_password
+        ):
             raise AuthorizationError("Current password is incorrect")
         
-        # Validate new passwords match
-        if password_data.new_password != password_data.confirm_new_password:
-            raise AuthorizationError("New passwords do not match")
-        
         # Update password
-        user.hashed_password = hash_password(password_data.new_password)
+        user.hashed_password = await asyncio.to_thread(hash_password, password_data.new_password)
         
         # Log security event
-        event = SecurityEvent(
+        security_event_buffer.record(
+            db,
             user_id=user.id,
             event_type=SecurityEventType.PASSWORD_CHANGED,
             ip_address=ip_address,
             user_agent=user_agent
         )
-        db.add(event)
         
         db.commit()
         
@@ -0,0 +1,64 @@
+-- GhostWorker Database Migration: Orders vertical split
+-- Moves rarely-read narrative/blob columns off the hot orders row into a
+-- 1-1 side table so dashboard and list scans read narrower heap pages.
+
+-- ==========================================
+-- ORDERS EXTRA TABLE
+-- ==========================================
+CREATE TABLE IF NOT EXISTS orders_extra (
+    order_id UUID PRIMARY KEY REFERENCES orders(id) ON DELETE CASCADE,
+    
+    -- Line items (JSON array)
+    items TEXT,
+    
+    -- Notes and metadata
+    notes TEXT,
+    internal_notes TEXT,
+    extra_metadata TEXT,
+    
+    -- Raw AI extraction payload
+    ai_raw_data TEXT
+);
+
+-- Backfill from the existing wide rows
+INSERT INTO orders_extra (order_id, items, notes, internal_notes)
+SELECT id, items::text, notes, internal_notes
+FROM orders
+ON CONFLICT (order_id) DO NOTHING;
+
+-- metadata / ai_raw_data only exist on some deployments; move them too
+DO $$
+DECLARE
+    src text;
+    dst text;
+BEGIN
+    FOR src, dst IN
+        SELECT * FROM (VALUES ('metadata', 'extra_metadata'), ('ai_raw_data', 'ai_raw_data')) AS m(src, dst)
+    LOOP
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = 'public'
+              AND table_name = 'orders'
+              AND column_name = src
+        ) THEN
+            EXECUTE format('
+                UPDATE orders_extra e
+                SET %I = o.%I::text
+                FROM orders o
+                WHERE o.id = e.order_id
+                  AND o.%I IS NOT NULL;
+            ', dst, src, src);
+        END IF;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Drop the cold columns from the hot table
+ALTER TABLE orders
+    DROP COLUMN IF EXISTS items,
+    DROP COLUMN IF EXISTS notes,
+    DROP COLUMN IF EXISTS internal_notes,
+    DROP COLUMN IF EXISTS metadata,
+    DROP COLUMN IF EXISTS ai_raw_data;
+
+COMMENT ON TABLE orders_extra IS 'Cold order columns (items, notes, AI payload) split 1-1 from orders';
@@ -0,0 +1,12 @@
+-- GhostWorker Database Migration: Subscription history
+-- Replaces the per-user unique constraint with a partial unique index so
+-- canceled subscriptions can be kept alongside the current active one.
+
+ALTER TABLE subscriptions DROP CONSTRAINT IF EXISTS subscriptions_user_id_key;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_subscriptions_active_user
+    ON subscriptions(user_id)
+    WHERE status = 'active';
+
+CREATE INDEX IF NOT EXISTS idx_subscriptions_user_created
+    ON subscriptions(user_id, created_at);
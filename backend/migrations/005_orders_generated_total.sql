@@ -0,0 +1,36 @@
+-- GhostWorker Database Migration: Generated order total
+-- total is now derived from its components by PostgreSQL so it can never
+-- drift from subtotal/tax/shipping/discount.
+
+-- 001 named the shipping charge "shipping"; the model reads shipping_cost
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public'
+          AND table_name = 'orders'
+          AND column_name = 'shipping'
+    ) AND NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public'
+          AND table_name = 'orders'
+          AND column_name = 'shipping_cost'
+    ) THEN
+        ALTER TABLE orders RENAME COLUMN shipping TO shipping_cost;
+    END IF;
+END $$;
+
+ALTER TABLE orders ADD COLUMN IF NOT EXISTS shipping_cost DECIMAL(10, 2);
+
+ALTER TABLE orders DROP COLUMN IF EXISTS total;
+
+ALTER TABLE orders
+    ADD COLUMN total DECIMAL(10, 2) GENERATED ALWAYS AS (
+        COALESCE(subtotal, 0) + COALESCE(tax, 0)
+        + COALESCE(shipping_cost, 0) - COALESCE(discount, 0)
+    ) STORED NOT NULL;
+
+-- Revenue rollups (confirmed onward) served from the index
+CREATE INDEX IF NOT EXISTS idx_orders_user_revenue
+    ON orders(user_id, total)
+    WHERE status IN ('confirmed', 'processing', 'shipped', 'delivered');
@@ -0,0 +1,40 @@
+-- GhostWorker Database Migration: Auth enum storage
+-- user_roles.role and oauth_accounts.provider become native enums holding
+-- the lowercase values; security_events.event_type becomes a checked
+-- VARCHAR so hot audit reads skip enum coercion.
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'app_role') THEN
+        CREATE TYPE app_role AS ENUM ('admin', 'moderator', 'user');
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'oauth_provider') THEN
+        CREATE TYPE oauth_provider AS ENUM ('google', 'microsoft', 'facebook', 'yahoo');
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+ALTER TABLE user_roles
+    ALTER COLUMN role TYPE app_role USING lower(role::text)::app_role;
+
+ALTER TABLE oauth_accounts
+    ALTER COLUMN provider TYPE oauth_provider USING lower(provider::text)::oauth_provider;
+
+ALTER TABLE security_events
+    ALTER COLUMN event_type TYPE VARCHAR(40) USING lower(event_type::text);
+
+ALTER TABLE security_events DROP CONSTRAINT IF EXISTS ck_security_events_event_type;
+ALTER TABLE security_events ADD CONSTRAINT ck_security_events_event_type CHECK (
+    event_type IN (
+        'login_success', 'login_failed', 'logout', 'password_changed',
+        'password_reset_requested', 'password_reset_completed',
+        'email_verification_sent', 'email_verified', 'oauth_connected',
+        'oauth_disconnected', 'new_device_login', 'new_ip_login',
+        'suspicious_activity', 'account_locked', 'account_unlocked'
+    )
+);
+
+-- Old SQLAlchemy-generated enum types (stored member names)
+DROP TYPE IF EXISTS approle;
+DROP TYPE IF EXISTS oauthprovider;
+DROP TYPE IF EXISTS securityeventtype;
@@ -0,0 +1,8 @@
+-- GhostWorker Database Migration: Auth lookup indexes
+-- user_roles(user_id, role) is already served by unique_user_role.
+
+CREATE INDEX IF NOT EXISTS ix_oauth_user_provider
+    ON oauth_accounts(user_id, provider);
+
+CREATE INDEX IF NOT EXISTS ix_security_events_user_created
+    ON security_events(user_id, created_at DESC);
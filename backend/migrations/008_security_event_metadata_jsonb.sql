@@ -0,0 +1,5 @@
+-- GhostWorker Database Migration: Security event metadata as JSONB
+-- The column keeps its name; only the ORM attribute is renamed (event_metadata).
+
+ALTER TABLE security_events
+    ALTER COLUMN metadata TYPE JSONB USING metadata::jsonb;
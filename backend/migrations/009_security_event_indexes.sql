@@ -0,0 +1,8 @@
+-- GhostWorker Database Migration: Security event metadata and failed-login indexes
+
+CREATE INDEX IF NOT EXISTS ix_security_events_metadata_gin
+    ON security_events USING GIN (metadata);
+
+CREATE INDEX IF NOT EXISTS ix_sec_events_failed_login
+    ON security_events(user_id, created_at)
+    WHERE event_type = 'login_failed';
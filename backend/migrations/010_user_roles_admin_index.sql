@@ -0,0 +1,6 @@
+-- GhostWorker Database Migration: Admin role lookup index
+-- Backs the EXISTS subquery emitted by User.is_admin in SQL filters.
+
+CREATE INDEX IF NOT EXISTS ix_user_roles_admin
+    ON user_roles(user_id)
+    WHERE role = 'admin';
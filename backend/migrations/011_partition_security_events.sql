@@ -0,0 +1,75 @@
+-- GhostWorker Database Migration: Partition security_events by month
+-- Range partitions on created_at keep recent-window audit queries and
+-- autovacuum bounded; old months can be detached and archived.
+
+BEGIN;
+
+ALTER TABLE security_events RENAME TO security_events_legacy;
+ALTER INDEX IF EXISTS security_events_pkey RENAME TO security_events_legacy_pkey;
+
+CREATE TABLE security_events (
+    LIKE security_events_legacy INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+    PRIMARY KEY (id, created_at),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+) PARTITION BY RANGE (created_at);
+
+-- ==========================================
+-- PARTITION MANAGEMENT
+-- ==========================================
+CREATE OR REPLACE FUNCTION create_security_events_partition(month_start DATE)
+RETURNS void AS $$
+DECLARE
+    start_date DATE := date_trunc('month', month_start)::date;
+    partition_name TEXT := 'security_events_' || to_char(start_date, 'YYYY_MM');
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF security_events FOR VALUES FROM (%L) TO (%L)',
+        partition_name,
+        start_date,
+        (start_date + INTERVAL '1 month')::date
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION create_security_events_partition(DATE) IS
+    'Create the monthly security_events partition containing the given date; schedule monthly (e.g. pg_cron) to stay ahead.';
+
+-- Every month with existing data, through two months ahead
+DO $$
+DECLARE
+    month DATE;
+BEGIN
+    FOR month IN
+        SELECT generate_series(
+            date_trunc('month', COALESCE(MIN(created_at), now()))::date,
+            date_trunc('month', now() + INTERVAL '2 months')::date,
+            INTERVAL '1 month'
+        )::date
+        FROM security_events_legacy
+    LOOP
+        PERFORM create_security_events_partition(month);
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Catches rows if a future partition was not created in time
+CREATE TABLE IF NOT EXISTS security_events_default PARTITION OF security_events DEFAULT;
+
+INSERT INTO security_events SELECT * FROM security_events_legacy;
+
+DROP TABLE security_events_legacy;
+
+-- ==========================================
+-- INDEXES (created on every partition)
+-- ==========================================
+CREATE INDEX IF NOT EXISTS ix_security_events_user_created
+    ON security_events(user_id, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS ix_security_events_metadata_gin
+    ON security_events USING GIN (metadata);
+
+CREATE INDEX IF NOT EXISTS ix_sec_events_failed_login
+    ON security_events(user_id, created_at)
+    WHERE event_type = 'login_failed';
+
+COMMIT;
@@ -0,0 +1,44 @@
+-- GhostWorker Database Migration: Email preference bitmask
+-- The per-toggle boolean columns collapse into one BIGINT; bit positions
+-- follow app.models.notification.EmailPref.
+
+ALTER TABLE email_notification_preferences
+    ADD COLUMN IF NOT EXISTS flags BIGINT NOT NULL DEFAULT 30719;
+
+UPDATE email_notification_preferences SET flags =
+      (CASE WHEN security_alerts       THEN 1 << 0  ELSE 0 END)
+    | (CASE WHEN new_login_alerts      THEN 1 << 1  ELSE 0 END)
+    | (CASE WHEN password_changes      THEN 1 << 2  ELSE 0 END)
+    | (CASE WHEN payment_receipts      THEN 1 << 3  ELSE 0 END)
+    | (CASE WHEN payment_failures      THEN 1 << 4  ELSE 0 END)
+    | (CASE WHEN subscription_changes  THEN 1 << 5  ELSE 0 END)
+    | (CASE WHEN usage_alerts          THEN 1 << 6  ELSE 0 END)
+    | (CASE WHEN team_invites          THEN 1 << 7  ELSE 0 END)
+    | (CASE WHEN team_member_joined    THEN 1 << 8  ELSE 0 END)
+    | (CASE WHEN role_changes          THEN 1 << 9  ELSE 0 END)
+    | (CASE WHEN new_messages          THEN 1 << 10 ELSE 0 END)
+    | (CASE WHEN message_digest        THEN 1 << 11 ELSE 0 END)
+    | (CASE WHEN integration_errors    THEN 1 << 12 ELSE 0 END)
+    | (CASE WHEN integration_connected THEN 1 << 13 ELSE 0 END)
+    | (CASE WHEN product_updates       THEN 1 << 14 ELSE 0 END)
+    | (CASE WHEN tips_and_tutorials    THEN 1 << 15 ELSE 0 END)
+    | (CASE WHEN promotional_emails    THEN 1 << 16 ELSE 0 END);
+
+ALTER TABLE email_notification_preferences
+    DROP COLUMN IF EXISTS security_alerts,
+    DROP COLUMN IF EXISTS new_login_alerts,
+    DROP COLUMN IF EXISTS password_changes,
+    DROP COLUMN IF EXISTS payment_receipts,
+    DROP COLUMN IF EXISTS payment_failures,
+    DROP COLUMN IF EXISTS subscription_changes,
+    DROP COLUMN IF EXISTS usage_alerts,
+    DROP COLUMN IF EXISTS team_invites,
+    DROP COLUMN IF EXISTS team_member_joined,
+    DROP COLUMN IF EXISTS role_changes,
+    DROP COLUMN IF EXISTS new_messages,
+    DROP COLUMN IF EXISTS message_digest,
+    DROP COLUMN IF EXISTS integration_errors,
+    DROP COLUMN IF EXISTS integration_connected,
+    DROP COLUMN IF EXISTS product_updates,
+    DROP COLUMN IF EXISTS tips_and_tutorials,
+    DROP COLUMN IF EXISTS promotional_emails;
@@ -0,0 +1,44 @@
+-- GhostWorker Database Migration: AI confidence as SMALLINT percentage
+-- ai_confidence is a 0-100 score everywhere; out-of-range values are clamped.
+-- messages.ai_confidence started life as DECIMAL(3, 2) on a 0-1 scale and
+-- is rescaled to a percentage on the way through.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'messages'
+          AND column_name = 'ai_confidence'
+          AND data_type = 'numeric'
+    ) THEN
+        ALTER TABLE messages
+            ALTER COLUMN ai_confidence TYPE SMALLINT
+            USING LEAST(GREATEST(ROUND(ai_confidence * 100), 0), 100)::SMALLINT;
+    END IF;
+END $$;
+
+-- conversations/orders carry the score in the models but not in 001;
+-- create it where missing, and narrow any wider integer column in place
+ALTER TABLE conversations ADD COLUMN IF NOT EXISTS ai_confidence SMALLINT;
+ALTER TABLE orders ADD COLUMN IF NOT EXISTS ai_confidence SMALLINT;
+
+DO $$
+DECLARE
+    t text;
+BEGIN
+    FOR t IN
+        SELECT table_name
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+          AND table_name IN ('messages', 'conversations', 'orders')
+          AND column_name = 'ai_confidence'
+          AND data_type IN ('integer', 'bigint')
+    LOOP
+        EXECUTE format('
+            ALTER TABLE %I
+                ALTER COLUMN ai_confidence TYPE SMALLINT
+                USING LEAST(GREATEST(ai_confidence, 0), 100)::SMALLINT;
+        ', t);
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,20 @@
+-- GhostWorker Database Migration: Advanced feature list indexes
+-- Composite indexes matching the filter + ORDER BY of the advanced list
+-- endpoints. customer_profiles.tags already has a GIN index (002).
+
+CREATE INDEX IF NOT EXISTS ix_canned_responses_user_usage
+    ON canned_responses(user_id, usage_count DESC)
+    WHERE is_active;
+
+CREATE INDEX IF NOT EXISTS ix_customer_profiles_user_last_seen
+    ON customer_profiles(user_id, last_seen DESC);
+
+CREATE INDEX IF NOT EXISTS ix_customer_profiles_segments_gin
+    ON customer_profiles USING GIN (segments);
+
+CREATE INDEX IF NOT EXISTS ix_sentiment_analysis_user_analyzed
+    ON sentiment_analysis(user_id, analyzed_at)
+    INCLUDE (sentiment, score);
+
+CREATE INDEX IF NOT EXISTS ix_predictive_analytics_user_type_value
+    ON predictive_analytics(user_id, prediction_type, prediction_value DESC);
@@ -0,0 +1,21 @@
+-- GhostWorker Database Migration: Trigram search indexes
+-- Canned response and customer profile search use ILIKE '%term%'; GIN
+-- trigram indexes let those predicates use an index without changing
+-- the substring-match semantics.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_canned_responses_title_trgm
+    ON canned_responses USING GIN (title gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_canned_responses_content_trgm
+    ON canned_responses USING GIN (content gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_canned_responses_shortcut_trgm
+    ON canned_responses USING GIN (shortcut gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_customer_profiles_name_trgm
+    ON customer_profiles USING GIN (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_customer_profiles_email_trgm
+    ON customer_profiles USING GIN (email gin_trgm_ops);
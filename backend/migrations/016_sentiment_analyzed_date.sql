@@ -0,0 +1,14 @@
+-- GhostWorker Database Migration: Stored sentiment analysis day
+-- The dashboard trend groups by calendar day; store it as a generated column
+-- (UTC, since a timestamptz::date cast is not immutable) instead of casting
+-- every row, and carry it in the covering window index.
+
+ALTER TABLE sentiment_analysis
+    ADD COLUMN IF NOT EXISTS analyzed_date DATE
+    GENERATED ALWAYS AS ((analyzed_at AT TIME ZONE 'UTC')::date) STORED;
+
+DROP INDEX IF EXISTS ix_sentiment_analysis_user_analyzed;
+
+CREATE INDEX IF NOT EXISTS ix_sentiment_analysis_user_analyzed
+    ON sentiment_analysis(user_id, analyzed_at)
+    INCLUDE (analyzed_date, sentiment, score);
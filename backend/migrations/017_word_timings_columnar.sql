@@ -0,0 +1,14 @@
+-- GhostWorker Database Migration: Column-wise word timings
+-- Whisper word timings move from one object per word
+--   [{"word": "hi", "start": 0.0, "end": 0.2}, ...]
+-- to one array per field
+--   {"word": ["hi", ...], "start": [0.0, ...], "end": [0.2, ...]}
+-- so long transcripts don't repeat the keys for every word.
+
+UPDATE voice_transcriptions
+SET word_timings = jsonb_build_object(
+    'word',  COALESCE((SELECT jsonb_agg(w->'word'  ORDER BY i) FROM jsonb_array_elements(word_timings) WITH ORDINALITY AS t(w, i)), '[]'::jsonb),
+    'start', COALESCE((SELECT jsonb_agg(w->'start' ORDER BY i) FROM jsonb_array_elements(word_timings) WITH ORDINALITY AS t(w, i)), '[]'::jsonb),
+    'end',   COALESCE((SELECT jsonb_agg(w->'end'   ORDER BY i) FROM jsonb_array_elements(word_timings) WITH ORDINALITY AS t(w, i)), '[]'::jsonb)
+)
+WHERE jsonb_typeof(word_timings) = 'array';
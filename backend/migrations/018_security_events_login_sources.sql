@@ -0,0 +1,16 @@
+-- GhostWorker Database Migration: Covering index for known login sources
+-- New-device detection reads only the IPs and device fingerprints of recent
+-- successful logins. Older login events kept the fingerprint only in
+-- metadata; copy it into the column so the lookup can be an index-only scan.
+-- (CONCURRENTLY is not supported on partitioned tables.)
+
+UPDATE security_events
+SET device_fingerprint = metadata->>'device_fingerprint'
+WHERE event_type = 'login_success'
+  AND device_fingerprint IS NULL
+  AND metadata->>'device_fingerprint' IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS ix_sec_events_login_sources
+    ON security_events(user_id, created_at)
+    INCLUDE (ip_address, device_fingerprint)
+    WHERE event_type = 'login_success';
@@ -0,0 +1,55 @@
+-- GhostWorker Database Migration: security_events partition upkeep
+-- Partitions are kept two months ahead by the API's security event writer
+-- (SecurityEventBuffer), which calls create_security_events_partition daily.
+-- Rows that reached the DEFAULT partition before their month existed are
+-- moved into it on creation; attaching over them would otherwise fail.
+
+CREATE OR REPLACE FUNCTION create_security_events_partition(month_start DATE)
+RETURNS void AS $$
+DECLARE
+    start_date DATE := date_trunc('month', month_start)::date;
+    end_date DATE := (date_trunc('month', month_start) + INTERVAL '1 month')::date;
+    partition_name TEXT := 'security_events_' || to_char(start_date, 'YYYY_MM');
+BEGIN
+    -- Every API worker runs the upkeep; let one of them do it at a time
+    PERFORM pg_advisory_xact_lock(hashtext('create_security_events_partition'));
+    
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN;
+    END IF;
+    
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE security_events INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        partition_name
+    );
+    
+    EXECUTE format(
+        'WITH moved AS (
+            DELETE FROM security_events_default
+            WHERE created_at >= %L AND created_at < %L
+            RETURNING *
+        )
+        INSERT INTO %I SELECT * FROM moved',
+        start_date, end_date, partition_name
+    );
+    
+    EXECUTE format(
+        'ALTER TABLE security_events ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name, start_date, end_date
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION create_security_events_partition(DATE) IS
+    'Create (or rescue from DEFAULT) the monthly security_events partition containing the given date; run daily by the API.';
+
+-- Catch up: months already sitting in DEFAULT, then two months ahead
+SELECT create_security_events_partition(month)
+FROM (
+    SELECT DISTINCT date_trunc('month', created_at)::date AS month
+    FROM security_events_default
+    UNION
+    SELECT (date_trunc('month', now()) + make_interval(months => m))::date
+    FROM generate_series(0, 2) AS m
+) AS months
+ORDER BY month;